@@ -0,0 +1,150 @@
+import time
+import torch
+import sys
+
+sys.path.append("src")
+from pathlib import Path
+from scene.scene_factory import GripperSceneFactory
+from mesh.mesh_properties import MeshProperties
+from simulation.simulation import Simulation
+from point.transform import Transform, get_quaternion
+from simulation.simulation_properties import SimulationProperties
+from config.config import Config
+from utils.validation import set_validation_level
+import argparse
+from warp_wrapper.contact_properties import ContactProperties
+from cable.pull_ratio import TimeInvariablePullRatio
+from simulation.update_scene import UpdateScene
+from objective.loss import MaxGripLoss
+from rendering.rendering import InteriorGapRendering
+from rendering.resolution import CoarseToFineResolution
+from rendering.views import SixInteriorViews
+from rendering.z_buffer import ZBuffer
+
+
+def main(args):
+    """Prints the render time of the max grip loss at every image size and how far its loss is from the loss at the
+    largest image size."""
+    config = Config.from_yaml(args.config)
+    set_validation_level(config.validation_level)
+    DEVICE = config.device
+
+    # robot
+    msh_file = Path(config.msh_file)
+    scad_file = Path(config.scad_file)
+    scad_parameters = Path(config.scad_parameters)
+    ideal_edge_length = config.ideal_edge_length
+    robot_properties = MeshProperties(
+        name="robot",
+        density=config.robot_density,
+        youngs_modulus=config.robot_youngs_modulus,
+        poissons_ratio=config.robot_poissons_ratio,
+        damping_factor=config.robot_damping_factor,
+        frozen_bounding_box=config.robot_frozen_bounding_box,
+    )
+    robot_transform = Transform(
+        translation=config.robot_translation,
+        rotation=get_quaternion(
+            vector=config.robot_rotation_vector,
+            angle_in_degrees=config.robot_rotation_degrees,
+        ),
+        scale=config.robot_scale,
+        device=DEVICE,
+    )
+    sim_properties = SimulationProperties(
+        duration=config.sim_duration,
+        segment_duration=config.sim_segment_duration,
+        dt=config.sim_dt,
+        device=DEVICE,
+    )
+    cable_pull_ratio = [
+        TimeInvariablePullRatio(
+            pull_ratio=torch.tensor(pull, device=DEVICE),
+            simulation_properties=sim_properties,
+            device=DEVICE,
+        )
+        for pull in config.cable_pull_ratio
+    ]
+
+    cable_stiffness, cable_damping = config.cable_stiffness, config.cable_damping
+
+    # object
+    object_file = Path(config.object_file)
+    object_properties = MeshProperties(name="object", density=config.object_density)
+    object_transform = Transform(
+        translation=config.object_translation,
+        rotation=get_quaternion(
+            vector=config.object_rotation_vector,
+            angle_in_degrees=config.object_rotation_degrees,
+        ),
+        scale=config.object_scale,
+        device=DEVICE,
+    )
+
+    contact_properties = ContactProperties(
+        distance=config.contact_distance,
+        ke=config.contact_ke,
+        kd=config.contact_kd,
+        kf=config.contact_kf,
+        ground=config.ground,
+    )
+
+    scene = GripperSceneFactory(
+        msh_file=msh_file,
+        scad_file=scad_file,
+        scad_parameters=scad_parameters,
+        ideal_edge_length=ideal_edge_length,
+        robot_properties=robot_properties,
+        robot_transform=robot_transform,
+        cable_pull_ratio=cable_pull_ratio,
+        cable_stiffness=cable_stiffness,
+        cable_damping=cable_damping,
+        object_file=object_file,
+        object_properties=object_properties,
+        object_transform=object_transform,
+        contact_properties=contact_properties,
+        device=DEVICE,
+        make_new_robot=False,
+        num_envs=config.num_envs,
+        envs_youngs_modulus=config.envs_youngs_modulus,
+    ).create()
+
+    simulation = Simulation(scene=scene, properties=sim_properties)
+    UpdateScene(scene=scene, simulation=simulation).update_scene()
+
+    image_sizes = sorted(args.image_sizes)
+    views = SixInteriorViews(center=scene.object.nodes.position.mean(dim=0), device=DEVICE)
+    robot_zbuf = ZBuffer(mesh=scene.robot, views=views, device=DEVICE, bin_size=args.bin_size)
+    other_zbuf = ZBuffer(mesh=scene.object, views=views, device=DEVICE, bin_size=args.bin_size)
+    resolution = CoarseToFineResolution(image_sizes=image_sizes, num_iterations=[1] * len(image_sizes))
+    loss = MaxGripLoss(InteriorGapRendering(robot_zbuf=robot_zbuf, other_zbuf=other_zbuf), DEVICE, resolution)
+    losses, times = [], []
+    with torch.no_grad():
+        for i in range(len(image_sizes)):
+            loss.set_iteration(i)
+            losses.append(loss.get_loss().item())  # also warms up
+            _synchronize(DEVICE)
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                loss.get_loss()
+            _synchronize(DEVICE)
+            times.append((time.perf_counter() - start) / args.repeats)
+    print(f"{'image size':>10} {'time [ms]':>10} {'loss':>12} {'rel. error':>10}")
+    for image_size, duration, value in zip(image_sizes, times, losses):
+        error = abs(value - losses[-1]) / max(abs(losses[-1]), 1e-12)
+        print(f"{image_size:>10} {1000 * duration:>10.2f} {value:>12.5g} {error:>10.2%}")
+
+
+def _synchronize(device: str):
+    if str(device).startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--config", type=str, help="path like with yaml format")
+    parser.add_argument("-s", "--image_sizes", type=int, nargs="+", default=[125, 250, 500, 1000])
+    parser.add_argument("-b", "--bin_size", type=int, default=None, help="0 for naive rasterization")
+    parser.add_argument("-r", "--repeats", type=int, default=10)
+    args = parser.parse_args()
+    main(args)
@@ -9,6 +9,7 @@ from simulation.simulation import Simulation
 from point.transform import Transform, get_quaternion
 from simulation.simulation_properties import SimulationProperties
 from config.config import Config
+from utils.validation import set_validation_level
 import argparse
 from utils.path import get_next_numbered_path
 from warp_wrapper.contact_properties import ContactProperties
@@ -22,6 +23,7 @@ from scene.scene_observer import SceneImages
 
 def main(args):
     config = Config.from_yaml(args.config)
+    set_validation_level(config.validation_level)
     DEVICE = config.device
     PATH = get_next_numbered_path(args.path)
     config.to_yaml(path=PATH)
@@ -102,14 +104,21 @@ def main(args):
         contact_properties=contact_properties,
         device=DEVICE,
         make_new_robot=False,
+        num_envs=config.num_envs,
+        envs_youngs_modulus=config.envs_youngs_modulus,
     ).create()
 
     simulation = Simulation(scene=scene, properties=sim_properties)
+    zbuf_settings = dict(
+        image_size=config.render_image_size,
+        bin_size=config.render_bin_size,
+        faces_per_pixel=config.render_faces_per_pixel,
+    )
     views = SixInteriorViews(center=scene.object.nodes.position.mean(dim=0), device=DEVICE)
-    robot_zbuf = ZBuffer(mesh=scene.robot, views=views, device=DEVICE)
-    other_zbuf = ZBuffer(mesh=scene.object, views=views, device=DEVICE)
+    robot_zbuf = ZBuffer(mesh=scene.robot, views=views, device=DEVICE, **zbuf_settings)
+    other_zbuf = ZBuffer(mesh=scene.object, views=views, device=DEVICE, static=True, **zbuf_settings)
     contact_images = SceneImages(
-        InteriorContactRendering(robot_zbuf=robot_zbuf, other_zbuf=other_zbuf),
+        InteriorContactRendering(robot_zbuf=robot_zbuf, other_zbuf=other_zbuf, use_roi=config.render_use_roi),
         path=PATH,
         prefix="contact",
     )
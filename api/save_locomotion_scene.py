@@ -9,6 +9,7 @@ from point.transform import Transform, get_quaternion
 from simulation.simulation_properties import SimulationProperties
 from scene.scene_observer import SceneViewer
 from config.config import Config
+from utils.validation import set_validation_level
 import argparse
 from utils.path import get_next_numbered_path
 from warp_wrapper.contact_properties import ContactProperties
@@ -19,6 +20,7 @@ from simulation.update_scene import UpdateScene
 
 def main(args):
     config = Config.from_yaml(args.config)
+    set_validation_level(config.validation_level)
     DEVICE = config.device
     PATH = get_next_numbered_path(args.path)
     config.to_yaml(path=PATH)
@@ -78,10 +80,20 @@ def main(args):
         contact_properties=contact_properties,
         device=DEVICE,
         make_new_robot=False,
+        num_envs=config.num_envs,
+        envs_youngs_modulus=config.envs_youngs_modulus,
     ).create()
 
     viewer = SceneViewer(scene=scene, simulation_properties=sim_properties, path=PATH)
-    simulation = Simulation(scene=scene, properties=sim_properties, use_checkpoint=config.use_checkpoint)
+    simulation = Simulation(
+        scene=scene,
+        properties=sim_properties,
+        use_checkpoint=config.use_checkpoint,
+        backend=config.sim_backend,
+        use_graph=config.sim_use_graph,
+        memory_budget=config.sim_memory_budget,
+        use_adjoint=config.sim_use_adjoint,
+    )
     scene.add_observer(viewer)
     UpdateScene(scene=scene, simulation=simulation).update_scene()
     print(scene.robot.nodes.position.mean(dim=0))
@@ -0,0 +1,88 @@
+import sys
+
+sys.path.append("src")
+
+from mesh.mesh_factory import MeshFactoryFromScad
+from mesh.scad import Scad
+from mesh.scad_sweep import ScadSweepFactory
+from cable.holes_initial_position import CaterpillarHolesInitialPosition, StarfishHolesInitialPosition
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import traceback
+import argparse
+import os
+import shutil
+import json
+import tqdm
+
+
+HOLES_INITIAL_POSITION = {"caterpillar": CaterpillarHolesInitialPosition, "starfish": StarfishHolesInitialPosition}
+
+
+def create_design(scad: Scad, edge_length: float, holes: str) -> None:
+    """Meshes <scad> and saves its mesh.msh next to its parameters, with its holes.json unless <holes> is "none"."""
+    if holes != "none" and holes not in HOLES_INITIAL_POSITION:
+        raise ValueError(f"Expected holes to be one of {[*HOLES_INITIAL_POSITION, 'none']}, got {holes}")
+    directory = Path(scad.parameters).parent
+    msh_file = MeshFactoryFromScad(scad=scad, ideal_edge_length=edge_length, device="cpu").get_msh_file()
+    shutil.copyfile(msh_file, directory / "mesh.msh")
+    if holes == "none":
+        return
+    holes_position = [hole.tolist() for hole in HOLES_INITIAL_POSITION[holes](scad).get()]
+    with open(directory / "holes.json", "w") as f:
+        json.dump(holes_position, f)
+
+
+def main(args):
+    sweep = {}
+    if args.sweep is not None:
+        with open(args.sweep, "r") as f:
+            sweep = json.load(f)
+    scads = ScadSweepFactory(args.scad_file, args.scad_params, sweep, args.out).create()
+    failures = {}
+    with ProcessPoolExecutor(max_workers=args.num_workers) as executor:
+        futures = {executor.submit(create_design, scad, args.edge_length, args.holes): scad for scad in scads}
+        for future in tqdm.tqdm(as_completed(futures), "Meshing", total=len(futures), colour="green"):
+            try:
+                future.result()
+            except Exception:
+                failures[str(futures[future].parameters)] = traceback.format_exc()
+    for parameters, error in failures.items():
+        print(f"Failed to mesh {parameters}\n{error}")
+    print(f"Meshed {len(scads) - len(failures)} of {len(scads)} designs into {args.out}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scad_file", type=str, default="data/caterpillar.scad", help="path like to .scad")
+    parser.add_argument(
+        "--scad_params",
+        type=str,
+        nargs="+",
+        default=["data/caterpillar_scad_params.json"],
+        help="path likes to .json, each swept separately",
+    )
+    parser.add_argument(
+        "--sweep", type=str, default=None, help="path like to .json mapping parameter names to the values to try"
+    )
+    parser.add_argument(
+        "--holes",
+        type=str,
+        required=True,
+        choices=[*HOLES_INITIAL_POSITION, "none"],
+        help="design whose holes.json to save next to each mesh, or none to only save the mesh",
+    )
+    parser.add_argument("--edge_length", type=float, default=0.02)
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 1) // 4),
+        help="number of processes, a quarter of the cores by default since every fTetWild run is multithreaded",
+    )
+    parser.add_argument(
+        "--out", type=str, required=True, help="path like to the directory where to save one directory per design"
+    )
+    args = parser.parse_args()
+    main(args)
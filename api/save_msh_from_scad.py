@@ -4,14 +4,14 @@ sys.path.append("src")
 
 from mesh.mesh_factory import MeshFactoryFromScad
 from mesh.scad import Scad
-import os
+import shutil
 import argparse
 
 
 def main(args):
     scad = Scad(file=args.scad_file, parameters=args.scad_params)
-    MeshFactoryFromScad(scad=scad, ideal_edge_length=args.edge_length).create()
-    os.rename(".tmp/mesh.msh", args.out)
+    msh_file = MeshFactoryFromScad(scad=scad, ideal_edge_length=args.edge_length).get_msh_file()
+    shutil.copyfile(msh_file, args.out)
 
 
 if __name__ == "__main__":
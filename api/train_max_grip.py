@@ -16,15 +16,18 @@ from simulation.simulation_properties import SimulationProperties
 from objective.log import Log
 from warp_wrapper.contact_properties import ContactProperties
 from config.config import Config
+from utils.validation import set_validation_level
 import argparse
 from utils.path import get_next_numbered_path
 from rendering.z_buffer import ZBuffer
+from rendering.resolution import CoarseToFineResolution
 from cable.pull_ratio import TimeInvariablePullRatio
 from simulation.update_scene import UpdateScene
 
 
 def main(args):
     config = Config.from_yaml(args.config)
+    set_validation_level(config.validation_level)
     DEVICE = config.device
     PATH = get_next_numbered_path(config.out_path)
     config.to_yaml(path=PATH)
@@ -99,6 +102,8 @@ def main(args):
         contact_properties=contact_properties,
         device=DEVICE,
         make_new_robot=False,
+        num_envs=config.num_envs,
+        envs_youngs_modulus=config.envs_youngs_modulus,
     ).create()
 
     variables = Variables()
@@ -106,12 +111,30 @@ def main(args):
         for opt in cable.pull_ratio.optimizable:
             variables.add_parameter(opt)
 
-    simulation = Simulation(scene=scene, properties=sim_properties, use_checkpoint=config.use_checkpoint)
+    simulation = Simulation(
+        scene=scene,
+        properties=sim_properties,
+        use_checkpoint=config.use_checkpoint,
+        backend=config.sim_backend,
+        use_graph=config.sim_use_graph,
+        memory_budget=config.sim_memory_budget,
+        use_adjoint=config.sim_use_adjoint,
+    )
+    zbuf_settings = dict(
+        image_size=config.render_image_size,
+        bin_size=config.render_bin_size,
+        faces_per_pixel=config.render_faces_per_pixel,
+    )
+    resolution = None
+    if config.render_coarse_to_fine_sizes is not None:
+        resolution = CoarseToFineResolution(
+            image_sizes=config.render_coarse_to_fine_sizes, num_iterations=config.render_coarse_to_fine_iterations
+        )
     views = SixInteriorViews(center=scene.object.nodes.position.mean(dim=0), device=DEVICE)
-    robot_zbuf = ZBuffer(mesh=scene.robot, views=views, device=DEVICE)
-    other_zbuf = ZBuffer(mesh=scene.object, views=views, device=DEVICE)
-    rendering = InteriorGapRendering(robot_zbuf=robot_zbuf, other_zbuf=other_zbuf)
-    loss = MaxGripLoss(rendering=rendering, device=DEVICE)
+    robot_zbuf = ZBuffer(mesh=scene.robot, views=views, device=DEVICE, **zbuf_settings)
+    other_zbuf = ZBuffer(mesh=scene.object, views=views, device=DEVICE, static=True, **zbuf_settings)
+    rendering = InteriorGapRendering(robot_zbuf=robot_zbuf, other_zbuf=other_zbuf, use_roi=config.render_use_roi)
+    loss = MaxGripLoss(rendering=rendering, device=DEVICE, resolution=resolution)
     optimizer = GradientDescent(loss, variables, learning_rate=config.learning_rate)
     log = Log(loss=loss, variables=variables, path=PATH)
     update_scene = UpdateScene(scene=scene, simulation=simulation)
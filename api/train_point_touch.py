@@ -3,12 +3,13 @@ import sys
 sys.path.append("src")
 from pathlib import Path
 from scene.scene_factory import TouchSceneFactory
+from scene.scene import TouchScene
 from mesh.mesh_properties import MeshProperties
 from simulation.simulation import Simulation
 from point.transform import Transform, get_quaternion
 from rendering.views import SixInteriorViews
 from rendering.rendering import InteriorGapRendering, InteriorDistanceRendering
-from objective.loss import ObstacleAvoidanceLoss, PointTouchWithObstacleAvoidanceLoss
+from objective.loss import ObstacleAvoidanceLoss, ObstacleSignedDistanceLoss, PointTouchWithObstacleAvoidanceLoss
 from objective.optimizer import GradientDescent
 from objective.train import Train
 from objective.variables import Variables
@@ -16,15 +17,19 @@ from simulation.simulation_properties import SimulationProperties
 from objective.log import Log
 from warp_wrapper.contact_properties import ContactProperties
 from config.config import Config
+from utils.validation import set_validation_level
 import argparse
 from utils.path import get_next_numbered_path
 from rendering.z_buffer import ZBuffer
+from rendering.resolution import CoarseToFineResolution
+from warp_wrapper.signed_distance import SignedDistanceGridFactory
 from cable.pull_ratio import TimeInvariablePullRatio
 from simulation.update_scene import UpdateScene
 
 
 def main(args):
     config = Config.from_yaml(args.config)
+    set_validation_level(config.validation_level)
     DEVICE = config.device
     PATH = get_next_numbered_path(config.out_path)
     config.to_yaml(path=PATH)
@@ -124,6 +129,8 @@ def main(args):
         contact_properties=contact_properties,
         device=DEVICE,
         make_new_robot=False,
+        num_envs=config.num_envs,
+        envs_youngs_modulus=config.envs_youngs_modulus,
     ).create()
 
     variables = Variables()
@@ -131,20 +138,29 @@ def main(args):
         for opt in cable.pull_ratio.optimizable:
             variables.add_parameter(opt)
 
-    simulation = Simulation(scene=scene, properties=sim_properties, use_checkpoint=config.use_checkpoint)
+    simulation = Simulation(
+        scene=scene,
+        properties=sim_properties,
+        use_checkpoint=config.use_checkpoint,
+        backend=config.sim_backend,
+        use_graph=config.sim_use_graph,
+        memory_budget=config.sim_memory_budget,
+        use_adjoint=config.sim_use_adjoint,
+    )
     # point touch with obstacle avoidance loss
-    views_obstacle_0 = SixInteriorViews(center=scene.obstacles[0].nodes.position.mean(dim=0), device=DEVICE)
-    views_obstacle_1 = SixInteriorViews(center=scene.obstacles[1].nodes.position.mean(dim=0), device=DEVICE)
-    robot_zbuf_0 = ZBuffer(mesh=scene.robot, views=views_obstacle_0, device=DEVICE)
-    robot_zbuf_1 = ZBuffer(mesh=scene.robot, views=views_obstacle_1, device=DEVICE)
-    robot_zbufs = [robot_zbuf_0, robot_zbuf_1]
-    obstacle_zbuf_0 = ZBuffer(mesh=scene.obstacles[0], views=views_obstacle_0, device=DEVICE)
-    obstacle_zbuf_1 = ZBuffer(mesh=scene.obstacles[1], views=views_obstacle_1, device=DEVICE)
-    obstacle_zbufs = [obstacle_zbuf_0, obstacle_zbuf_1]
-    renderings = [
-        InteriorGapRendering(robot_zbuf=rz, other_zbuf=oz) for rz, oz in zip(robot_zbufs, obstacle_zbufs)
-    ]  # Consider using InteriorDistanceRendering
-    obs_loss = [ObstacleAvoidanceLoss(rendering=r, device=DEVICE) for r in renderings]
+    if config.obstacle_loss == "sdf":
+        obs_loss = [
+            ObstacleSignedDistanceLoss(
+                scene=scene,
+                signed_distance=SignedDistanceGridFactory(
+                    obstacle, resolution=config.obstacle_sdf_resolution, device=DEVICE
+                ).create(),
+                device=DEVICE,
+            )
+            for obstacle in scene.obstacles
+        ]
+    else:
+        obs_loss = _get_rendering_obstacle_losses(config, scene, DEVICE)
     for ol in obs_loss:
         scene.add_observer(ol)
     loss = PointTouchWithObstacleAvoidanceLoss(scene=scene, obstacle_avoidance_losses=obs_loss)
@@ -154,6 +170,36 @@ def main(args):
     Train(scene, update_scene, loss, optimizer, num_iters=config.num_training_iterations, log=log).run(verbose=True)
 
 
+def _get_rendering_obstacle_losses(config: Config, scene: TouchScene, DEVICE: str):
+    zbuf_settings = dict(
+        image_size=config.render_image_size,
+        bin_size=config.render_bin_size,
+        faces_per_pixel=config.render_faces_per_pixel,
+    )
+    resolution = None
+    if config.render_coarse_to_fine_sizes is not None:
+        resolution = CoarseToFineResolution(
+            image_sizes=config.render_coarse_to_fine_sizes, num_iterations=config.render_coarse_to_fine_iterations
+        )
+    views_obstacle_0 = SixInteriorViews(center=scene.obstacles[0].nodes.position.mean(dim=0), device=DEVICE)
+    views_obstacle_1 = SixInteriorViews(center=scene.obstacles[1].nodes.position.mean(dim=0), device=DEVICE)
+    robot_zbuf_0 = ZBuffer(mesh=scene.robot, views=views_obstacle_0, device=DEVICE, **zbuf_settings)
+    robot_zbuf_1 = ZBuffer(mesh=scene.robot, views=views_obstacle_1, device=DEVICE, **zbuf_settings)
+    robot_zbufs = [robot_zbuf_0, robot_zbuf_1]
+    obstacle_zbuf_0 = ZBuffer(
+        mesh=scene.obstacles[0], views=views_obstacle_0, device=DEVICE, static=True, **zbuf_settings
+    )
+    obstacle_zbuf_1 = ZBuffer(
+        mesh=scene.obstacles[1], views=views_obstacle_1, device=DEVICE, static=True, **zbuf_settings
+    )
+    obstacle_zbufs = [obstacle_zbuf_0, obstacle_zbuf_1]
+    renderings = [
+        InteriorGapRendering(robot_zbuf=rz, other_zbuf=oz, use_roi=config.render_use_roi)
+        for rz, oz in zip(robot_zbufs, obstacle_zbufs)
+    ]  # Consider using InteriorDistanceRendering
+    return [ObstacleAvoidanceLoss(rendering=r, device=DEVICE, resolution=resolution) for r in renderings]
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-c", "--config", type=str, help="path like with yaml format")
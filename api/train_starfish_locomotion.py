@@ -9,6 +9,7 @@ from simulation.simulation import Simulation
 from point.transform import Transform, get_quaternion
 from simulation.simulation_properties import SimulationProperties
 from config.config import Config
+from utils.validation import set_validation_level
 import argparse
 from utils.path import get_next_numbered_path
 from warp_wrapper.contact_properties import ContactProperties
@@ -23,6 +24,7 @@ from simulation.update_scene import UpdateScene
 
 def main(args):
     config = Config.from_yaml(args.config)
+    set_validation_level(config.validation_level)
     DEVICE = config.device
     PATH = get_next_numbered_path(config.out_path)
     config.to_yaml(path=PATH)
@@ -81,12 +83,22 @@ def main(args):
         contact_properties=contact_properties,
         device=DEVICE,
         make_new_robot=False,
+        num_envs=config.num_envs,
+        envs_youngs_modulus=config.envs_youngs_modulus,
     ).create()
     variables = Variables()
     for cable in scene.robot.cables:
         for opt in cable.pull_ratio.optimizable:
             variables.add_parameter(opt)
-    simulation = Simulation(scene=scene, properties=sim_properties, use_checkpoint=config.use_checkpoint)
+    simulation = Simulation(
+        scene=scene,
+        properties=sim_properties,
+        use_checkpoint=config.use_checkpoint,
+        backend=config.sim_backend,
+        use_graph=config.sim_use_graph,
+        memory_budget=config.sim_memory_budget,
+        use_adjoint=config.sim_use_adjoint,
+    )
     loss = LocomotionLoss(
         scene=scene, target_position=torch.tensor(config.target_position, device=config.device), variables=variables
     )
@@ -1,15 +1,58 @@
 import torch
+from typing import List
 from attrs import define, field
 
 
 @define(frozen=True)
 class Barycentric:
-    HxN: torch.Tensor = field()
-    NxH: torch.Tensor = field()
+    """Sparse map between cable holes and the nodes of the mesh.
 
-    @HxN.validator
+    Each hole lies in one tetrahedron, so its row of the (num_holes, num_nodes) barycentric matrix HxN has only
+    4 non-zeros. They are stored as <indices> and <weights> of shape (num_holes, 4). The pseudo-inverse NxH is
+    never formed densely; it is applied as HxN.T @ pinv(HxN @ HxN.T), where <gram_pinv> is the small
+    (num_holes, num_holes) factor.
+    """
+
+    indices: torch.Tensor = field()
+    weights: torch.Tensor = field()
+    num_nodes: int = field()
+    gram_pinv: torch.Tensor = field()
+
+    @gram_pinv.default
+    def _calc_gram_pinv(self):
+        same_node = self.indices[:, None, :, None] == self.indices[None, :, None, :]
+        gram = (self.weights[:, None, :, None] * self.weights[None, :, None, :] * same_node).sum(dim=(-2, -1))
+        return torch.linalg.pinv(gram, hermitian=True)
+
+    @indices.validator
+    def _check_indices_shape(self, attribute, value):
+        if len(value.shape) != 2 or value.shape[-1] != 4:
+            raise ValueError(f"Expected <{attribute.name}> to be of shape (num_holes, 4), got {tuple(value.shape)}.")
+
+    @weights.validator
     def _check_sum_to_one(self, attribute, value):
         ones = torch.ones(value.shape[0], dtype=torch.float32, device=value.device)
-        HxN_sums_to_one = torch.isclose(value.sum(dim=-1), ones, atol=1e-8).all()
-        if not HxN_sums_to_one:
-            raise ValueError("Expected HxN to sum to one across dim 1.")
+        weights_sum_to_one = torch.isclose(value.sum(dim=-1), ones, atol=1e-8).all()
+        if not weights_sum_to_one:
+            raise ValueError("Expected weights to sum to one across dim 1.")
+
+    @classmethod
+    def concatenate(cls, barycentrics: List["Barycentric"]) -> "Barycentric":
+        """Packs the holes of several cables, one cable after another, into a single map."""
+        return cls(
+            indices=torch.cat([barycentric.indices for barycentric in barycentrics]),
+            weights=torch.cat([barycentric.weights for barycentric in barycentrics]),
+            num_nodes=barycentrics[0].num_nodes,
+            gram_pinv=torch.block_diag(*[barycentric.gram_pinv for barycentric in barycentrics]),
+        )
+
+    def interpolate(self, nodes_value: torch.Tensor) -> torch.Tensor:
+        """Gathers node values of shape (..., num_nodes, D) to the holes, i.e. HxN @ nodes_value."""
+        return (self.weights[..., None] * nodes_value[..., self.indices, :]).sum(dim=-2)
+
+    def spread(self, holes_value: torch.Tensor) -> torch.Tensor:
+        """Scatters hole values of shape (..., num_holes, D) to the nodes, i.e. NxH @ holes_value."""
+        batch, dim = holes_value.shape[:-2], holes_value.shape[-1]
+        contributions = self.weights[..., None] * (self.gram_pinv @ holes_value)[..., None, :]
+        nodes_value = torch.zeros((*batch, self.num_nodes, dim), dtype=holes_value.dtype, device=holes_value.device)
+        return nodes_value.index_add(-2, self.indices.reshape(-1), contributions.reshape(*batch, -1, dim))
@@ -1,10 +1,11 @@
 import warp as wp
 import torch
-from typing import List
+from typing import List, Tuple
 from mesh.mesh import Mesh
 from cable.holes import Holes
 from warp_wrapper.geometry import point_is_in_tetrahedron, barycentric_coordinates
 from cable.barycentric import Barycentric
+from mesh.tetrahedron_grid import TetrahedronGridFactory
 
 
 class BarycentricListFactory:
@@ -28,40 +29,91 @@ class BarycentricFactory:
         self._device = device
 
     def create(self) -> Barycentric:
-        HxN = self._get_barycentric()
-        NxH = self._get_barycentric_pinv(HxN)
-        return Barycentric(HxN=HxN, NxH=NxH)
+        indices, weights = self._get_barycentric()
+        return Barycentric(indices=indices, weights=weights, num_nodes=len(self._mesh.nodes))
 
-    @staticmethod
-    def _get_barycentric_pinv(barycentric: torch.Tensor) -> torch.Tensor:
-        return torch.pinverse(barycentric)
-
-    def _get_barycentric(self) -> torch.Tensor:
+    def _get_barycentric(self) -> Tuple[torch.Tensor, torch.Tensor]:
         holes = wp.from_torch(self._holes.position.contiguous(), dtype=wp.vec3)
         nodes = wp.from_torch(self._mesh.nodes.position.contiguous(), dtype=wp.vec3)
         tetrahedra = wp.from_torch(self._mesh.elements.tetrahedra, dtype=wp.int32)
-        barycentric_matrix = wp.zeros((len(self._holes), len(self._mesh.nodes)), dtype=float, device=self._device)
+        tetrahedron_of_hole = wp.from_torch(
+            torch.full((len(self._holes),), -1, dtype=torch.int32, device=self._device), dtype=wp.int32
+        )
+        indices = wp.zeros((len(self._holes), 4), dtype=int, device=self._device)
+        weights = wp.zeros((len(self._holes), 4), dtype=float, device=self._device)
+        grid = TetrahedronGridFactory(self._mesh).create()
+        wp.launch(
+            kernel=self._locate_kernel,
+            dim=len(self._holes),
+            inputs=[
+                holes,
+                nodes,
+                tetrahedra,
+                wp.vec3(*grid.origin),
+                grid.cell_size,
+                *grid.resolution,
+                wp.from_torch(grid.cell_start, dtype=wp.int32),
+                wp.from_torch(grid.cell_tetrahedra, dtype=wp.int32),
+                tetrahedron_of_hole,
+            ],
+            device=self._device,
+        )
         wp.launch(
             kernel=self._barycentric_kernel,
-            dim=[len(self._holes), self._mesh.elements.num_tetrahedra, 4],
-            inputs=[holes, nodes, tetrahedra, barycentric_matrix],
+            dim=[len(self._holes), 4],
+            inputs=[holes, nodes, tetrahedra, tetrahedron_of_hole, indices, weights],
             device=self._device,
         )
-        return wp.to_torch(barycentric_matrix)
+        return wp.to_torch(indices).long(), wp.to_torch(weights)
+
+    @wp.kernel
+    def _locate_kernel(
+        holes: wp.array(dtype=wp.vec3),
+        nodes: wp.array(dtype=wp.vec3),
+        tetrahedra: wp.array2d(dtype=int),
+        origin: wp.vec3,
+        cell_size: float,
+        resolution_x: int,
+        resolution_y: int,
+        resolution_z: int,
+        cell_start: wp.array(dtype=int),
+        cell_tetrahedra: wp.array(dtype=int),
+        tetrahedron_of_hole: wp.array(dtype=int),
+    ) -> None:
+        # candidates are sorted ascending, so a hole on a face shared by several
+        # tetrahedra deterministically picks the one with the smallest index
+        i = wp.tid()
+        hole_i = holes[i]
+        x = int(wp.floor((hole_i[0] - origin[0]) / cell_size))
+        y = int(wp.floor((hole_i[1] - origin[1]) / cell_size))
+        z = int(wp.floor((hole_i[2] - origin[2]) / cell_size))
+        if x < 0 or y < 0 or z < 0 or x >= resolution_x or y >= resolution_y or z >= resolution_z:
+            return
+        cell = (x * resolution_y + y) * resolution_z + z
+        found = int(-1)
+        for n in range(cell_start[cell], cell_start[cell + 1]):
+            if found == -1:
+                tet_j = tetrahedra[cell_tetrahedra[n]]
+                if point_is_in_tetrahedron(nodes[tet_j[0]], nodes[tet_j[1]], nodes[tet_j[2]], nodes[tet_j[3]], hole_i):
+                    found = cell_tetrahedra[n]
+        tetrahedron_of_hole[i] = found
 
     @wp.kernel
     def _barycentric_kernel(
         holes: wp.array(dtype=wp.vec3),
         nodes: wp.array(dtype=wp.vec3),
         tetrahedra: wp.array2d(dtype=int),
+        tetrahedron_of_hole: wp.array(dtype=int),
+        indices: wp.array2d(dtype=int),
         w: wp.array2d(dtype=float),
     ) -> None:
-        i, j, k = wp.tid()
-        hole_i = holes[i]
-        tet_j = tetrahedra[j]
-        n_j_0 = nodes[tet_j[0]]
-        n_j_1 = nodes[tet_j[1]]
-        n_j_2 = nodes[tet_j[2]]
-        n_j_3 = nodes[tet_j[3]]
-        if point_is_in_tetrahedron(n_j_0, n_j_1, n_j_2, n_j_3, hole_i):
-            w[i, tet_j[k]] = barycentric_coordinates(n_j_0, n_j_1, n_j_2, n_j_3, hole_i, k)
+        i, k = wp.tid()
+        j = tetrahedron_of_hole[i]
+        if j >= 0:
+            tet_j = tetrahedra[j]
+            n_j_0 = nodes[tet_j[0]]
+            n_j_1 = nodes[tet_j[1]]
+            n_j_2 = nodes[tet_j[2]]
+            n_j_3 = nodes[tet_j[3]]
+            indices[i, k] = tet_j[k]
+            w[i, k] = barycentric_coordinates(n_j_0, n_j_1, n_j_2, n_j_3, holes[i], k)
@@ -1,28 +1,35 @@
-import os
+import subprocess
 import torch
 import json
 import numpy as np
 from pathlib import Path
 from typing import List
 from mesh.scad import Scad
+from mesh.scad_cache import ScadCache
 from abc import ABC, abstractmethod
 
 
 class HolesInitialPosition(ABC):
-    def __init__(self, scad: Scad):
+    """Reads the holes position echoed by openscad for <scad>. The echo file is kept in a ScadCache."""
+
+    def __init__(self, scad: Scad, cache: ScadCache = None):
         self._scad = scad
-        self._PATH = Path(".tmp")
-        self._PATH.mkdir(exist_ok=True)
+        self._cache = cache if cache is not None else ScadCache()
 
     @abstractmethod
     def get(self) -> List[torch.Tensor]:
         pass
 
     def _create_echo_file(self):
-        os.system(f"openscad {self._scad.file} -o {self._get_echo_file()} -p {self._scad.parameters} -P firstSet")
+        self._echo_file = self._cache.get_file(self._scad, "hole.echo", self._write_echo_file)
+
+    def _write_echo_file(self, echo: Path):
+        subprocess.run(
+            ["openscad", self._scad.file, "-o", echo, "-p", self._scad.parameters, "-P", "firstSet"], check=True
+        )
 
     def _get_echo_file(self):
-        return self._PATH / "hole.echo"
+        return self._echo_file
 
 
 class StarfishHolesInitialPosition(HolesInitialPosition):
@@ -5,23 +5,37 @@ import sys
 
 sys.path.append("src")
 from simulation.simulation_properties import SimulationProperties
-from simulation.segment_iterator import SegmentIterator
 from functools import cached_property
-from utils.interpolate import linear_interpolate
+from utils.interpolate import interpolate
 
 
 class PullRatio(ABC):
     def __init__(self, sim_properties: SimulationProperties):
         self._sim_properties = sim_properties
         self.update_pull_ratio()
-        self.update_iterator()
+        self._versions = self._get_versions()
+
+    @property
+    @abstractmethod
+    def optimizable(self) -> List[torch.Tensor]:
+        pass
 
     @abstractmethod
     def update_pull_ratio(self) -> None:
+        """Sets <pull_ratio> to a tensor of shape (num_steps,) holding the pull ratio of every simulation step, or
+        (num_envs, num_steps) when the given pull ratios hold one value per environment."""
         pass
 
-    def update_iterator(self) -> None:
-        self.iterator = SegmentIterator(lst=self.pull_ratio, num_segments=self._sim_properties.num_segments)
+    def update_pull_ratio_if_changed(self) -> None:
+        """Updates <pull_ratio> unless its parameters are constant and were neither replaced nor modified in place
+        since the last update. Pull ratios that require grad are always updated, as their graph is freed by backward."""
+        versions = self._get_versions()
+        if versions != self._versions or any(parameter.requires_grad for parameter in self.optimizable):
+            self.update_pull_ratio()
+            self._versions = versions
+
+    def _get_versions(self) -> List[tuple]:
+        return [(id(parameter), parameter._version) for parameter in self.optimizable]
 
 
 class TimeInvariablePullRatio(PullRatio):
@@ -39,12 +53,19 @@ class TimeInvariablePullRatio(PullRatio):
         return [self._pull_ratio]
 
     def update_pull_ratio(self):
-        self.pull_ratio = [self._pull_ratio] * self._num_steps
+        self.pull_ratio = self._pull_ratio[..., None].expand(*self._pull_ratio.shape, self._num_steps)
 
 
 class TimeVariablePullRatio(PullRatio):
+    """Pull ratio optimized at the key timepoints and interpolated in between with <interpolation>, which is one of
+    linear, cubic or monotone."""
+
     def __init__(
-        self, simulation_properties: SimulationProperties, pull_ratio: List[torch.Tensor] = None, device: str = "cuda"
+        self,
+        simulation_properties: SimulationProperties,
+        pull_ratio: List[torch.Tensor] = None,
+        device: str = "cuda",
+        interpolation: str = "linear",
     ):
         self._time = simulation_properties.key_timepoints
         self._pull_ratio = (
@@ -56,6 +77,7 @@ class TimeVariablePullRatio(PullRatio):
             raise ValueError(f"Expected <pull_ratio> to be of length {len(self._time)}, got {len(self._pull_ratio)}.")
         self._dt = simulation_properties.dt
         self._device = device
+        self._interpolation = interpolation
         super().__init__(simulation_properties)
 
     @property
@@ -63,5 +85,7 @@ class TimeVariablePullRatio(PullRatio):
         return self._pull_ratio
 
     def update_pull_ratio(self):
-        t = torch.arange(0, self._sim_properties.duration, self._dt, device=self._device)
-        self.pull_ratio = linear_interpolate(self._time, self._pull_ratio, t)
+        steps = torch.arange(self._sim_properties.num_steps, dtype=torch.float64, device=self._device)
+        self.pull_ratio = interpolate(
+            self._time, torch.stack(self._pull_ratio, dim=-1), steps * self._dt, mode=self._interpolation
+        )
@@ -48,6 +48,21 @@ class Config:
     obstacle_scale: list = None
     key_timepoints_interval: float = None
     target_position: list = None
+    sim_backend: str = "torch"
+    sim_use_graph: bool = False
+    sim_memory_budget: int = None
+    sim_use_adjoint: bool = False
+    render_image_size: int = 1000
+    render_bin_size: int = 0
+    render_faces_per_pixel: int = 1
+    render_use_roi: bool = False
+    obstacle_loss: str = "rendering"
+    obstacle_sdf_resolution: int = 64
+    render_coarse_to_fine_sizes: list = None
+    render_coarse_to_fine_iterations: list = None
+    validation_level: str = "full"
+    num_envs: int = 1
+    envs_youngs_modulus: list = None
 
     @classmethod
     def from_dict(cls, d):
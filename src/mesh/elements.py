@@ -1,5 +1,9 @@
 import torch
 from attrs import define, field
+import sys
+
+sys.path.append("src")
+from utils.validation import ValidationLevel, get_validation_level
 
 
 @define
@@ -17,13 +21,13 @@ class Elements:
 
     @triangles.validator
     def _validate_triangles(self, attribute, value):
-        if value is not None:
+        if value is not None and get_validation_level() is not ValidationLevel.OFF:
             self._validate_common_traits_of_triangles_and_tetrahedra(name=attribute.name, value=value)
             self._validate_triangles_shape(name=attribute.name, value=value)
 
     @tetrahedra.validator
     def _validate_tetrahedra(self, attribute, value):
-        if value is not None:
+        if value is not None and get_validation_level() is not ValidationLevel.OFF:
             self._validate_common_traits_of_triangles_and_tetrahedra(name=attribute.name, value=value)
             self._validate_tetrahedra_shape(name=attribute.name, value=value)
 
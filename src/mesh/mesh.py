@@ -4,6 +4,7 @@ from mesh.nodes import Nodes
 from mesh.elements import Elements
 from cable.cable import Cable
 from mesh.mesh_properties import MeshProperties
+from utils.validation import ValidationLevel, get_validation_level
 
 
 @define
@@ -15,6 +16,8 @@ class Mesh:
 
     @elements.validator
     def _check_max_index(self, attribute, value):
+        if get_validation_level() is not ValidationLevel.FULL:
+            return
         elements = [value.triangles, value.tetrahedra]
         names = ["triangles", "tetrahedra"]
         for element, name in zip(elements, names):
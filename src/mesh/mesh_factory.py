@@ -1,6 +1,6 @@
 import torch
 import meshio
-import os
+import subprocess
 from abc import ABC, abstractmethod
 from os import PathLike
 from pathlib import Path
@@ -8,6 +8,7 @@ from mesh.mesh import Mesh
 from mesh.nodes import Nodes
 from mesh.elements import Elements
 from mesh.scad import Scad
+from mesh.scad_cache import ScadCache
 
 
 class MeshFactory(ABC):
@@ -61,33 +62,30 @@ class MeshFactoryFromMsh(MeshFactory):
 
 
 class MeshFactoryFromScad(MeshFactory):
-    def __init__(self, scad: Scad, ideal_edge_length: float = 0.02, device: str = "cuda"):
-        self.PATH = Path(".tmp")
-        self.PATH.mkdir(exist_ok=True)
+    """Meshes <scad> with openscad and fTetWild. The .stl and .msh files are kept in a ScadCache, so that the same
+    model and <ideal_edge_length> are only meshed once."""
+
+    def __init__(self, scad: Scad, ideal_edge_length: float = 0.02, device: str = "cuda", cache: ScadCache = None):
         self._scad = scad
         self._ideal_edge_length = ideal_edge_length
         self._device = device
+        self._cache = cache if cache is not None else ScadCache()
 
     def create(self):
-        self._create_files()
-        return MeshFactoryFromMsh(file=self._get_msh_file(), device=self._device).create()
+        return MeshFactoryFromMsh(file=self.get_msh_file(), device=self._device).create()
 
-    def _create_files(self):
-        self._convert_scad_to_stl()
-        self._convert_stl_to_msh_and_obj()
+    def get_msh_file(self) -> Path:
+        return self._cache.get_file(self._scad, "mesh.msh", self._convert_stl_to_msh, self._ideal_edge_length)
 
-    def _convert_scad_to_stl(self):
-        stl = self._get_stl_file()
-        os.system(f"openscad -q {self._scad.file} -o {stl} -p {self._scad.parameters} -P firstSet")
+    def _get_stl_file(self) -> Path:
+        return self._cache.get_file(self._scad, "mesh.stl", self._convert_scad_to_stl)
+
+    def _convert_scad_to_stl(self, stl: Path):
+        subprocess.run(
+            ["openscad", "-q", self._scad.file, "-o", stl, "-p", self._scad.parameters, "-P", "firstSet"], check=True
+        )
 
-    def _convert_stl_to_msh_and_obj(self):
+    def _convert_stl_to_msh(self, msh: Path):
         iel = self._ideal_edge_length
         stl = self._get_stl_file()
-        msh = self._get_msh_file()
-        os.system(f"fTetWild/build/FloatTetwild_bin -i {stl} -o {msh} -l {iel}")
-
-    def _get_msh_file(self):
-        return self.PATH / "mesh.msh"
-
-    def _get_stl_file(self):
-        return self.PATH / "mesh.stl"
+        subprocess.run(["fTetWild/build/FloatTetwild_bin", "-i", stl, "-o", msh, "-l", str(iel)], check=True)
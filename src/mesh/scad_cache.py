@@ -0,0 +1,51 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from os import PathLike
+from pathlib import Path
+from typing import Callable
+from mesh.scad import Scad
+
+
+class ScadCache:
+    """Files generated from a scad model, kept on disk under <path>/<key>/<name>, where the key hashes the content of
+    the .scad file and of its parameters, plus any <settings> of the generation. Files included by the .scad file are
+    not part of the key.
+
+    A missing file is written into a temporary directory of its own and only moved into the cache once it was created
+    without error, so concurrent runs never read a partial file and never overwrite each other's files. The temporary
+    directory is removed afterwards, along with any partial file or side file left by a failed generation.
+    """
+
+    def __init__(self, path: PathLike = ".tmp/cache"):
+        self._path = Path(path)
+
+    def get_key(self, scad: Scad, *settings) -> str:
+        digest = hashlib.sha256()
+        for file in [scad.file, scad.parameters]:
+            with open(file, "rb") as f:
+                digest.update(f.read())
+        digest.update(repr(settings).encode())
+        return digest.hexdigest()[:32]
+
+    def get_file(self, scad: Scad, name: str, create: Callable[[Path], None], *settings) -> Path:
+        """Returns the cached file <name> generated from <scad> with <settings>, calling <create> with the path to
+        write it to when it is not cached yet. <create> raises if the generation fails, in which case nothing is
+        cached."""
+        directory = self._path / self.get_key(scad, *settings)
+        file = directory / name
+        if file.exists():
+            return file
+        directory.mkdir(parents=True, exist_ok=True)
+        temporary_directory = Path(tempfile.mkdtemp(dir=directory))
+        try:
+            # keeps the name, from whose extension openscad infers the format
+            temporary_file = temporary_directory / name
+            create(temporary_file)
+            if not temporary_file.exists():
+                raise FileNotFoundError(f"Expected {file} to be created from {scad.file}.")
+            os.replace(temporary_file, file)
+        finally:
+            shutil.rmtree(temporary_directory)
+        return file
@@ -0,0 +1,43 @@
+import json
+import itertools
+from os import PathLike
+from pathlib import Path
+from typing import Dict, List
+from mesh.scad import Scad
+
+
+class ScadSweepFactory:
+    """Creates one Scad per combination of the parameter files <parameters> and the values of <sweep>, which maps names
+    of the firstSet parameters to the values to try. The parameters of the i-th Scad are written to
+    <path>/<i>/scad_params.json, so that every design has a directory of its own. Swept names must already be
+    parameters of every file."""
+
+    def __init__(self, scad_file: PathLike, parameters: List[PathLike], sweep: Dict[str, list], path: PathLike):
+        self._scad_file = scad_file
+        self._parameters = parameters
+        self._sweep = sweep
+        self._path = Path(path)
+
+    def create(self) -> List[Scad]:
+        scads = []
+        for i, parameters in enumerate(self._get_parameter_sets()):
+            directory = self._path / f"{i}"
+            directory.mkdir(parents=True, exist_ok=True)
+            with open(directory / "scad_params.json", "w") as f:
+                json.dump(parameters, f, indent=4)
+            scads.append(Scad(file=self._scad_file, parameters=directory / "scad_params.json"))
+        return scads
+
+    def _get_parameter_sets(self) -> List[dict]:
+        parameter_sets = []
+        for file in self._parameters:
+            with open(file, "r") as f:
+                base = json.load(f)
+            unknown = [name for name in self._sweep if name not in base["parameterSets"]["firstSet"]]
+            if unknown:
+                raise ValueError(f"Expected the swept parameters to be firstSet parameters of {file}, got {unknown}.")
+            for values in itertools.product(*self._sweep.values()):
+                parameters = json.loads(json.dumps(base))
+                parameters["parameterSets"]["firstSet"].update(zip(self._sweep.keys(), values))
+                parameter_sets.append(parameters)
+        return parameter_sets
@@ -0,0 +1,78 @@
+import torch
+from typing import List
+from attrs import define, field
+from mesh.mesh import Mesh
+
+
+@define
+class TetrahedronGrid:
+    """Uniform grid over the bounding boxes of the tetrahedra of a mesh.
+
+    The tetrahedra overlapping cell c are cell_tetrahedra[cell_start[c]:cell_start[c + 1]], sorted ascending.
+    """
+
+    origin: List[float] = field()
+    cell_size: float = field()
+    resolution: List[int] = field()
+    cell_start: torch.Tensor = field()
+    cell_tetrahedra: torch.Tensor = field()
+
+    @property
+    def num_cells(self):
+        return self.resolution[0] * self.resolution[1] * self.resolution[2]
+
+
+class TetrahedronGridFactory:
+    def __init__(self, mesh: Mesh, cell_size: float = None, max_num_cells: int = 2**21):
+        self._mesh = mesh
+        self._cell_size = cell_size
+        self._max_num_cells = max_num_cells
+
+    def create(self) -> TetrahedronGrid:
+        lower, upper = self._get_bounding_boxes()
+        origin = lower.amin(dim=0)
+        cell_size = self._get_cell_size(lower, upper, origin)
+        resolution = ((upper.amax(dim=0) - origin) / cell_size).floor().long() + 1
+        lower_cell = self._get_cell_coordinates(lower, origin, cell_size, resolution)
+        upper_cell = self._get_cell_coordinates(upper, origin, cell_size, resolution)
+        cells, tetrahedra = self._get_overlapping_cells(lower_cell, upper_cell, resolution)
+        cells, order = torch.sort(cells, stable=True)
+        num_cells = int(resolution.prod())
+        cell_start = torch.zeros(num_cells + 1, dtype=torch.int32, device=cells.device)
+        cell_start[1:] = torch.cumsum(torch.bincount(cells, minlength=num_cells), dim=0)
+        return TetrahedronGrid(
+            origin=origin.tolist(),
+            cell_size=float(cell_size),
+            resolution=resolution.tolist(),
+            cell_start=cell_start,
+            cell_tetrahedra=tetrahedra[order].to(dtype=torch.int32),
+        )
+
+    def _get_bounding_boxes(self):
+        corners = self._mesh.nodes.position.detach()[self._mesh.elements.tetrahedra.long()]
+        return corners.amin(dim=1), corners.amax(dim=1)
+
+    def _get_cell_size(self, lower, upper, origin):
+        cell_size = self._cell_size if self._cell_size is not None else (upper - lower).amax(dim=1).mean()
+        extent = upper.amax(dim=0) - origin
+        min_cell_size = (extent.prod() / self._max_num_cells) ** (1 / 3)
+        return max(float(cell_size), float(min_cell_size), 1e-12)
+
+    @staticmethod
+    def _get_cell_coordinates(point, origin, cell_size, resolution):
+        cell = ((point - origin) / cell_size).floor().long()
+        return torch.minimum(cell.clamp(min=0), resolution - 1)
+
+    @staticmethod
+    def _get_overlapping_cells(lower_cell, upper_cell, resolution):
+        span = upper_cell - lower_cell + 1
+        counts = span.prod(dim=1)
+        tetrahedra = torch.repeat_interleave(torch.arange(len(counts), device=counts.device), counts)
+        first = torch.repeat_interleave(torch.cumsum(counts, dim=0) - counts, counts)
+        local = torch.arange(len(tetrahedra), device=counts.device) - first
+        span, lower_cell = span[tetrahedra], lower_cell[tetrahedra]
+        x = lower_cell[:, 0] + local % span[:, 0]
+        y = lower_cell[:, 1] + (local // span[:, 0]) % span[:, 1]
+        z = lower_cell[:, 2] + local // (span[:, 0] * span[:, 1])
+        cells = (x * resolution[1] + y) * resolution[2] + z
+        return cells, tetrahedra
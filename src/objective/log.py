@@ -1,60 +1,81 @@
 import os
+import json
+import numpy as np
 import torch
 import sys
 
 sys.path.append("src")
-import copy
+from typing import Dict, List
 from objective.loss import Loss
 from objective.variables import Variables
 import matplotlib.pyplot as plt
 
 
 class Log:
+    """Appends the loss, gradients and parameters of every iteration as a row of float32 values to <name>.bin, so that
+    saving an iteration costs the same however long the run. The number of values per row is kept in columns.json.
+    The readers memory-map the files, and still read the loss.pt, gradient.pt and parameter.pt of older logs."""
+
+    NAMES = ["loss", "gradient", "parameter"]
+
     def __init__(self, loss: Loss, variables: Variables, path: str):
         self._loss = loss
         self._variables = variables
         self._path = path
-        self.loss_log, self.gradient_log, self.parameters_log = [], [], []
+        self._num_saved = 0
         os.makedirs(path, exist_ok=True)
 
-    def _append_log(self):
-        self.loss_log.append(self._loss.get_loss().detach().cpu().tolist())
-        self.gradient_log.append(copy.deepcopy(self._variables.gradients))
-        self.parameters_log.append(copy.deepcopy(self._variables.parameters))
+    def _get_rows(self) -> Dict[str, np.ndarray]:
+        return {
+            "loss": self._to_row([self._loss.value]),
+            "gradient": self._to_row(self._variables.gradients),
+            "parameter": self._to_row(self._variables.parameters),
+        }
+
+    @staticmethod
+    def _to_row(tensors: List[torch.Tensor]) -> np.ndarray:
+        return torch.cat([tensor.detach().reshape(-1) for tensor in tensors]).cpu().numpy().astype(np.float32)
 
     def save(self):
-        self._append_log()
-        torch.save(torch.tensor(self.loss_log), f"{self._path}/loss.pt")
-        torch.save(torch.tensor(self.gradient_log), f"{self._path}/gradient.pt")
-        torch.save(torch.tensor(self.parameters_log), f"{self._path}/parameter.pt")
+        rows = self._get_rows()
+        if self._num_saved == 0:
+            with open(f"{self._path}/columns.json", "w") as f:
+                json.dump({name: len(row) for name, row in rows.items()}, f)
+        for name, row in rows.items():
+            with open(f"{self._path}/{name}.bin", "ab" if self._num_saved > 0 else "wb") as f:
+                f.write(row.tobytes())
+        self._num_saved += 1
+
+    @staticmethod
+    def load(path, name: str) -> torch.Tensor:
+        """Returns the log of <name>, one of NAMES, of shape (iterations, values), memory-mapped from its file."""
+        if not os.path.exists(f"{path}/{name}.bin"):
+            return torch.load(f"{path}/{name}.pt")
+        with open(f"{path}/columns.json", "r") as f:
+            num_columns = json.load(f)[name]
+        values = np.memmap(f"{path}/{name}.bin", dtype=np.float32, mode="c")
+        return torch.from_numpy(values.reshape(-1, num_columns))
 
     @staticmethod
     def plot(path):
-        loss = torch.load(f"{path}/loss.pt")
-        gradient = torch.load(f"{path}/gradient.pt")
-        parameter = torch.load(f"{path}/parameter.pt")
-        for tensor, label in zip([loss, gradient, parameter], ["Loss", "Gradient", "Parameter"]):
+        for name, label in zip(Log.NAMES, ["Loss", "Gradient", "Parameter"]):
             plt.figure()
-            plt.plot(tensor)
+            plt.plot(Log.load(path, name))
             plt.xlabel("# Iterations")
             plt.ylabel(label)
         plt.show()
 
     @staticmethod
     def print(path):
-        loss = torch.load(f"{path}/loss.pt")
-        gradient = torch.load(f"{path}/gradient.pt")
-        parameter = torch.load(f"{path}/parameter.pt")
+        loss, gradient, parameter = [Log.load(path, name) for name in Log.NAMES]
         print(f"Loss\n{loss}")
         print(f"Gradinets\n{gradient}")
         print(f"Parameters\n{parameter}")
 
     @staticmethod
     def print_iteration(path, i: int):
-        loss = torch.load(f"{path}/loss.pt")
-        gradient = torch.load(f"{path}/gradient.pt")
-        parameter = torch.load(f"{path}/parameter.pt")
+        loss, gradient, parameter = [Log.load(path, name)[i] for name in Log.NAMES]
         print(f"Iteration {i}")
-        print(f"Loss\n{loss[i]}")
-        print(f"Gradinets\n{gradient[i]}")
-        print(f"Parameters\n{parameter[i]}")
+        print(f"Loss\n{loss}")
+        print(f"Gradinets\n{gradient}")
+        print(f"Parameters\n{parameter}")
@@ -5,18 +5,29 @@ import sys
 sys.path.append("src")
 
 from rendering.rendering import InteriorGapRendering, InteriorDistanceRendering
+from rendering.resolution import CoarseToFineResolution
+from warp_wrapper.signed_distance import SignedDistanceGrid
 from scene.scene import Scene, TouchScene
 from typing import List
 from scene.scene_observer import SceneObserver
 
 
 class Loss(ABC):
+    value: torch.Tensor = None  # detached loss of the last backward, for printing and logging
+
     @abstractmethod
     def get_loss(self) -> torch.Tensor:
+        """Returns the loss as a tensor of shape (1,)."""
         pass
 
     def backward(self):
-        self.get_loss().backward()
+        loss = self.get_loss()
+        loss.backward()
+        self.value = loss.detach()
+
+    def set_iteration(self, iteration: int):
+        """Called by Train at the start of every training iteration."""
+        pass
 
 
 class ToyLoss(Loss):
@@ -24,47 +35,82 @@ class ToyLoss(Loss):
         self._scene = scene
 
     def get_loss(self):
-        return self._scene.robot.nodes.position.sum()
+        return self._scene.robot.nodes.position.sum().reshape(1)
 
 
 class MaxGripLoss(Loss):
-    def __init__(self, rendering: InteriorGapRendering, device: str = "cuda"):
+    """With a coarse-to-fine <resolution>, the loss of coarse images is scaled by their pixel area so that it estimates
+    the loss at the final image size."""
+
+    def __init__(
+        self, rendering: InteriorGapRendering, device: str = "cuda", resolution: CoarseToFineResolution = None
+    ):
         self._rendering = rendering
         self._device = device
+        self._resolution = resolution
+        self._pixel_area = 1.0
 
     def get_loss(self):
         images = self._rendering.get_images()
-        loss = torch.zeros(1, requires_grad=True, device=self._device)
-        for image in images:
-            loss = loss + 0.5 * (image**2).sum()
-        return loss / len(images)
+        return (0.5 * self._pixel_area / len(images)) * images.square().sum().reshape(1)
+
+    def set_iteration(self, iteration: int):
+        if self._resolution is not None:
+            image_size = self._resolution.get_image_size(iteration)
+            self._rendering.set_image_size(image_size)
+            self._pixel_area = (self._resolution.final_image_size / image_size) ** 2
 
 
 class PointTouchLoss(Loss):
+    """Averaged over the environments of the scene."""
+
     def __init__(self, scene: TouchScene):
         self._scene = scene
 
     def get_loss(self):
-        output_position = self._scene.robot.nodes.position[self._scene.robot_end_effector_idx]
+        output_position = self._scene.envs_nodes_position[:, self._scene.robot_end_effector_idx]
         target_position = self._scene.object.nodes.position.mean(dim=0)
-        return torch.sum((output_position - target_position) ** 2)
+        return torch.sum((output_position - target_position) ** 2, dim=-1).mean().reshape(1)
 
 
 class ObstacleAvoidanceLoss(Loss, SceneObserver):
-    def __init__(self, rendering: InteriorDistanceRendering, device: str = "cuda"):
+    def __init__(
+        self, rendering: InteriorDistanceRendering, device: str = "cuda", resolution: CoarseToFineResolution = None
+    ):
         self._rendering = rendering
         self._device = device
+        self._resolution = resolution
         self.loss = torch.zeros(1, requires_grad=True, device=self._device)
 
     def update(self):
         self.loss = self.loss + self.get_loss()
 
     def get_loss(self):
-        loss = torch.zeros(1, requires_grad=True, device=self._device)
         images = self._rendering.get_images()
-        for image in images:
-            loss = loss + torch.mean(image)
-        return loss / len(images)
+        return images.sum().reshape(1) / (self._rendering.num_pixels * len(images))
+
+    def set_iteration(self, iteration: int):
+        if self._resolution is not None:
+            self._rendering.set_image_size(self._resolution.get_image_size(iteration))
+
+
+class ObstacleSignedDistanceLoss(Loss, SceneObserver):
+    """Penetration of the robot nodes into a static obstacle, read from the <signed_distance> grid of the obstacle.
+    The loss is the negative mean penetration depth, so that, like ObstacleAvoidanceLoss, larger is better. Averaged
+    over the environments of the scene."""
+
+    def __init__(self, scene: Scene, signed_distance: SignedDistanceGrid, device: str = "cuda"):
+        self._scene = scene
+        self._signed_distance = signed_distance
+        self._device = device
+        self.loss = torch.zeros(1, requires_grad=True, device=self._device)
+
+    def update(self):
+        self.loss = self.loss + self.get_loss()
+
+    def get_loss(self):
+        distance = self._signed_distance(self._scene.envs_nodes_position)
+        return distance.clamp(max=0.0).mean().reshape(1)
 
 
 class PointTouchWithObstacleAvoidanceLoss(Loss):
@@ -79,12 +125,18 @@ class PointTouchWithObstacleAvoidanceLoss(Loss):
             loss = loss - (1 - self._weight) * obstacle_avoidance_loss.loss
         return loss
 
+    def set_iteration(self, iteration: int):
+        for obstacle_avoidance_loss in self._obstacle_avoidance_losses:
+            obstacle_avoidance_loss.set_iteration(iteration)
+
 
 class LocomotionLoss(Loss):
+    """Averaged over the environments of the scene."""
+
     def __init__(self, scene: Scene, target_position: torch.Tensor):
         self._scene = scene
         self._target_position = target_position
 
     def get_loss(self):
-        output_position = self._scene.robot.nodes.position.mean(dim=0)
-        return torch.sum((output_position - self._target_position) ** 2)
+        output_position = self._scene.envs_nodes_position.mean(dim=1)
+        return torch.sum((output_position - self._target_position) ** 2, dim=-1).mean().reshape(1)
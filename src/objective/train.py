@@ -35,6 +35,7 @@ class Train:
             colour="blue",
             disable=verbose,
         ):
+            self._loss.set_iteration(self.i)
             self._update_scene.update_scene()
             self._loss.backward()
             self._optimizer.step()
@@ -50,6 +51,6 @@ class Train:
 
     def print(self):
         print(f"Iter: {self.i+1}")
-        print(f"Loss: {self._loss.get_loss()}")
+        print(f"Loss: {self._loss.value}")
         print(f"Grad: {[round(g.item(), 3) for g in self._optimizer._variables.gradients]}")
         print(f"Alpha: {[round(p.item(), 3) for p in self._optimizer._variables.parameters]}")
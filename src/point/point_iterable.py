@@ -3,20 +3,37 @@ import sys
 sys.path.append("src")
 
 from point.points import Points
-import copy
+import torch
 
 
 class PointIterable:
-    def __init__(self, point: Points, num: int = 23040):
-        self._points = [copy.copy(point) for _ in range(num)]
+    """Ring buffer of <capacity> slots, each holding the position, velocity and force of <point>, cycled through
+    endlessly. The slots are views into one contiguous (capacity, N, 3) tensor per attribute, which is allocated on
+    the first call to next, and each slot is filled with the values of <point> the first time it is handed out. The
+    slots hold detached copies, so gradients do not flow back to <point>."""
+
+    def __init__(self, point: Points, capacity: int = 23040):
+        self._initial = [point.position.detach(), point.velocity.detach(), point.force.detach()]
+        self._capacity = capacity
+        self._buffers = None
+        self._num_filled = 0
         self._index = 0
 
     def __iter__(self):
         return self
 
-    def __next__(self):
-        if not self._points:
+    def __next__(self) -> Points:
+        if self._capacity == 0:
             raise StopIteration
-        points = self._points[self._index]
-        self._index = (self._index + 1) % len(self._points)
-        return points
+        if self._buffers is None:
+            self._buffers = [
+                torch.empty(self._capacity, *tensor.shape, dtype=tensor.dtype, device=tensor.device)
+                for tensor in self._initial
+            ]
+        if self._index == self._num_filled:
+            for buffer, initial in zip(self._buffers, self._initial):
+                buffer[self._index] = initial
+            self._num_filled += 1
+        position, velocity, force = [buffer[self._index] for buffer in self._buffers]
+        self._index = (self._index + 1) % self._capacity
+        return Points.from_trusted(position=position, velocity=velocity, force=force)
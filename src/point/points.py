@@ -1,9 +1,15 @@
 import torch
 from attrs import define, field
+import sys
+
+sys.path.append("src")
+from utils.validation import ValidationLevel, get_validation_level, validation_level
 
 
 @define
 class Points:
+    """Checks its tensors on construction and assignment according to the validation level, see utils.validation."""
+
     position: torch.Tensor = field()
     velocity: torch.Tensor = field()
     force: torch.Tensor = field()
@@ -11,6 +17,12 @@ class Points:
     def __len__(self):
         return self.position.shape[0]
 
+    @classmethod
+    def from_trusted(cls, position: torch.Tensor, velocity: torch.Tensor, force: torch.Tensor):
+        """Creates points without checking tensors already known to be valid, such as views of validated points."""
+        with validation_level(ValidationLevel.OFF):
+            return cls(position=position, velocity=velocity, force=force)
+
     @velocity.default
     @force.default
     def _set_zero_by_default(self):
@@ -27,6 +39,8 @@ class Points:
         self._validate_equal_shape_with_position(name=attribute.name, value=value)
 
     def _validate_common_traits_of_attributes(self, name, value):
+        if get_validation_level() is ValidationLevel.OFF:
+            return
         if not isinstance(value, torch.Tensor):
             raise TypeError(f"Expected <{name}> to be of type torch.Tensor, got {type(value)}.")
         if len(value.shape) != 2:
@@ -35,9 +49,11 @@ class Points:
             raise ValueError(f"Expected the last dimension of <{name}> to be of size 3, got {value.shape[-1]}.")
         if value.dtype != torch.float32:
             raise ValueError(f"Expected dtype of <{name}> to be torch.float32, got {value.dtype}.")
-        if torch.any(torch.isnan(value)):
+        if get_validation_level() is ValidationLevel.FULL and torch.any(torch.isnan(value)):
             raise RuntimeError(f"Some of the values of <{name}> are NaN.")
 
     def _validate_equal_shape_with_position(self, name, value):
+        if get_validation_level() is ValidationLevel.OFF:
+            return
         if value.shape != self.position.shape:
             raise ValueError(f"Expected <{name}> to have the same shape as <position>, got {value.shape})")
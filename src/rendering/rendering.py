@@ -11,7 +11,18 @@ import matplotlib.pyplot as plt
 
 class DepthRendering(ABC):
     @abstractmethod
-    def get_images(self):
+    def get_images(self) -> torch.Tensor:
+        """Returns the images of all views stacked in a tensor of shape (views, H, W)."""
+        pass
+
+    @abstractmethod
+    def set_image_size(self, image_size: int):
+        pass
+
+    @property
+    @abstractmethod
+    def num_pixels(self) -> int:
+        """Number of pixels of a full image, even when the images are cropped."""
         pass
 
 
@@ -21,22 +32,35 @@ class ExteriorDepthRendering(DepthRendering):
 
     @property
     def zbufs(self):
-        return torch.stack([zbuf.zbuf for zbuf in self._zbufs])
+        return ZBuffer.get_zbufs(self._zbufs)
+
+    def set_image_size(self, image_size: int):
+        for zbuf in self._zbufs:
+            zbuf.image_size = image_size
+
+    @property
+    def num_pixels(self) -> int:
+        return self._zbufs[0].image_size ** 2
 
     def get_images(self):
         zbufs = self.zbufs
         LARGE_POSITIVE_NUMBER = 619.0
-        zbufs[zbufs == -1.0] = LARGE_POSITIVE_NUMBER
-        images = zbufs.amin(dim=0)
-        images[images == LARGE_POSITIVE_NUMBER] = -1.0
-        images = [image for image in images]
-        return images
+        images = torch.where(zbufs == -1.0, LARGE_POSITIVE_NUMBER, zbufs).amin(dim=0)
+        return torch.where(images == LARGE_POSITIVE_NUMBER, -1.0, images)
 
 
 class InteriorDepthRendering(DepthRendering):
-    def __init__(self, robot_zbuf: ZBuffer, other_zbuf: ZBuffer):
+    """With <use_roi>, only the tile of each view that covers the robot is rendered and the images are cropped to it.
+    This is only allowed for renderings whose images are zero wherever the robot is not seen."""
+
+    _zero_without_robot = True
+
+    def __init__(self, robot_zbuf: ZBuffer, other_zbuf: ZBuffer, use_roi: bool = False):
+        if use_roi and not self._zero_without_robot:
+            raise ValueError(f"Expected <use_roi> to be False for {type(self).__name__}.")
         self._robot_zbuf = robot_zbuf
         self._other_zbuf = other_zbuf
+        self._use_roi = use_roi
 
     @property
     def robot_zbuf(self):
@@ -46,42 +70,39 @@ class InteriorDepthRendering(DepthRendering):
     def other_zubf(self):
         return self._other_zbuf.zbuf
 
+    @property
+    def zbufs(self):
+        """Returns the robot and other z-buffers, rasterized in one pass."""
+        crop = self._robot_zbuf.get_crop() if self._use_roi else None
+        return ZBuffer.get_zbufs([self._robot_zbuf, self._other_zbuf], crop=crop)
+
+    def set_image_size(self, image_size: int):
+        self._robot_zbuf.image_size = image_size
+        self._other_zbuf.image_size = image_size
+
+    @property
+    def num_pixels(self) -> int:
+        return self._robot_zbuf.image_size ** 2
+
 
 class InteriorGapRendering(InteriorDepthRendering):
     def get_images(self):
-        gaps = []
-        robot_zbuf = self.robot_zbuf
-        other_zbuf = self.other_zubf
-        for rz, oz in zip(robot_zbuf, other_zbuf):  # looping over views
-            distance = rz - oz
-            distance[distance < 0] = 0  # consider not zeroing negative distances
-            gaps.append(distance)
-        return gaps
+        robot_zbuf, other_zbuf = self.zbufs
+        return (robot_zbuf - other_zbuf).clamp(min=0)  # consider not zeroing negative distances
 
 
 class InteriorContactRendering(InteriorDepthRendering):
     def get_images(self):
-        contacts = []
-        robot_zbuf = self.robot_zbuf
-        other_zbuf = self.other_zubf
-        for rz, oz in zip(robot_zbuf, other_zbuf):  # looping over views
-            distance = oz - rz
-            mask_contact = distance >= 0
-            mask_other = oz > -1
-            mask_robot = rz > -1
-            mask = mask_contact * mask_robot * mask_other * 1.0
-            contacts.append(mask)
-        return contacts
+        robot_zbuf, other_zbuf = self.zbufs
+        mask_contact = other_zbuf - robot_zbuf >= 0
+        mask_other = other_zbuf > -1
+        mask_robot = robot_zbuf > -1
+        return mask_contact * mask_robot * mask_other * 1.0
 
 
 class InteriorDistanceRendering(InteriorDepthRendering):
+    _zero_without_robot = False  # the distance is -1 minus the depth of the other mesh where the robot is not seen
+
     def get_images(self):
-        gaps = []
-
-        robot_zbuf = self.robot_zbuf
-        other_zbuf = self.other_zubf
-        for rz, oz in zip(robot_zbuf, other_zbuf):  # looping over views
-            distance = rz - oz
-            distance[distance > 0] = 0
-            gaps.append(distance)
-        return gaps
+        robot_zbuf, other_zbuf = self.zbufs
+        return (robot_zbuf - other_zbuf).clamp(max=0)
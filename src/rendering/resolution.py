@@ -0,0 +1,30 @@
+from attrs import define, field
+from typing import List
+
+
+@define
+class CoarseToFineResolution:
+    """Image size of the renderings at each training iteration, starting coarse and refining in later iterations.
+
+    Renderings are <image_sizes>[i] pixels wide for <num_iterations>[i] iterations, and at the last size afterwards.
+    """
+
+    image_sizes: List[int] = field()
+    num_iterations: List[int] = field()
+
+    @num_iterations.validator
+    def _check_num_iterations(self, attribute, value):
+        if len(value) != len(self.image_sizes):
+            raise ValueError(f"Expected as many <{attribute.name}> as <image_sizes>.")
+
+    @property
+    def final_image_size(self) -> int:
+        return self.image_sizes[-1]
+
+    def get_image_size(self, iteration: int) -> int:
+        last_iteration = 0
+        for image_size, num_iterations in zip(self.image_sizes, self.num_iterations):
+            last_iteration += num_iterations
+            if iteration < last_iteration:
+                return image_size
+        return self.final_image_size
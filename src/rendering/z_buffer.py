@@ -1,4 +1,6 @@
 from pytorch3d import structures, renderer
+from attrs import define, field
+from typing import List
 import sys
 
 sys.path.append("src")
@@ -8,40 +10,180 @@ from mesh.mesh import Mesh
 import torch
 
 
+@define
+class Crop:
+    """Square tile of <size> pixels in every view, whose top left pixel is at row <rows>[view] and column
+    <columns>[view] of the full image."""
+
+    rows: torch.Tensor = field()
+    columns: torch.Tensor = field()
+    size: int = field()
+
+    def repeat(self, num_repeats: int) -> "Crop":
+        return Crop(rows=self.rows.repeat(num_repeats), columns=self.columns.repeat(num_repeats), size=self.size)
+
+
 class ZBuffer:
-    def __init__(self, mesh: Mesh, views: Views, device: str = "cuda"):
+    """Depth of the closest face of a mesh at every pixel of every view, rasterized for all views in one pass.
+
+    <image_size> is the side of the square images in pixels, which can be changed between renders. <bin_size> and
+    <faces_per_pixel> are passed to the rasterizer, where a <bin_size> of 0 means naive rasterization and None lets
+    pytorch3d pick coarse-to-fine binning.
+
+    The depth of a <static> mesh, such as the shape meshes of a scene, is rasterized once and reused until the tensor
+    of its nodes position is replaced or modified in place. It carries no gradient.
+    """
+
+    def __init__(
+        self,
+        mesh: Mesh,
+        views: Views,
+        device: str = "cuda",
+        image_size: int = 1000,
+        bin_size: int = 0,
+        faces_per_pixel: int = 1,
+        static: bool = False,
+    ):
         self._mesh = mesh
         self._device = device
         self._views = views.get()
         self._znear = 0.001
         self._zfar = 10
         self._fov = 90
+        self._bin_size = bin_size
+        self._faces_per_pixel = faces_per_pixel
+        self.image_size = image_size
+        self.static = static
+        self._static_zbuf = None
+        self._static_position = None
+        self._static_key = None
 
     @property
     def zbuf(self) -> torch.Tensor:
-        return torch.stack([rasterizer(self.mesh).zbuf.squeeze() for rasterizer in self._rasterizers])
+        """Returns a tensor of shape (views, H, W), -1 where no face is seen."""
+        return self.get_zbufs([self])[0]
 
     @property
     def mesh(self):
         return structures.Meshes(self._mesh.nodes.position[None], self._mesh.elements.triangles[None])
 
+    @staticmethod
+    def get_zbufs(zbufs: List["ZBuffer"], crop: Crop = None) -> torch.Tensor:
+        """Rasterizes every view of every z-buffer, which must all have the same number of views, in one pass and
+        returns a tensor of shape (len(zbufs), views, H, W). With a <crop>, only its tile of each view is rasterized,
+        and H and W are the size of the tile. Static z-buffers are taken from their cache instead."""
+        if not any(zbuf.static for zbuf in zbufs):
+            return ZBuffer._rasterize(zbufs, crop)
+        dynamic = [zbuf for zbuf in zbufs if not zbuf.static]
+        rasterized = iter(ZBuffer._rasterize(dynamic, crop) if dynamic else [])
+        return torch.stack([zbuf._get_static_zbuf(crop) if zbuf.static else next(rasterized) for zbuf in zbufs])
+
+    @staticmethod
+    def _rasterize(zbufs: List["ZBuffer"], crop: Crop = None) -> torch.Tensor:
+        meshes = structures.join_meshes_as_batch([zbuf.mesh.extend(len(zbuf._views)) for zbuf in zbufs])
+        if len(zbufs) == 1 and crop is None:
+            cameras = zbufs[0]._cameras
+        else:
+            rotation = torch.cat([zbuf._rotation for zbuf in zbufs])
+            translation = torch.cat([zbuf._translation for zbuf in zbufs])
+            cameras = zbufs[0]._get_cameras(rotation, translation, crop.repeat(len(zbufs)) if crop else None)
+        image_size = zbufs[0].image_size if crop is None else crop.size
+        rasterizer = renderer.MeshRasterizer(cameras=cameras, raster_settings=zbufs[0]._get_raster_settings(image_size))
+        zbuf = rasterizer(meshes).zbuf[..., 0]
+        return zbuf.reshape(len(zbufs), -1, *zbuf.shape[1:])
+
+    def get_crop(self, margin: int = 1) -> Crop:
+        """Returns the smallest tile, shared by all views, that covers the mesh in each view, plus <margin> pixels.
+
+        Every edge of the mesh is clipped to the near plane, so that the tile also covers faces that are only partly
+        in front of a camera.
+        """
+        with torch.no_grad():
+            position = self._mesh.nodes.position.detach()
+            edges = self._mesh.elements.triangles.long()[:, [[0, 1], [1, 2], [2, 0]]].reshape(-1, 2)
+            depth = self._cameras.get_world_to_view_transform().transform_points(position)[..., 2]
+            depth_start, depth_end = depth[:, edges[:, 0]], depth[:, edges[:, 1]]  # (views, num_edges)
+            visible = torch.maximum(depth_start, depth_end) >= self._znear
+            difference = depth_end - depth_start
+            ratio = ((self._znear - depth_start) / torch.where(difference == 0, 1.0, difference)).clamp(0, 1)
+            first = torch.where(depth_start < self._znear, ratio, 0.0)
+            last = torch.where(depth_end < self._znear, ratio, 1.0)
+            start, end = position[edges[:, 0]], position[edges[:, 1]]
+            points = torch.cat([start + first[..., None] * (end - start), start + last[..., None] * (end - start)], 1)
+            ndc = self._cameras.transform_points(points)[..., :2]  # (views, 2 * num_edges, 2)
+            visible = visible.repeat(1, 2)[..., None]
+            low = torch.where(visible, ndc, float("inf")).amin(dim=1).clamp(-1, 1)
+            high = torch.where(visible, ndc, -float("inf")).amax(dim=1).clamp(-1, 1)
+        # the pixel of row i and column j is centered on x = 1 - (2 * j + 1) / image_size and y = 1 - (2 * i + 1) / ...
+        first_pixel = (torch.floor((1 - high) * self.image_size / 2) - margin).long()
+        last_pixel = (torch.ceil((1 - low) * self.image_size / 2) + margin).long()
+        size = int((last_pixel - first_pixel).amax().clamp(1, self.image_size))
+        first_pixel = first_pixel.clamp(0, self.image_size - size)
+        return Crop(rows=first_pixel[:, 1], columns=first_pixel[:, 0], size=size)
+
+    def _get_static_zbuf(self, crop: Crop = None) -> torch.Tensor:
+        position = self._mesh.nodes.position
+        key = (position._version, self.image_size)
+        if self._static_zbuf is None or self._static_position is not position or self._static_key != key:
+            with torch.no_grad():
+                self._static_zbuf = self._rasterize([self])[0]
+            self._static_position, self._static_key = position, key
+        if crop is None:
+            return self._static_zbuf
+        # the tile of a crop holds the same pixels as the full image
+        pixels = torch.arange(crop.size, device=self._static_zbuf.device)
+        rows, columns = crop.rows[:, None] + pixels, crop.columns[:, None] + pixels
+        views = torch.arange(len(rows), device=self._static_zbuf.device)
+        return self._static_zbuf[views[:, None, None], rows[:, :, None], columns[:, None, :]]
+
     @cached_property
-    def _cameras(self):
-        cameras = []
-        for view in self._views:
-            cameras.append(
-                renderer.FoVPerspectiveCameras(
-                    R=view[0],
-                    T=view[1],
-                    znear=self._znear,
-                    zfar=self._zfar,
-                    fov=self._fov,
-                    device=self._device,
-                )
-            )
-        return cameras
+    def _rotation(self) -> torch.Tensor:
+        return torch.cat([view[0] for view in self._views])
+
+    @cached_property
+    def _translation(self) -> torch.Tensor:
+        return torch.cat([view[1] for view in self._views])
 
     @cached_property
-    def _rasterizers(self):
-        settings = renderer.RasterizationSettings(image_size=1000, blur_radius=0.0, faces_per_pixel=1, bin_size=0)
-        return [renderer.MeshRasterizer(cameras=camera, raster_settings=settings) for camera in self._cameras]
+    def _cameras(self):
+        return self._get_cameras(self._rotation, self._translation)
+
+    def _get_cameras(self, rotation: torch.Tensor, translation: torch.Tensor, crop: Crop = None):
+        cameras = renderer.FoVPerspectiveCameras(
+            R=rotation,
+            T=translation,
+            znear=self._znear,
+            zfar=self._zfar,
+            fov=self._fov,
+            device=self._device,
+        )
+        if crop is None:
+            return cameras
+        return renderer.FoVPerspectiveCameras(
+            R=rotation,
+            T=translation,
+            K=self._get_cropped_projection(cameras, crop),
+            znear=self._znear,
+            zfar=self._zfar,
+            fov=self._fov,
+            device=self._device,
+        )
+
+    def _get_cropped_projection(self, cameras: renderer.FoVPerspectiveCameras, crop: Crop) -> torch.Tensor:
+        """Returns the projection matrices that map the tile of <crop> to the whole NDC square."""
+        projection = cameras.compute_projection_matrix(
+            cameras.znear, cameras.zfar, cameras.fov, cameras.aspect_ratio, cameras.degrees
+        )
+        scale = crop.size / self.image_size
+        center_x = 1 - (2 * crop.columns + crop.size) / self.image_size
+        center_y = 1 - (2 * crop.rows + crop.size) / self.image_size
+        projection[:, 0, 0] = projection[:, 0, 0] / scale
+        projection[:, 1, 1] = projection[:, 1, 1] / scale
+        projection[:, 0, 2] = (projection[:, 0, 2] - center_x) / scale
+        projection[:, 1, 2] = (projection[:, 1, 2] - center_y) / scale
+        return projection
+
+    def _get_raster_settings(self, image_size: int) -> renderer.RasterizationSettings:
+        return renderer.RasterizationSettings(
+            image_size=image_size, blur_radius=0.0, faces_per_pixel=self._faces_per_pixel, bin_size=self._bin_size
+        )
@@ -1,25 +1,34 @@
 from attrs import define, field
 import sys
-from typing import List
+from typing import List, Tuple
 
 sys.path.append("src")
 
 from mesh.mesh import Mesh
+from mesh.mesh_properties import MeshProperties
 from warp.sim import Model
 from warp_wrapper.model_factory import ModelFactory
 from warp_wrapper.contact_properties import ContactProperties
-import copy
+from utils.validation import ValidationLevel, validation_level
 import warp as wp
+import torch
 
 wp.init()
 
 
 @define(slots=False)
 class Scene:
+    """The model simulates <num_envs> copies of the robot at once, see ModelFactory, each with its own material if
+    <envs_robot_properties> is given. The copies start from the robot nodes, or from the states given to
+    set_envs_initial_state. The robot nodes follow the first copy, while envs_nodes_position and envs_nodes_velocity
+    hold the nodes of every copy, of shape (num_envs, num_nodes, 3)."""
+
     robot: Mesh = field()
     device: str = field(default="cuda")
     contact_properties: ContactProperties = field(default=None)
     observers: List["SceneObserver"] = field(factory=list)
+    num_envs: int = field(default=1, kw_only=True)
+    envs_robot_properties: List[MeshProperties] = field(default=None, kw_only=True)
     model: Model = field(init=False)
 
     def add_observer(self, observer: "SceneObserver"):
@@ -32,23 +41,78 @@ class Scene:
             shape_meshes=None,
             contact_properties=self.contact_properties,
             device=self.device,
+            num_envs=self.num_envs,
+            envs_properties=self.envs_robot_properties,
         ).create()
 
     def all_meshes(self) -> List[Mesh]:
         return [self.robot]
 
     def __attrs_post_init__(self):
-        self._initial_robot_nodes = copy.deepcopy(self.robot.nodes)
-        self._initial_partilce_q = wp.clone(self.model.particle_q)
-        self._initial_partilce_qd = wp.clone(self.model.particle_qd)
+        self._envs_initial_position, self._envs_initial_velocity = None, None
+        self._envs_nodes_position, self._envs_nodes_velocity = None, None
+        self.snapshot()
+
+    def set_envs_initial_state(self, position: torch.Tensor, velocity: torch.Tensor = None):
+        """Starts the copies of the robot from <position> and <velocity>, of shape (num_envs, num_nodes, 3), the
+        velocity being zero if not given."""
+        shape = (self.num_envs, len(self.robot.nodes), 3)
+        if position.shape != shape:
+            raise ValueError(f"Expected <position> to be of shape {shape}, got {tuple(position.shape)}.")
+        if velocity is not None and velocity.shape != shape:
+            raise ValueError(f"Expected <velocity> to be of shape {shape}, got {tuple(velocity.shape)}.")
+        self._envs_initial_position = position.detach()
+        self._envs_initial_velocity = velocity.detach() if velocity is not None else torch.zeros_like(position)
+
+    def get_envs_initial_state(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        if self._envs_initial_position is not None:
+            return self._envs_initial_position.clone(), self._envs_initial_velocity.clone()
+        nodes = self.robot.nodes
+        return nodes.position.repeat(self.num_envs, 1, 1), nodes.velocity.repeat(self.num_envs, 1, 1)
+
+    def set_envs_nodes(self, position: torch.Tensor, velocity: torch.Tensor):
+        """Sets the nodes of every copy, and the robot nodes to those of the first one."""
+        self._envs_nodes_position, self._envs_nodes_velocity = position, velocity
+        self.robot.nodes.position, self.robot.nodes.velocity = position[0], velocity[0]
+
+    @property
+    def envs_nodes_position(self) -> torch.Tensor:
+        if self.num_envs == 1:
+            return self.robot.nodes.position[None]
+        if self._envs_nodes_position is None:
+            return self.get_envs_initial_state()[0]
+        return self._envs_nodes_position
+
+    @property
+    def envs_nodes_velocity(self) -> torch.Tensor:
+        if self.num_envs == 1:
+            return self.robot.nodes.velocity[None]
+        if self._envs_nodes_velocity is None:
+            return self.get_envs_initial_state()[1]
+        return self._envs_nodes_velocity
+
+    def snapshot(self):
+        """Keeps the current robot nodes as the state that reset restores. The nodes are restored into preallocated
+        buffers, so the tensors of the snapshot itself are never handed out. The particles of the model are not kept,
+        since the simulation copies the nodes into its own warp states at every segment."""
+        nodes = self.robot.nodes
+        self._initial_nodes = [tensor.detach().clone() for tensor in [nodes.position, nodes.velocity, nodes.force]]
+        self._nodes_buffers = [tensor.clone() for tensor in self._initial_nodes]
 
     def reset(self):
-        self.robot.nodes = copy.deepcopy(self._initial_robot_nodes)
-        self.model.particle_q = self._initial_partilce_q
-        self.model.particle_qd = self._initial_partilce_qd
+        """Restores the snapshot with in-place copies, and updates the pull ratios whose parameters changed."""
+        with torch.no_grad():
+            # the simulation makes the nodes it is given require grad, and so the buffers
+            for buffer, initial in zip(self._nodes_buffers, self._initial_nodes):
+                buffer.requires_grad_(False)
+                buffer.grad = None
+                buffer.copy_(initial)
+        nodes = self.robot.nodes
+        with validation_level(ValidationLevel.OFF):  # the buffers hold the validated snapshot
+            nodes.position, nodes.velocity, nodes.force = self._nodes_buffers
+        self._envs_nodes_position, self._envs_nodes_velocity = None, None
         for cable in self.robot.cables:
-            cable.pull_ratio.update_pull_ratio()
-            cable.pull_ratio.update_iterator()
+            cable.pull_ratio.update_pull_ratio_if_changed()
 
 
 @define
@@ -58,6 +122,8 @@ class GripperScene(Scene):
     contact_properties: ContactProperties = field()
     observers: List["SceneObserver"] = field(factory=list)
     device: str = field(default="cuda")
+    num_envs: int = field(default=1, kw_only=True)
+    envs_robot_properties: List[MeshProperties] = field(default=None, kw_only=True)
     model: Model = field(init=False)
 
     @model.default
@@ -67,6 +133,8 @@ class GripperScene(Scene):
             shape_meshes=[self.object],
             contact_properties=self.contact_properties,
             device=self.device,
+            num_envs=self.num_envs,
+            envs_properties=self.envs_robot_properties,
         ).create()
 
     def all_meshes(self) -> List[Mesh]:
@@ -81,6 +149,8 @@ class TouchScene(Scene):
     contact_properties: ContactProperties = field(default=None)
     observers: List["SceneObserver"] = field(factory=list)
     device: str = field(default="cuda")
+    num_envs: int = field(default=1, kw_only=True)
+    envs_robot_properties: List[MeshProperties] = field(default=None, kw_only=True)
     model: Model = field(init=False)
     robot_end_effector_idx: int = field(init=False)
 
@@ -94,6 +164,8 @@ class TouchScene(Scene):
             shape_meshes=self._shape_meshes(),
             contact_properties=self.contact_properties,
             device=self.device,
+            num_envs=self.num_envs,
+            envs_properties=self.envs_robot_properties,
         ).create()
 
     def _shape_meshes(self):
@@ -14,7 +14,7 @@ from os import PathLike
 from typing import List
 from mesh.mesh import Mesh
 from warp_wrapper.contact_properties import ContactProperties
-from attrs import define
+from attrs import define, field, evolve
 from abc import ABC, abstractmethod
 from cable.pull_ratio import PullRatio
 
@@ -32,11 +32,20 @@ class SceneFactory(ABC):
     device: str = "cuda"
     msh_file: PathLike = None
     make_new_robot: bool = True
+    num_envs: int = field(default=1, kw_only=True)
+    envs_youngs_modulus: List[float] = field(default=None, kw_only=True)
 
     @abstractmethod
     def create(self) -> Scene:
         pass
 
+    def _envs_robot_properties(self) -> List[MeshProperties]:
+        """Returns the robot properties of every environment, which differ in their Young's modulus if
+        <envs_youngs_modulus> is given."""
+        if self.envs_youngs_modulus is None:
+            return None
+        return [evolve(self.robot_properties, youngs_modulus=modulus) for modulus in self.envs_youngs_modulus]
+
     def _robot(self):
         if self.make_new_robot:
             mesh = MeshFactoryFromScad(self._scad(), self.ideal_edge_length, self.device).create()
@@ -96,6 +105,8 @@ class GripperSceneFactory(SceneFactory):
             object=self._object(),
             contact_properties=self.contact_properties,
             device=self.device,
+            num_envs=self.num_envs,
+            envs_robot_properties=self._envs_robot_properties(),
         )
 
     def _object(self):
@@ -129,6 +140,8 @@ class TouchSceneFactory(GripperSceneFactory):
             obstacles=self._obstacles(),
             contact_properties=self.contact_properties,
             device=self.device,
+            num_envs=self.num_envs,
+            envs_robot_properties=self._envs_robot_properties(),
         )
 
     def _obstacles(self) -> List[Mesh]:
@@ -156,7 +169,13 @@ class StarfishSceneFactory(SceneFactory):
     make_new_robot: bool = True
 
     def create(self) -> Scene:
-        return Scene(robot=self._robot(), contact_properties=self.contact_properties, device=self.device)
+        return Scene(
+            robot=self._robot(),
+            contact_properties=self.contact_properties,
+            device=self.device,
+            num_envs=self.num_envs,
+            envs_robot_properties=self._envs_robot_properties(),
+        )
 
     def _holes(self):
         holes_position = StarfishHolesInitialPosition(self._scad()).get()
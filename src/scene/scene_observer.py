@@ -32,7 +32,7 @@ class SceneImages(SceneObserver):
 
     def update(self) -> None:
         self._images = self._rendering.get_images()
-        self._mean_images.append(torch.stack(self._images).mean().item())
+        self._mean_images.append(self._images.mean().item())
         self._save_images(name=f"{self._name}")
         self._name += 1
 
@@ -71,6 +71,7 @@ class SceneViewer(SceneObserver):
         self._speed_factor = speed_factor
         self._time = 0.0
         self._segment_duration = simulation_properties.segment_duration
+        self._indices = {}
 
     def update(self):
         self._record_frame(time=self._time)
@@ -81,9 +82,13 @@ class SceneViewer(SceneObserver):
         with wp.ScopedTimer("render", print=False):
             self.usd.begin_frame(time / self._speed_factor)
             for mesh in self._scene.all_meshes():
+                # the renderer only reads the indices of the first frame, so they are copied to the host once
+                if mesh.properties.name not in self._indices:
+                    self._indices[mesh.properties.name] = mesh.elements.triangles.detach().cpu().numpy().flatten()
+                # the renderer writes host arrays to the stage, so the positions are copied every frame
                 self.usd.render_mesh(
                     name=mesh.properties.name,
                     points=mesh.nodes.position.detach().cpu().numpy(),
-                    indices=mesh.elements.triangles.detach().cpu().numpy().flatten(),
+                    indices=self._indices[mesh.properties.name],
                 )
             self.usd.end_frame()
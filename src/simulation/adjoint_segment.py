@@ -0,0 +1,74 @@
+import sys
+from typing import Callable, Tuple
+import torch
+
+sys.path.append("src")
+
+
+class AdjointSegment(torch.autograd.Function):
+    """Simulates the steps of a segment without recording them, and computes their gradient with the adjoint method.
+
+    Backward steps the adjoint of the nodes back in time along with the nodes themselves, which are recovered one step
+    at a time from the end of the segment by inverting the semi-implicit step, see integrate_particles of warp. Only
+    the boundaries of the segments are kept in memory.
+    """
+
+    @staticmethod
+    def forward(
+        ctx,
+        pull_ratio: torch.Tensor,  # (..., num_cables, num_steps)
+        position: torch.Tensor,
+        velocity: torch.Tensor,
+        step: Callable,
+        dt: float,
+        num_iterations: int,
+    ):
+        with torch.no_grad():
+            for step_pull_ratio in pull_ratio.unbind(dim=-1):
+                position, velocity = step(position, velocity, step_pull_ratio)
+        ctx.save_for_backward(pull_ratio, position, velocity)
+        ctx.step, ctx.dt, ctx.num_iterations = step, dt, num_iterations
+        return position, velocity
+
+    @staticmethod
+    def backward(ctx, grad_position, grad_velocity):
+        pull_ratio, position, velocity = ctx.saved_tensors
+        grad_pull_ratio = torch.zeros_like(pull_ratio)
+        for i in reversed(range(pull_ratio.shape[-1])):
+            position, velocity = AdjointSegment._invert_step(ctx, position, velocity, pull_ratio[..., i])
+            with torch.enable_grad():
+                inputs = [tensor.detach().requires_grad_() for tensor in (position, velocity, pull_ratio[..., i])]
+                outputs = ctx.step(*inputs)
+                grad_position, grad_velocity, grad_pull_ratio[..., i] = torch.autograd.grad(
+                    outputs, inputs, (grad_position, grad_velocity)
+                )
+        return grad_pull_ratio, grad_position, grad_velocity, None, None, None
+
+    @staticmethod
+    def _invert_step(ctx, position, velocity, pull_ratio) -> Tuple[torch.Tensor]:
+        """Returns the nodes before the step that ended at <position> and <velocity>. The step sets velocity to
+        previous_velocity + dt * acceleration(previous_position, previous_velocity) and position to
+        previous_position + dt * velocity, so the previous velocity is found by fixed-point iteration."""
+        previous_position = position - ctx.dt * velocity
+        previous_velocity = velocity
+        for _ in range(ctx.num_iterations):
+            _, stepped_velocity = ctx.step(previous_position, previous_velocity, pull_ratio)
+            previous_velocity = velocity - (stepped_velocity - previous_velocity)
+        return previous_position, previous_velocity
+
+
+class AdjointSegmentPositionAndVelocity:
+    """Simulates a segment with <step> and differentiates it with AdjointSegment, taking <num_iterations> steps to
+    invert each step during backward."""
+
+    def __init__(self, step: Callable, dt: float, num_iterations: int = 2):
+        self._step = step
+        self._dt = dt
+        self._num_iterations = num_iterations
+
+    def __call__(
+        self, nodes_position: torch.Tensor, nodes_velocity: torch.Tensor, pull_ratio: torch.Tensor
+    ) -> Tuple[torch.Tensor]:
+        """<pull_ratio> of shape (..., num_cables, num_steps) holds the pull ratio of each cable at every step."""
+        args = (pull_ratio, nodes_position, nodes_velocity, self._step, self._dt, self._num_iterations)
+        return AdjointSegment.apply(*args)
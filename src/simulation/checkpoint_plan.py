@@ -0,0 +1,79 @@
+from attrs import define, field
+from typing import List
+import sys
+
+sys.path.append("src")
+from simulation.simulation_properties import SimulationProperties
+
+
+@define
+class CheckpointPlan:
+    """Nested checkpointing of the steps of a segment.
+
+    Each level splits the chunks of the level above, or the segment for the first level, into checkpointed chunks of
+    <chunk_sizes>[level] steps. Only the inputs of the checkpointed chunks are stored, and the steps of a chunk are
+    recomputed once per level during backward. No levels means the segments are not checkpointed at all.
+    Memory is counted in states, where a state is either a stored chunk input or a step kept for backward.
+    """
+
+    chunk_sizes: List[int] = field()
+    peak_memory: int = field()
+    recompute_factor: int = field()  # number of times each step is simulated, including the first forward
+
+
+class CheckpointPlanFactory:
+    """Plans the checkpointing with the fewest recomputations whose peak memory fits in <memory_budget> states, or
+    follows the given <chunk_sizes>."""
+
+    def __init__(
+        self, simulation_properties: SimulationProperties, memory_budget: int = None, chunk_sizes: List[int] = None
+    ):
+        if (memory_budget is None) == (chunk_sizes is None):
+            raise ValueError("Expected exactly one of <memory_budget> and <chunk_sizes>.")
+        self._num_segments = simulation_properties.num_segments
+        self._num_steps_per_segment = simulation_properties.num_steps_per_segment
+        self._memory_budget = memory_budget
+        self._chunk_sizes = chunk_sizes
+
+    def create(self) -> CheckpointPlan:
+        if self._chunk_sizes is not None:
+            return self._get_plan(self._chunk_sizes) if self._chunk_sizes else self._get_plan_without_checkpoint()
+        plans = self._get_plans_with_checkpoint()
+        plans.append(self._get_plan_without_checkpoint())
+        plans = [plan for plan in plans if plan.peak_memory <= self._memory_budget]
+        if not plans:
+            raise ValueError(f"Expected <memory_budget> to be at least {self._get_min_peak_memory()} states.")
+        return min(plans, key=lambda plan: (plan.recompute_factor, plan.peak_memory))
+
+    def _get_plan(self, chunk_sizes: List[int]) -> CheckpointPlan:
+        stored = sum(outer // inner for outer, inner in zip(chunk_sizes[:-1], chunk_sizes[1:]))
+        return CheckpointPlan(
+            chunk_sizes=chunk_sizes,
+            peak_memory=self._num_segments * (self._num_steps_per_segment // chunk_sizes[0]) + stored + chunk_sizes[-1],
+            recompute_factor=len(chunk_sizes) + 1,
+        )
+
+    def _get_plan_without_checkpoint(self) -> CheckpointPlan:
+        num_steps = self._num_segments * self._num_steps_per_segment
+        return CheckpointPlan(chunk_sizes=[], peak_memory=num_steps, recompute_factor=1)
+
+    def _get_min_peak_memory(self) -> int:
+        return min(plan.peak_memory for plan in self._get_plans_with_checkpoint())
+
+    def _get_plans_with_checkpoint(self) -> List[CheckpointPlan]:
+        num_steps = self._num_steps_per_segment
+        first_chunk_sizes = [divisor for divisor in range(1, num_steps + 1) if num_steps % divisor == 0]
+        return [
+            self._get_plan(chunk_sizes)
+            for first_chunk_size in first_chunk_sizes
+            for chunk_sizes in self._get_chunk_sizes(first_chunk_size)
+        ]
+
+    @classmethod
+    def _get_chunk_sizes(cls, num_steps: int) -> List[List[int]]:
+        """Returns every chain of chunk sizes that starts at <num_steps> and where each size divides the one before."""
+        chains = [[num_steps]]
+        for divisor in range(1, num_steps):
+            if num_steps % divisor == 0:
+                chains.extend([num_steps] + chain for chain in cls._get_chunk_sizes(divisor))
+        return chains
@@ -8,48 +8,120 @@ from scene.scene import Scene
 from simulation.update_holes import HolesForce, HolesPositionAndVelocity
 from simulation.update_nodes import NodesForce, NodesPositionAndVelocity
 from simulation.simulation_properties import SimulationProperties
+from simulation.update_segment import SegmentPositionAndVelocity
+from simulation.checkpoint_plan import CheckpointPlanFactory
+from simulation.adjoint_segment import AdjointSegmentPositionAndVelocity
 from cable.barycentric_factory import BarycentricListFactory
 
 
 class Simulation(torch.nn.Module):
-    def __init__(self, scene: Scene, properties: SimulationProperties, use_checkpoint: bool = True):
+    """Simulates the scene one segment at a time, either step by step with torch ops between warp steps when <backend>
+    is torch, or with the whole segment recorded on one warp tape when <backend> is warp. The warp backend can replay
+    the segment as a captured CUDA graph with <use_graph>.
+
+    Segments are checkpointed as a whole if <use_checkpoint>, unless a <memory_budget> in states is given, in which
+    case <checkpoint_plan> nests checkpoints within the segments so as to fit in it. With <use_adjoint>, segments are
+    differentiated with the adjoint method instead, which only keeps their boundaries in memory, and there is no
+    <checkpoint_plan>.
+    """
+
+    def __init__(
+        self,
+        scene: Scene,
+        properties: SimulationProperties,
+        use_checkpoint: bool = True,
+        backend: str = "torch",
+        use_graph: bool = False,
+        memory_budget: int = None,
+        use_adjoint: bool = False,
+    ):
         super().__init__()
+        if backend not in ("torch", "warp"):
+            raise ValueError(f"Expected <backend> to be either torch or warp, got {backend}.")
+        if use_graph and backend != "warp":
+            raise ValueError("Expected <backend> to be warp when <use_graph> is True.")
+        if use_adjoint and (backend != "torch" or memory_budget is not None):
+            raise ValueError("Expected <backend> to be torch and no <memory_budget> when <use_adjoint> is True.")
         self.free_memory = []
         self.properties = properties
         holes = [cable.holes for cable in scene.robot.cables]
         self._barycentrics = BarycentricListFactory(scene.robot, holes, properties.device).create()
-        self._use_checkpoint = use_checkpoint
+        self.checkpoint_plan = None
+        if not use_adjoint:
+            self.checkpoint_plan = CheckpointPlanFactory(
+                properties,
+                memory_budget=memory_budget,
+                chunk_sizes=None if memory_budget is not None else [properties.num_steps_per_segment] * use_checkpoint,
+            ).create()
+        chunk_sizes = self.checkpoint_plan.chunk_sizes if self.checkpoint_plan is not None else []
+        num_steps_per_chunk = chunk_sizes[-1] if chunk_sizes else properties.num_steps_per_segment
+        self._cables = scene.robot.cables
         # functions
         self._holes_position_and_velocity = HolesPositionAndVelocity(barycentrics=self._barycentrics)
         self._holes_force = HolesForce(cables=scene.robot.cables, device=properties.device)
         self._nodes_force = NodesForce(barycentrics=self._barycentrics)
-        self._nodes_position_and_velocity = NodesPositionAndVelocity(model=scene.model, dt=properties.dt)
-
-    def forward(self, nodes_position, nodes_velocity):
-        def segment(nodes_position, nodes_velocity, num_steps):
-            for _ in range(num_steps):
-                nodes_position, nodes_velocity = self.step(nodes_position, nodes_velocity)
-            return nodes_position, nodes_velocity
+        # the warp backend simulates segments with its own pool, so only the torch backend steps through this one
+        pool_size = num_steps_per_chunk if chunk_sizes and backend == "torch" else 0
+        self._nodes_position_and_velocity = NodesPositionAndVelocity(
+            model=scene.model, dt=properties.dt, pool_size=pool_size
+        )
+        if backend == "warp":
+            self._segment = SegmentPositionAndVelocity(
+                model=scene.model,
+                cables=scene.robot.cables,
+                barycentrics=self._barycentrics,
+                dt=properties.dt,
+                num_steps=num_steps_per_chunk,
+                use_graph=use_graph,
+            )
+        elif use_adjoint:
+            self._segment = AdjointSegmentPositionAndVelocity(step=self.step, dt=properties.dt)
+        else:
+            self._segment = self._step_through_segment
 
+    def forward(self, nodes_position, nodes_velocity, segment_index):
+        """Simulates one segment of nodes of shape (num_nodes, 3), or (num_envs, num_nodes, 3) for scenes with several
+        environments."""
         self._append_free_memory()
         nodes_position.requires_grad_()
         nodes_velocity.requires_grad_()
-        if self._use_checkpoint:
-            nodes_position, nodes_velocity = checkpoint(
-                segment, nodes_position, nodes_velocity, self.properties.num_steps_per_segment
-            )
+        pull_ratio = self._get_pull_ratio(segment_index)
+        if self.checkpoint_plan is None:
+            nodes_position, nodes_velocity = self._segment(nodes_position, nodes_velocity, pull_ratio)
         else:
-            nodes_position, nodes_velocity = segment(
-                nodes_position, nodes_velocity, self.properties.num_steps_per_segment
-            )
+            nodes_position, nodes_velocity = self._simulate_chunks(0, nodes_position, nodes_velocity, pull_ratio)
         self._append_free_memory()
         return nodes_position, nodes_velocity
 
-    def step(self, nodes_position, nodes_velocity):
+    def _simulate_chunks(self, level, nodes_position, nodes_velocity, pull_ratio):
+        """Simulates the steps of <pull_ratio> in checkpointed chunks of the given level of the checkpoint plan."""
+        if level == len(self.checkpoint_plan.chunk_sizes):
+            return self._segment(nodes_position, nodes_velocity, pull_ratio)
+        for chunk_pull_ratio in pull_ratio.split(self.checkpoint_plan.chunk_sizes[level], dim=-1):
+            nodes_position, nodes_velocity = checkpoint(
+                self._simulate_chunks, level + 1, nodes_position, nodes_velocity, chunk_pull_ratio
+            )
+        return nodes_position, nodes_velocity
+
+    def _step_through_segment(self, nodes_position, nodes_velocity, pull_ratio):
+        for step_pull_ratio in pull_ratio.unbind(dim=-1):
+            nodes_position, nodes_velocity = self.step(nodes_position, nodes_velocity, step_pull_ratio)
+        return nodes_position, nodes_velocity
+
+    def step(self, nodes_position, nodes_velocity, pull_ratio):
         holes_position, holes_velocity = self._holes_position_and_velocity(nodes_position, nodes_velocity)
-        holes_force = self._holes_force(holes_position, holes_velocity)
+        holes_force = self._holes_force(holes_position, holes_velocity, pull_ratio)
         nodes_force = self._nodes_force(holes_force)
         return self._nodes_position_and_velocity(nodes_force, nodes_position, nodes_velocity)
 
+    def _get_pull_ratio(self, segment_index):
+        """Returns the pull ratio of every cable at every step of the segment, of shape (num_cables, num_steps), or
+        (num_envs, num_cables, num_steps) if any pull ratio holds one schedule per environment."""
+        first_step = segment_index * self.properties.num_steps_per_segment
+        last_step = first_step + self.properties.num_steps_per_segment
+        pull_ratio = [cable.pull_ratio.pull_ratio[..., first_step:last_step] for cable in self._cables]
+        return torch.stack(torch.broadcast_tensors(*pull_ratio), dim=-2)
+
     def _append_free_memory(self):
-        self.free_memory.append(torch.cuda.mem_get_info()[0] / (1024 * 1024 * 1024))
+        if torch.cuda.is_available():
+            self.free_memory.append(torch.cuda.mem_get_info()[0] / (1024 * 1024 * 1024))
@@ -1,39 +1,43 @@
 import sys
 import torch
+import torch.nn.functional as F
 
 sys.path.append("src")
-from typing import List
+from typing import List, Tuple
 
 from cable.cable import Cable
 from cable.barycentric import Barycentric
 
 
 class HolesForce:
+    """Cable forces on the holes of all cables, packed one cable after another along dim 0."""
+
     def __init__(self, cables: List[Cable], device: str = "cuda"):
         self._device = device
-        self._cables = cables
-
-    def __call__(self, holes_positions: List[torch.Tensor], holes_velocities: List[torch.Tensor]) -> List[torch.Tensor]:
-        holes_forces = []
-        for holes_position, holes_velocity, cable in zip(holes_positions, holes_velocities, self._cables):
-            force = torch.zeros(holes_position.shape, dtype=torch.float32, device=self._device)
-            tangent_vector_pointing_to_the_tip = holes_position[1:] - holes_position[:-1]
-            f = -next(cable.pull_ratio.iterator) * cable.stiffness * tangent_vector_pointing_to_the_tip
-            g = cable.damping * holes_velocity
-            force[0] = -f[0] - g[0]
-            force[1:-1] = f[:-1] - f[1:] - g[1:-1]
-            force[-1] = f[-1] - g[-1]
-            holes_forces.append(force)
-        return holes_forces
+        num_holes = torch.tensor([len(cable.holes) for cable in cables], device=device)
+        cable_of_hole = torch.repeat_interleave(torch.arange(len(cables), device=device), num_holes)
+        is_segment = cable_of_hole[1:] == cable_of_hole[:-1]  # False between the last and first hole of two cables
+        stiffness = torch.tensor([cable.stiffness for cable in cables], dtype=torch.float32, device=device)
+        damping = torch.tensor([cable.damping for cable in cables], dtype=torch.float32, device=device)
+        self.segment_cable = cable_of_hole[:-1]
+        self.segment_stiffness = (stiffness[self.segment_cable] * is_segment)[:, None]
+        self.holes_damping = damping[cable_of_hole][:, None]
+
+    def __call__(
+        self, holes_position: torch.Tensor, holes_velocity: torch.Tensor, pull_ratio: torch.Tensor
+    ) -> torch.Tensor:
+        """<pull_ratio> of shape (..., num_cables) holds the pull ratio of each cable at the current step, with the same
+        leading dims as <holes_position> of shape (..., num_holes, 3)."""
+        tangent_vector_pointing_to_the_tip = holes_position[..., 1:, :] - holes_position[..., :-1, :]
+        f = -pull_ratio[..., self.segment_cable, None] * self.segment_stiffness * tangent_vector_pointing_to_the_tip
+        g = self.holes_damping * holes_velocity
+        return F.pad(f, (0, 0, 1, 0)) - F.pad(f, (0, 0, 0, 1)) - g
 
 
 class HolesPositionAndVelocity:
     def __init__(self, barycentrics: List[Barycentric]):
-        self._barycentrics = barycentrics
-
-    def __call__(self, nodes_position: torch.Tensor, nodes_velocity: torch.Tensor):
-        holes_positions, holes_velocities = [], []
-        for barycentric in self._barycentrics:
-            holes_positions.append(barycentric.HxN @ nodes_position)
-            holes_velocities.append(barycentric.HxN @ nodes_velocity)
-        return holes_positions, holes_velocities
+        self._barycentric = Barycentric.concatenate(barycentrics)
+
+    def __call__(self, nodes_position: torch.Tensor, nodes_velocity: torch.Tensor) -> Tuple[torch.Tensor]:
+        holes_position_and_velocity = self._barycentric.interpolate(torch.cat([nodes_position, nodes_velocity], dim=-1))
+        return holes_position_and_velocity.split(nodes_position.shape[-1], dim=-1)
@@ -5,35 +5,36 @@ import torch
 sys.path.append("src")
 
 from warp_wrapper.update_state import UpdateState
+from warp_wrapper.state_pool import StatePool
 from warp.sim import Model
 from cable.barycentric import Barycentric
 
 
 class NodesForce:
     def __init__(self, barycentrics: List[Barycentric]):
-        self._barycentrics = barycentrics
+        self._barycentric = Barycentric.concatenate(barycentrics)
 
-    def __call__(self, holes_forces: List[torch.Tensor]) -> torch.Tensor:
-        nodes_forces = []
-        for barycentric, holes_force in zip(self._barycentrics, holes_forces):
-            x = barycentric.NxH @ holes_force
-            nodes_forces.append(x)
-        return torch.stack(nodes_forces).sum(dim=0)
+    def __call__(self, holes_force: torch.Tensor) -> torch.Tensor:
+        return self._barycentric.spread(holes_force)
 
 
 class NodesPositionAndVelocity:
-    def __init__(self, model: Model, dt: float):
-        self._model = model
+    def __init__(self, model: Model, dt: float, pool_size: int = 0):
+        self._pool = StatePool(model, size=pool_size)
         self._dt = dt
 
     def __call__(
         self, nodes_force: torch.Tensor, nodes_position: torch.Tensor, nodes_velocity: torch.Tensor
     ) -> Tuple[torch.Tensor]:
+        requires_grad = torch.is_grad_enabled() and any(
+            tensor.requires_grad for tensor in (nodes_force, nodes_position, nodes_velocity)
+        )
         args = (
             nodes_force,
             nodes_position,
             nodes_velocity,
-            self._model,
+            self._pool,
             self._dt,
+            requires_grad,
         )
         return UpdateState.apply(*args)
@@ -13,6 +13,8 @@ class UpdateScene:
         self._simulation = simulation
 
     def update_scene(self):
+        if self._scene.num_envs > 1:
+            self._scene.set_envs_nodes(*self._scene.get_envs_initial_state())
         for self.i in tqdm.tqdm(
             range(self._simulation.properties.num_segments),
             "Simulation",
@@ -24,9 +26,13 @@ class UpdateScene:
             self._notify_observers() if self._is_last_segment() else None
 
     def _update_one_segment(self) -> None:
-        self._scene.robot.nodes.position, self._scene.robot.nodes.velocity = self._simulation(
-            self._scene.robot.nodes.position, self._scene.robot.nodes.velocity
-        )
+        if self._scene.num_envs == 1:
+            self._scene.robot.nodes.position, self._scene.robot.nodes.velocity = self._simulation(
+                self._scene.robot.nodes.position, self._scene.robot.nodes.velocity, self.i
+            )
+            return
+        position, velocity = self._simulation(self._scene.envs_nodes_position, self._scene.envs_nodes_velocity, self.i)
+        self._scene.set_envs_nodes(position, velocity)
 
     def _notify_observers(self) -> None:
         for obs in self._scene.observers:
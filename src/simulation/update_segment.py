@@ -0,0 +1,73 @@
+import sys
+from functools import partial
+from typing import List, Tuple
+import torch
+import torch.nn.functional as F
+import warp as wp
+from warp.sim import Model
+
+sys.path.append("src")
+
+from cable.cable import Cable
+from cable.barycentric import Barycentric
+from simulation.update_holes import HolesForce
+from warp_wrapper.state_pool import StatePool
+from warp_wrapper.update_segment import CableArrays, SegmentBuffers, UpdateSegment
+
+
+class SegmentPositionAndVelocity:
+    """Simulates a whole segment with warp kernels, as the warp counterpart of stepping HolesPositionAndVelocity,
+    HolesForce, NodesForce and NodesPositionAndVelocity one step at a time.
+
+    With <use_graph>, segments replay captured CUDA graphs. On CPU, where there is nothing to capture, they run eagerly.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        cables: List[Cable],
+        barycentrics: List[Barycentric],
+        dt: float,
+        num_steps: int,
+        use_graph: bool = False,
+    ):
+        self._cables = self._get_cable_arrays(cables, Barycentric.concatenate(barycentrics), model.device)
+        self._num_envs = model.particle_count // self._cables.num_nodes
+        create_buffers = partial(
+            SegmentBuffers,
+            cables=self._cables,
+            num_steps=num_steps,
+            use_graph=use_graph and str(model.device).startswith("cuda"),
+        )
+        self._pool = StatePool(model, create_buffers=create_buffers)
+        self._dt = dt
+
+    def __call__(
+        self, nodes_position: torch.Tensor, nodes_velocity: torch.Tensor, pull_ratio: torch.Tensor
+    ) -> Tuple[torch.Tensor]:
+        """<pull_ratio> of shape (..., num_cables, num_steps) holds the pull ratio of each cable at every step."""
+        requires_grad = torch.is_grad_enabled() and any(
+            tensor.requires_grad for tensor in (pull_ratio, nodes_position, nodes_velocity)
+        )
+        pull_ratio = pull_ratio.expand(self._num_envs, *pull_ratio.shape[-2:])
+        args = (pull_ratio, nodes_position, nodes_velocity, self._pool, self._cables, self._dt, requires_grad)
+        return UpdateSegment.apply(*args)
+
+    @staticmethod
+    def _get_cable_arrays(cables: List[Cable], barycentric: Barycentric, device: str) -> CableArrays:
+        holes_force = HolesForce(cables, device=device)
+        return CableArrays(
+            indices=_to_array(barycentric.indices.int(), dtype=wp.int32, device=device),
+            weights=_to_array(barycentric.weights, dtype=float, device=device),
+            gram_pinv=_to_array(barycentric.gram_pinv, dtype=float, device=device),
+            segment_cable=_to_array(F.pad(holes_force.segment_cable.int(), (0, 1)), dtype=wp.int32, device=device),
+            segment_stiffness=_to_array(F.pad(holes_force.segment_stiffness[:, 0], (0, 1)), dtype=float, device=device),
+            holes_damping=_to_array(holes_force.holes_damping[:, 0], dtype=float, device=device),
+            num_cables=len(cables),
+            num_nodes=barycentric.num_nodes,
+        )
+
+
+def _to_array(tensor: torch.Tensor, dtype, device: str) -> wp.array:
+    """Copies a tensor that needs no gradient to a warp array."""
+    return wp.array(tensor.detach().cpu().numpy(), dtype=dtype, device=device)
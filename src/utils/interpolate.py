@@ -1,5 +1,4 @@
 import torch
-from typing import List
 
 
 def linear_interpolate_between_two_points(x0, x1, y0, y1, x) -> torch.Tensor:
@@ -7,11 +6,54 @@ def linear_interpolate_between_two_points(x0, x1, y0, y1, x) -> torch.Tensor:
     return torch.lerp(y0, y1, weight=weight)
 
 
-def linear_interpolate(xs, ys, x) -> List[torch.Tensor]:
-    out = []
-    for i in range(len(xs) - 1):
-        mask = (x >= xs[i]) & (x < xs[i + 1])
-        for xi in x[mask]:
-            linear = linear_interpolate_between_two_points(xs[i], xs[i + 1], ys[i], ys[i + 1], xi)
-            out.append(linear)
-    return out
+def linear_interpolate(xs: torch.Tensor, ys: torch.Tensor, x: torch.Tensor) -> torch.Tensor:
+    """Piecewise linear interpolation of (xs, ys) evaluated at every entry of x. See <interpolate>."""
+    return interpolate(xs, ys, x, mode="linear")
+
+
+def interpolate(xs: torch.Tensor, ys: torch.Tensor, x: torch.Tensor, mode: str = "linear") -> torch.Tensor:
+    """Piecewise interpolation of (xs, ys) evaluated at every entry of x.
+
+    xs of shape (K,) must be strictly increasing. ys of shape (..., K) may hold a batch of curves sampled at xs, and
+    the output is of shape (..., len(x)). <mode> is one of
+        "linear": straight lines between the knots,
+        "cubic": cubic Hermite spline with finite-difference tangents, smooth but may overshoot the knots,
+        "monotone": cubic Hermite spline with Fritsch-Carlson tangents, which never overshoots the knots.
+    Values of x outside [xs[0], xs[-1]] are extrapolated from the first or last interval.
+    """
+    if mode not in ("linear", "cubic", "monotone"):
+        raise ValueError(f"Expected <mode> to be one of linear, cubic or monotone, got {mode}.")
+    i = (torch.searchsorted(xs, x, right=True) - 1).clamp(min=0, max=len(xs) - 2)
+    if mode == "linear":
+        return linear_interpolate_between_two_points(xs[i], xs[i + 1], ys[..., i], ys[..., i + 1], x)
+    h = torch.diff(xs).to(dtype=ys.dtype)
+    tangents = _get_cubic_tangents(h, ys) if mode == "cubic" else _get_monotone_tangents(h, ys)
+    t = ((x - xs[i]) / (xs[i + 1] - xs[i])).to(dtype=ys.dtype)
+    h00 = (1 + 2 * t) * (1 - t) ** 2
+    h10 = t * (1 - t) ** 2
+    h01 = t**2 * (3 - 2 * t)
+    h11 = t**2 * (t - 1)
+    return (
+        h00 * ys[..., i]
+        + h10 * h[i] * tangents[..., i]
+        + h01 * ys[..., i + 1]
+        + h11 * h[i] * tangents[..., i + 1]
+    )
+
+
+def _get_cubic_tangents(h, ys):
+    slope = torch.diff(ys, dim=-1) / h
+    interior = (ys[..., 2:] - ys[..., :-2]) / (h[1:] + h[:-1])
+    return torch.cat([slope[..., :1], interior, slope[..., -1:]], dim=-1)
+
+
+def _get_monotone_tangents(h, ys):
+    slope = torch.diff(ys, dim=-1) / h
+    left, right = slope[..., :-1], slope[..., 1:]
+    same_sign = left * right > 0
+    # weighted harmonic mean of the neighbouring slopes, zero at local extrema and flat intervals
+    w_left, w_right = 2 * h[1:] + h[:-1], h[1:] + 2 * h[:-1]
+    safe_left = torch.where(same_sign, left, torch.ones_like(left))
+    safe_right = torch.where(same_sign, right, torch.ones_like(right))
+    interior = torch.where(same_sign, (w_left + w_right) / (w_left / safe_left + w_right / safe_right), 0.0)
+    return torch.cat([slope[..., :1], interior, slope[..., -1:]], dim=-1)
@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from enum import Enum
+
+
+class ValidationLevel(Enum):
+    FULL = "full"  # every check, including those reading tensor values, which sync with the device
+    SHAPE = "shape"  # only checks of type, shape and dtype
+    OFF = "off"
+
+
+_level = ValidationLevel.FULL
+
+
+def get_validation_level() -> ValidationLevel:
+    return _level
+
+
+def set_validation_level(level) -> None:
+    """Sets how thoroughly Points, Elements and Mesh check the tensors they are given, <level> being a ValidationLevel
+    or its value."""
+    global _level
+    _level = ValidationLevel(level)
+
+
+@contextmanager
+def validation_level(level):
+    previous = get_validation_level()
+    set_validation_level(level)
+    try:
+        yield
+    finally:
+        set_validation_level(previous)
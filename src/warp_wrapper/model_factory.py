@@ -6,24 +6,36 @@ import sys
 
 sys.path.append("src")
 from mesh.mesh import Mesh
+from mesh.mesh_properties import MeshProperties
 from typing import List
 from warp_wrapper.contact_properties import ContactProperties
+from warp_wrapper.shared_mesh import SharedShapeMesh
 
 wp.init()
 
 
 class ModelFactory:
+    """Builds a warp model holding <num_envs> copies of <soft_mesh>, one after another along the particles, that share
+    the static <shape_meshes>. The copies do not interact with each other. Each copy takes its material and frozen
+    bounding box from its entry of <envs_properties>, or from the properties of <soft_mesh> if not given."""
+
     def __init__(
         self,
         soft_mesh: Mesh = None,
         shape_meshes: List[Mesh] = None,
         contact_properties: ContactProperties = None,
         device: str = "cuda",
+        num_envs: int = 1,
+        envs_properties: List[MeshProperties] = None,
     ):
+        if envs_properties is not None and len(envs_properties) != num_envs:
+            raise ValueError(f"Expected <envs_properties> to be of length {num_envs}, got {len(envs_properties)}.")
         self._soft_mesh = soft_mesh
         self._shape_meshes = shape_meshes
         self._contact_properties = contact_properties
         self._device = device
+        self._num_envs = num_envs
+        self._envs_properties = envs_properties
 
     def create(self) -> Model:
         builder: ModelBuilder = wp.sim.ModelBuilder()
@@ -35,50 +47,58 @@ class ModelFactory:
         model.contact_properties = self._contact_properties
         return model
 
+    def _get_envs_properties(self) -> List[MeshProperties]:
+        if self._envs_properties is not None:
+            return self._envs_properties
+        return [self._soft_mesh.properties] * self._num_envs
+
     def _add_soft_mesh(self, builder: ModelBuilder):
-        properties = self._soft_mesh.properties
-        k_lambda, k_mu = wp.utils.lame_parameters(properties.youngs_modulus, properties.poissons_ratio)
-        builder.add_soft_mesh(
-            pos=np.array([0, 0, 0]),
-            rot=np.array([0, 0, 0, 1]),
-            scale=1,
-            vel=[0, 0, 0],
-            vertices=self._soft_mesh.nodes.position.detach().cpu().numpy(),
-            indices=self._soft_mesh.elements.tetrahedra.cpu().numpy().reshape(-1),
-            density=properties.density,
-            k_mu=k_mu,
-            k_lambda=k_lambda,
-            k_damp=properties.damping_factor,
-        )
+        # the builder of warp keeps the particles on the host, so they are copied there once for all copies
+        vertices = self._soft_mesh.nodes.position.detach().cpu().numpy()
+        indices = self._soft_mesh.elements.tetrahedra.cpu().numpy().reshape(-1)
+        for properties in self._get_envs_properties():
+            k_lambda, k_mu = wp.utils.lame_parameters(properties.youngs_modulus, properties.poissons_ratio)
+            builder.add_soft_mesh(
+                pos=np.array([0, 0, 0]),
+                rot=np.array([0, 0, 0, 1]),
+                scale=1,
+                vel=[0, 0, 0],
+                vertices=vertices,
+                indices=indices,
+                density=properties.density,
+                k_mu=k_mu,
+                k_lambda=k_lambda,
+                k_damp=properties.damping_factor,
+            )
         self._apply_boundary_conditions(builder)
         self._set_soft_mesh_triangles(builder)
 
     def _apply_boundary_conditions(self, builder: ModelBuilder):
         builder.particle_mass = torch.tensor(builder.particle_mass, device=self._device)
-        mask = self._is_inside_frozen_bounding_box(self._soft_mesh)
+        points = self._soft_mesh.nodes.position
+        mask = torch.cat(
+            [
+                self._is_inside_frozen_bounding_box(points, properties.frozen_bounding_box)
+                for properties in self._get_envs_properties()
+            ]
+        )
         builder.particle_mass[mask] = 0.0
         builder.particle_mass = builder.particle_mass.tolist()
 
     @staticmethod
-    def _is_inside_frozen_bounding_box(soft_mesh: Mesh):
-        frozen_bounding_box = soft_mesh.properties.frozen_bounding_box
-        points = soft_mesh.nodes.position
+    def _is_inside_frozen_bounding_box(points: torch.Tensor, frozen_bounding_box: list):
         bounding_box_min, bounding_box_max = torch.tensor(frozen_bounding_box, device=points.device).reshape(2, 3)
         return torch.all((bounding_box_min <= points) & (points <= bounding_box_max), dim=1)
 
     def _set_soft_mesh_triangles(self, builder: ModelBuilder):
-        self._soft_mesh.elements.triangles = torch.tensor(builder.tri_indices, device=self._device, dtype=torch.int32)
+        num_triangles = len(builder.tri_indices) // self._num_envs  # the copies share the triangles of the first one
+        self._soft_mesh.elements.triangles = torch.tensor(
+            builder.tri_indices[:num_triangles], device=self._device, dtype=torch.int32
+        )
 
     def _add_shape_meshes(self, builder: ModelBuilder):
         for shape_mesh in self._shape_meshes:
-            builder.add_shape_mesh(
-                body=-1,
-                mesh=wp.sim.Mesh(
-                    shape_mesh.nodes.position.detach().cpu().numpy(),
-                    shape_mesh.elements.triangles.cpu().numpy().reshape(-1),
-                ),
-                density=shape_mesh.properties.density,
-            )
+            builder.add_shape_mesh(body=-1, mesh=SharedShapeMesh(shape_mesh), density=shape_mesh.properties.density)
 
     def _update_model_attributes(self, model: Model):
         model.tri_ke, model.tri_ka, model.tri_kd, model.tri_kb = 0.0, 0.0, 0.0, 0.0
@@ -0,0 +1,44 @@
+import numpy as np
+import torch
+import warp as wp
+import warp.sim
+import sys
+
+sys.path.append("src")
+from mesh.mesh import Mesh
+
+wp.init()
+
+
+def get_warp_points(mesh: Mesh, device: str) -> wp.array:
+    """Returns the nodes position of <mesh> as a warp array of vec3, which shares memory with the tensor when it is
+    contiguous and already on <device>."""
+    return wp.from_torch(mesh.nodes.position.detach().to(device).contiguous(), dtype=wp.vec3)
+
+
+def get_warp_triangles(mesh: Mesh, device: str) -> wp.array:
+    """Returns the flattened triangles of <mesh> as a warp array, sharing memory with the tensor like get_warp_points."""
+    return wp.from_torch(mesh.elements.triangles.to(device).contiguous().reshape(-1), dtype=wp.int32)
+
+
+class SharedShapeMesh(wp.sim.Mesh):
+    """Collision mesh of a static shape whose warp points and indices share memory with the nodes and triangles of
+    <mesh>, instead of being copied to the host and back when the model is built. In-place changes of the nodes show
+    up in the warp mesh after a refit. The mass and inertia are zero, which only matters for shapes on a body.
+
+    Only shape meshes share memory: the soft mesh is still copied to the host by the ModelBuilder of warp, and its
+    simulated state lives in separate warp arrays."""
+
+    def __init__(self, mesh: Mesh):
+        super().__init__(vertices=None, indices=None, compute_inertia=False)
+        self._shape_mesh = mesh
+        self.mass = 0.0
+        self.com = np.zeros(3)
+        self.I = np.zeros((3, 3))
+
+    def finalize(self, device):
+        points = get_warp_points(self._shape_mesh, device)
+        self.mesh = wp.Mesh(
+            points=points, velocities=wp.zeros_like(points), indices=get_warp_triangles(self._shape_mesh, device)
+        )
+        return self.mesh.id
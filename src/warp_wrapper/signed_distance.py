@@ -0,0 +1,85 @@
+import torch
+import torch.nn.functional as F
+import warp as wp
+from attrs import define, field
+import sys
+
+sys.path.append("src")
+from mesh.mesh import Mesh
+from warp_wrapper.shared_mesh import get_warp_points, get_warp_triangles
+
+wp.init()
+
+
+@define
+class SignedDistanceGrid:
+    """Signed distance to a static mesh sampled on a regular grid spanning <lower> to <upper>, negative inside the
+    mesh. Calling it interpolates the distance trilinearly, which is differentiable with respect to the points. Points
+    outside of the grid get the distance of the closest grid boundary."""
+
+    values: torch.Tensor = field()  # (resolution, resolution, resolution), indexed by x, y, z
+    lower: torch.Tensor = field()  # (3,)
+    upper: torch.Tensor = field()  # (3,)
+
+    def __call__(self, points: torch.Tensor) -> torch.Tensor:
+        """Returns the signed distance of <points> of shape (..., 3)."""
+        grid = 2 * (points - self.lower) / (self.upper - self.lower) - 1
+        # grid_sample takes (x, y, z) coordinates for a volume indexed by (z, y, x)
+        volume = self.values.permute(2, 1, 0)[None, None]
+        distance = F.grid_sample(
+            volume, grid.reshape(1, 1, 1, -1, 3), mode="bilinear", padding_mode="border", align_corners=True
+        )
+        return distance.reshape(points.shape[:-1])
+
+
+class SignedDistanceGridFactory:
+    """Samples the signed distance to <mesh> on a grid of <resolution> nodes per side, spanning the bounding box of the
+    mesh enlarged by <padding> times its size on every side. The triangles of the mesh must face outwards."""
+
+    def __init__(self, mesh: Mesh, resolution: int = 64, padding: float = 0.1, device: str = "cuda"):
+        self._mesh = mesh
+        self._resolution = resolution
+        self._padding = padding
+        self._device = device
+
+    def create(self) -> SignedDistanceGrid:
+        position = self._mesh.nodes.position.detach().to(self._device)
+        size = position.amax(dim=0) - position.amin(dim=0)
+        lower = position.amin(dim=0) - self._padding * size
+        upper = position.amax(dim=0) + self._padding * size
+        axes = [torch.linspace(0, 1, self._resolution, device=self._device)] * 3
+        unit_grid = torch.stack(torch.meshgrid(*axes, indexing="ij"), dim=-1)
+        grid = (lower + unit_grid * (upper - lower)).reshape(-1, 3).contiguous()
+        values = self._get_signed_distance(grid).reshape(*unit_grid.shape[:-1])
+        return SignedDistanceGrid(values=values, lower=lower, upper=upper)
+
+    def _get_signed_distance(self, points: torch.Tensor) -> torch.Tensor:
+        mesh = wp.Mesh(
+            points=get_warp_points(self._mesh, self._device), indices=get_warp_triangles(self._mesh, self._device)
+        )
+        distance = wp.zeros(len(points), dtype=float, device=mesh.device)
+        wp.launch(
+            kernel=_signed_distance_kernel,
+            dim=len(points),
+            inputs=[mesh.id, wp.from_torch(points, dtype=wp.vec3)],
+            outputs=[distance],
+            device=mesh.device,
+        )
+        return wp.to_torch(distance).clone()
+
+
+@wp.kernel
+def _signed_distance_kernel(
+    mesh: wp.uint64,
+    points: wp.array(dtype=wp.vec3),
+    distance: wp.array(dtype=float),
+) -> None:
+    tid = wp.tid()
+    point = points[tid]
+    sign = float(0.0)
+    face = int(0)
+    u = float(0.0)
+    v = float(0.0)
+    wp.mesh_query_point(mesh, point, 1.0e6, sign, face, u, v)
+    closest = wp.mesh_eval_position(mesh, face, u, v)
+    distance[tid] = sign * wp.length(point - closest)
@@ -0,0 +1,54 @@
+import warp as wp
+from warp.sim import Model
+from typing import Callable, List
+
+wp.init()
+
+
+class StepBuffers:
+    """Warp states and tape of one simulation step, along with torch views of the arrays exchanged with torch."""
+
+    def __init__(self, model: Model):
+        self.state_now = model.state(requires_grad=True)
+        self.state_next = model.state(requires_grad=True)
+        self.tape = wp.Tape()
+        self.force = wp.to_torch(self.state_now.particle_f)
+        self.position_now = wp.to_torch(self.state_now.particle_q)
+        self.velocity_now = wp.to_torch(self.state_now.particle_qd)
+        self.position_next = wp.to_torch(self.state_next.particle_q)
+        self.velocity_next = wp.to_torch(self.state_next.particle_qd)
+        self.grad_force = wp.to_torch(self.state_now.particle_f.grad)
+        self.grad_position_now = wp.to_torch(self.state_now.particle_q.grad)
+        self.grad_velocity_now = wp.to_torch(self.state_now.particle_qd.grad)
+        self.grad_position_next = wp.to_torch(self.state_next.particle_q.grad)
+        self.grad_velocity_next = wp.to_torch(self.state_next.particle_qd.grad)
+
+    def reset(self) -> None:
+        self.tape.reset()
+
+
+class StatePool:
+    """Reuses the buffers of simulation steps instead of allocating new ones at every step.
+
+    A step acquires buffers and releases them once they are no longer needed, i.e. right after its forward if no
+    gradient is required, otherwise after its backward. Buffers of steps whose backward never runs are left to the
+    garbage collector. <size> buffers are allocated upfront by <create_buffers>, which takes the model and returns
+    buffers with a reset method.
+    """
+
+    def __init__(self, model: Model, size: int = 0, create_buffers: Callable[[Model], StepBuffers] = StepBuffers):
+        self.model = model
+        self.integrator = wp.sim.SemiImplicitIntegrator()
+        self._create_buffers = create_buffers
+        self._free: List[StepBuffers] = [create_buffers(model) for _ in range(size)]
+
+    def acquire(self) -> StepBuffers:
+        buffers = self._free.pop() if self._free else self._create_buffers(self.model)
+        buffers.reset()
+        return buffers
+
+    def release(self, buffers: StepBuffers) -> None:
+        self._free.append(buffers)
+
+    def __len__(self):
+        return len(self._free)
@@ -0,0 +1,282 @@
+import torch
+import warp as wp
+from warp.sim import Model
+from attrs import define, field
+from typing import Callable
+import sys
+
+sys.path.append("src")
+from warp_wrapper.state_pool import StatePool
+
+wp.init()
+
+
+@define
+class CableArrays:
+    """Warp arrays of the holes of all cables, packed one cable after another, see HolesForce and Barycentric.
+
+    Segment s joins holes s and s + 1. Its stiffness is zero between the last hole of a cable and the first of the next.
+    """
+
+    indices: wp.array = field()  # (num_holes, 4)
+    weights: wp.array = field()  # (num_holes, 4)
+    gram_pinv: wp.array = field()  # (num_holes, num_holes)
+    segment_cable: wp.array = field()  # (num_holes,), the last entry is unused
+    segment_stiffness: wp.array = field()  # (num_holes,), the last entry is unused
+    holes_damping: wp.array = field()  # (num_holes,)
+    num_cables: int = field()
+    num_nodes: int = field()
+
+    @property
+    def num_holes(self):
+        return self.holes_damping.shape[0]
+
+
+class SegmentBuffers:
+    """Warp states of every step of a segment, the hole arrays in between and the tape recording all of them.
+
+    With <use_graph>, the launches of the first forward and backward are captured as CUDA graphs, which later segments
+    replay instead of launching every kernel again. The graphs stay valid since the buffers never move.
+    """
+
+    def __init__(self, model: Model, cables: CableArrays, num_steps: int, use_graph: bool = False):
+        num_envs = model.particle_count // cables.num_nodes
+        device = model.device
+        self.states = [model.state(requires_grad=True) for _ in range(num_steps + 1)]
+        self.holes_position = wp.zeros((num_steps, num_envs * cables.num_holes), dtype=wp.vec3, device=device)
+        self.holes_velocity = wp.zeros((num_steps, num_envs * cables.num_holes), dtype=wp.vec3, device=device)
+        self.holes_force = wp.zeros((num_steps, num_envs * cables.num_holes), dtype=wp.vec3, device=device)
+        self.holes_spread = wp.zeros((num_steps, num_envs * cables.num_holes), dtype=wp.vec3, device=device)
+        self.pull_ratio = wp.zeros((num_steps, num_envs * cables.num_cables), dtype=float, device=device)
+        for array in [self.holes_position, self.holes_velocity, self.holes_force, self.holes_spread, self.pull_ratio]:
+            array.requires_grad = True
+        self.tape = wp.Tape()
+        self.position_first = wp.to_torch(self.states[0].particle_q)
+        self.velocity_first = wp.to_torch(self.states[0].particle_qd)
+        self.position_last = wp.to_torch(self.states[-1].particle_q)
+        self.velocity_last = wp.to_torch(self.states[-1].particle_qd)
+        self.pull_ratio_view = wp.to_torch(self.pull_ratio)
+        self.grad_position_first = wp.to_torch(self.states[0].particle_q.grad)
+        self.grad_velocity_first = wp.to_torch(self.states[0].particle_qd.grad)
+        self.grad_position_last = wp.to_torch(self.states[-1].particle_q.grad)
+        self.grad_velocity_last = wp.to_torch(self.states[-1].particle_qd.grad)
+        self.grad_pull_ratio = wp.to_torch(self.pull_ratio.grad)
+        self._use_graph = use_graph
+        self._forward_graph = None
+        self._backward_graph = None
+
+    def reset(self) -> None:
+        if self._forward_graph is None:
+            self.tape.reset()
+        else:
+            self.tape.zero()  # the launches recorded during capture are replayed by backward
+        for state in self.states:
+            state.particle_f.zero_()
+        self.holes_position.zero_()
+        self.holes_velocity.zero_()
+        self.holes_spread.zero_()
+
+    def forward(self, launch_steps: Callable[[], None]) -> None:
+        if not self._use_graph:
+            with self.tape:
+                launch_steps()
+            return
+        if self._forward_graph is None:
+            wp.capture_begin()
+            with self.tape:
+                launch_steps()
+            self._forward_graph = wp.capture_end()
+        wp.capture_launch(self._forward_graph)
+
+    def backward(self) -> None:
+        if not self._use_graph:
+            self.tape.backward()
+            return
+        if self._backward_graph is None:
+            wp.capture_begin()
+            self.tape.backward()
+            self._backward_graph = wp.capture_end()
+        wp.capture_launch(self._backward_graph)
+
+
+class UpdateSegment(torch.autograd.Function):
+    """All the steps of a segment, i.e. cable forces, their spread to the nodes and the integration, recorded on one
+    warp tape and exposed to torch as a single differentiable function."""
+
+    @staticmethod
+    def forward(
+        ctx,
+        pull_ratio: torch.Tensor,  # (num_envs, num_cables, num_steps)
+        position: torch.Tensor,  # (..., num_nodes, 3)
+        velocity: torch.Tensor,  # (..., num_nodes, 3)
+        pool: StatePool,
+        cables: CableArrays,
+        dt: float,
+        requires_grad: bool,
+    ):
+        ctx.shape = position.shape
+        ctx.pull_ratio_shape = pull_ratio.shape
+        ctx.pool = pool
+        buffers = pool.acquire()
+        num_steps = len(buffers.states) - 1
+        num_envs_holes = buffers.holes_position.shape[1]
+        buffers.pull_ratio_view.copy_(pull_ratio.detach().permute(2, 0, 1).reshape(num_steps, -1))
+        buffers.position_first.copy_(position.detach().reshape(-1, 3))
+        buffers.velocity_first.copy_(velocity.detach().reshape(-1, 3))
+        def launch_steps():
+            for step in range(num_steps):
+                UpdateSegment._step(pool, cables, buffers, step, num_envs_holes, dt)
+
+        buffers.forward(launch_steps)
+        position_last = buffers.position_last.clone().reshape(ctx.shape)
+        velocity_last = buffers.velocity_last.clone().reshape(ctx.shape)
+        if requires_grad:
+            ctx.buffers = buffers
+        else:
+            pool.release(buffers)
+        return position_last, velocity_last
+
+    @staticmethod
+    def backward(ctx, grad_position_last, grad_velocity_last):
+        buffers = ctx.buffers
+        buffers.grad_position_last.copy_(grad_position_last.reshape(-1, 3))
+        buffers.grad_velocity_last.copy_(grad_velocity_last.reshape(-1, 3))
+        buffers.backward()
+        num_envs, num_cables, num_steps = ctx.pull_ratio_shape
+        grad_pull_ratio = buffers.grad_pull_ratio.reshape(num_steps, num_envs, num_cables).permute(1, 2, 0).clone()
+        grad_position = buffers.grad_position_first.clone().reshape(ctx.shape)
+        grad_velocity = buffers.grad_velocity_first.clone().reshape(ctx.shape)
+        del ctx.buffers
+        ctx.pool.release(buffers)
+        return grad_pull_ratio, grad_position, grad_velocity, None, None, None, None
+
+    @staticmethod
+    def _step(pool: StatePool, cables: CableArrays, buffers: SegmentBuffers, step: int, num_envs_holes: int, dt):
+        state_now, state_next = buffers.states[step], buffers.states[step + 1]
+        model = pool.model
+        wp.launch(
+            kernel=_interpolate_kernel,
+            dim=[num_envs_holes, 4],
+            inputs=[
+                state_now.particle_q,
+                state_now.particle_qd,
+                cables.indices,
+                cables.weights,
+                cables.num_nodes,
+                cables.num_holes,
+                step,
+            ],
+            outputs=[buffers.holes_position, buffers.holes_velocity],
+            device=model.device,
+        )
+        wp.launch(
+            kernel=_cable_force_kernel,
+            dim=num_envs_holes,
+            inputs=[
+                buffers.holes_position,
+                buffers.holes_velocity,
+                buffers.pull_ratio,
+                cables.segment_cable,
+                cables.segment_stiffness,
+                cables.holes_damping,
+                cables.num_cables,
+                cables.num_holes,
+                step,
+            ],
+            outputs=[buffers.holes_force],
+            device=model.device,
+        )
+        wp.launch(
+            kernel=_gram_pinv_kernel,
+            dim=[num_envs_holes, cables.num_holes],
+            inputs=[buffers.holes_force, cables.gram_pinv, cables.num_holes, step],
+            outputs=[buffers.holes_spread],
+            device=model.device,
+        )
+        wp.launch(
+            kernel=_spread_kernel,
+            dim=[num_envs_holes, 4],
+            inputs=[buffers.holes_spread, cables.indices, cables.weights, cables.num_nodes, cables.num_holes, step],
+            outputs=[state_now.particle_f],
+            device=model.device,
+        )
+        if model.contact_properties is not None:
+            wp.sim.collide(model, state_now)
+        pool.integrator.simulate(model, state_now, state_next, dt)
+
+
+@wp.kernel
+def _interpolate_kernel(
+    nodes_position: wp.array(dtype=wp.vec3),
+    nodes_velocity: wp.array(dtype=wp.vec3),
+    indices: wp.array2d(dtype=int),
+    weights: wp.array2d(dtype=float),
+    num_nodes: int,
+    num_holes: int,
+    step: int,
+    holes_position: wp.array2d(dtype=wp.vec3),
+    holes_velocity: wp.array2d(dtype=wp.vec3),
+) -> None:
+    i, k = wp.tid()
+    hole = i % num_holes
+    node = (i / num_holes) * num_nodes + indices[hole, k]
+    wp.atomic_add(holes_position, step, i, weights[hole, k] * nodes_position[node])
+    wp.atomic_add(holes_velocity, step, i, weights[hole, k] * nodes_velocity[node])
+
+
+@wp.kernel
+def _cable_force_kernel(
+    holes_position: wp.array2d(dtype=wp.vec3),
+    holes_velocity: wp.array2d(dtype=wp.vec3),
+    pull_ratio: wp.array2d(dtype=float),
+    segment_cable: wp.array(dtype=int),
+    segment_stiffness: wp.array(dtype=float),
+    holes_damping: wp.array(dtype=float),
+    num_cables: int,
+    num_holes: int,
+    step: int,
+    holes_force: wp.array2d(dtype=wp.vec3),
+) -> None:
+    # segment s pulls hole s towards hole s + 1 and hole s + 1 towards hole s
+    i = wp.tid()
+    hole = i % num_holes
+    env = i / num_holes
+    force = -holes_damping[hole] * holes_velocity[step, i]
+    if hole > 0:
+        s = hole - 1
+        ratio = pull_ratio[step, env * num_cables + segment_cable[s]]
+        force = force - ratio * segment_stiffness[s] * (holes_position[step, i] - holes_position[step, i - 1])
+    if hole < num_holes - 1:
+        ratio = pull_ratio[step, env * num_cables + segment_cable[hole]]
+        force = force + ratio * segment_stiffness[hole] * (holes_position[step, i + 1] - holes_position[step, i])
+    holes_force[step, i] = force
+
+
+@wp.kernel
+def _gram_pinv_kernel(
+    holes_force: wp.array2d(dtype=wp.vec3),
+    gram_pinv: wp.array2d(dtype=float),
+    num_holes: int,
+    step: int,
+    holes_spread: wp.array2d(dtype=wp.vec3),
+) -> None:
+    i, j = wp.tid()
+    hole = i % num_holes
+    first = i - hole
+    wp.atomic_add(holes_spread, step, i, gram_pinv[hole, j] * holes_force[step, first + j])
+
+
+@wp.kernel
+def _spread_kernel(
+    holes_spread: wp.array2d(dtype=wp.vec3),
+    indices: wp.array2d(dtype=int),
+    weights: wp.array2d(dtype=float),
+    num_nodes: int,
+    num_holes: int,
+    step: int,
+    nodes_force: wp.array(dtype=wp.vec3),
+) -> None:
+    i, k = wp.tid()
+    hole = i % num_holes
+    node = (i / num_holes) * num_nodes + indices[hole, k]
+    wp.atomic_add(nodes_force, node, weights[hole, k] * holes_spread[step, i])
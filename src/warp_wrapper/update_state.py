@@ -1,9 +1,9 @@
 import torch
-from warp.sim import Model
 import warp as wp
 import sys
 
 sys.path.append("src")
+from warp_wrapper.state_pool import StatePool
 
 wp.init()
 
@@ -13,35 +13,41 @@ class UpdateState(torch.autograd.Function):
     def forward(
         ctx,
         force: torch.Tensor,
-        position_now: torch.Tensor,  # as a substitue to model.state.particle_q
-        velocity_now: torch.Tensor,  # as a substitue to model.state.particle_qd
-        model: Model,
+        position_now: torch.Tensor,  # of shape (..., num_nodes, 3), copied to model.state.particle_q
+        velocity_now: torch.Tensor,  # of shape (..., num_nodes, 3), copied to model.state.particle_qd
+        pool: StatePool,
         dt: float,
+        requires_grad: bool,
     ):
-        ctx.state_now = model.state(requires_grad=True)
-        ctx.state_next = model.state(requires_grad=True)
-        ctx.tape = wp.Tape()
-        ctx.force = wp.from_torch(force.contiguous(), dtype=wp.vec3)
-        with ctx.tape:
-            wp.sim.collide(model, ctx.state_now) if model.contact_properties is not None else None
-            ctx.state_now.clear_forces()
-            ctx.state_now.particle_f = ctx.force
-            wp.sim.SemiImplicitIntegrator().simulate(model, ctx.state_now, ctx.state_next, dt)
-        model.particle_q = ctx.state_next.particle_q
-        model.particle_qd = ctx.state_next.particle_qd
-        position_next = wp.to_torch(ctx.state_next.particle_q)
-        velocity_next = wp.to_torch(ctx.state_next.particle_qd)
+        ctx.shape = position_now.shape
+        ctx.pool = pool
+        buffers = pool.acquire()
+        buffers.force.copy_(force.detach().reshape(-1, 3))
+        buffers.position_now.copy_(position_now.detach().reshape(-1, 3))
+        buffers.velocity_now.copy_(velocity_now.detach().reshape(-1, 3))
+        with buffers.tape:
+            if pool.model.contact_properties is not None:
+                wp.sim.collide(pool.model, buffers.state_now)
+            pool.integrator.simulate(pool.model, buffers.state_now, buffers.state_next, dt)
+        position_next = buffers.position_next.clone().reshape(ctx.shape)
+        velocity_next = buffers.velocity_next.clone().reshape(ctx.shape)
+        if requires_grad:
+            ctx.buffers = buffers
+        else:
+            pool.release(buffers)
         return position_next, velocity_next
 
     @staticmethod
     def backward(ctx, grad_position_next, grad_velocity_next):
-        ctx.state_next.particle_q.grad = wp.from_torch(grad_position_next.contiguous(), dtype=wp.vec3)
-        ctx.state_next.particle_qd.grad = wp.from_torch(grad_velocity_next.contiguous(), dtype=wp.vec3)
-        ctx.tape.backward()
-        return (
-            wp.to_torch(ctx.tape.gradients[ctx.force]),
-            wp.to_torch(ctx.tape.gradients[ctx.state_now.particle_q]),
-            wp.to_torch(ctx.tape.gradients[ctx.state_now.particle_qd]),
-            None,
-            None,
+        buffers = ctx.buffers
+        buffers.grad_position_next.copy_(grad_position_next.reshape(-1, 3))
+        buffers.grad_velocity_next.copy_(grad_velocity_next.reshape(-1, 3))
+        buffers.tape.backward()
+        grads = (
+            buffers.grad_force.clone().reshape(ctx.shape),
+            buffers.grad_position_now.clone().reshape(ctx.shape),
+            buffers.grad_velocity_now.clone().reshape(ctx.shape),
         )
+        del ctx.buffers
+        ctx.pool.release(buffers)
+        return (*grads, None, None, None)
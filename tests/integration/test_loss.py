@@ -1,6 +1,7 @@
 import torch
 import unittest
 import sys
+from attrs import evolve
 
 sys.path.append("src")
 from pathlib import Path
@@ -9,14 +10,16 @@ from simulation.simulation import Simulation
 from point.transform import Transform, get_quaternion
 from rendering.views import ThreeInteriorViews, SixInteriorViews
 from rendering.rendering import InteriorGapRendering, InteriorDistanceRendering
-from objective.loss import MaxGripLoss, PointTouchLoss, ObstacleAvoidanceLoss
+from objective.loss import MaxGripLoss, PointTouchLoss, ObstacleAvoidanceLoss, ObstacleSignedDistanceLoss
 from simulation.simulation_properties import SimulationProperties
 from scene.scene_factory import GripperSceneFactory, TouchSceneFactory
 from simulation.update_scene import UpdateScene
 from warp_wrapper.contact_properties import ContactProperties
 from rendering.z_buffer import ZBuffer
+from rendering.resolution import CoarseToFineResolution
 from cable.pull_ratio import TimeInvariablePullRatio
 from objective.variables import Variables
+from warp_wrapper.signed_distance import SignedDistanceGridFactory
 
 
 class TestMaxGripLoss(unittest.TestCase):
@@ -92,6 +95,15 @@ class TestMaxGripLoss(unittest.TestCase):
         loss = MaxGripLoss(rendering=self.rendering, device=self.device).get_loss()
         self.assertIsInstance(loss, torch.Tensor)
 
+    def tests_if_coarse_max_grip_loss_estimates_the_final_one(self):
+        resolution = CoarseToFineResolution(image_sizes=[500, 1000], num_iterations=[1, 1])
+        loss = MaxGripLoss(rendering=self.rendering, device=self.device, resolution=resolution)
+        loss.set_iteration(0)
+        coarse = loss.get_loss().item()
+        loss.set_iteration(1)
+        final = loss.get_loss().item()
+        self.assertAlmostEqual(coarse, final, delta=0.1 * abs(final))
+
 
 class TestPointTouchLoss(unittest.TestCase):
     @classmethod
@@ -137,7 +149,7 @@ class TestPointTouchLoss(unittest.TestCase):
 
         contact_properties = ContactProperties(distance=0.001, ke=2.0, kd=0.1, kf=0.1, ground=False)
 
-        cls.scene = TouchSceneFactory(
+        scene_factory = TouchSceneFactory(
             msh_file=msh_file,
             scad_file=scad_file,
             scad_parameters=scad_parameters,
@@ -153,7 +165,9 @@ class TestPointTouchLoss(unittest.TestCase):
             contact_properties=contact_properties,
             device=cls.device,
             make_new_robot=False,
-        ).create()
+        )
+        cls.scene = scene_factory.create()
+        cls.envs_scene = evolve(scene_factory, num_envs=2).create()
         simulation = Simulation(scene=cls.scene, properties=sim_properties)
         UpdateScene(scene=cls.scene, simulation=simulation).update_scene()
 
@@ -161,6 +175,27 @@ class TestPointTouchLoss(unittest.TestCase):
         loss = PointTouchLoss(scene=self.scene).get_loss()
         self.assertIsInstance(loss, torch.Tensor)
 
+    def tests_if_point_touch_and_signed_distance_losses_are_of_shape_one(self):
+        signed_distance = SignedDistanceGridFactory(self.scene.object, resolution=16, device=self.device).create()
+        losses = [
+            PointTouchLoss(scene=self.scene),
+            ObstacleSignedDistanceLoss(scene=self.scene, signed_distance=signed_distance, device=self.device),
+        ]
+        for loss in losses:
+            self.assertEqual(loss.get_loss().shape, (1,))
+
+    def tests_if_signed_distance_loss_penalises_every_environment(self):
+        signed_distance = SignedDistanceGridFactory(self.envs_scene.object, resolution=16, device=self.device).create()
+        loss = ObstacleSignedDistanceLoss(scene=self.envs_scene, signed_distance=signed_distance, device=self.device)
+        position = self.envs_scene.envs_nodes_position.clone()
+        position[1] = self.envs_scene.object.nodes.position.mean(dim=0)
+        self.envs_scene.set_envs_nodes(position, torch.zeros_like(position))
+        first_env_loss = signed_distance(position[0]).clamp(max=0.0).mean()
+        self.assertEqual(loss.get_loss().shape, (1,))
+        self.assertLess(loss.get_loss().item(), first_env_loss.item())
+        self.assertEqual(PointTouchLoss(scene=self.envs_scene).get_loss().shape, (1,))
+        self.envs_scene.reset()
+
 
 class TestObstacleAvoidanceLoss(unittest.TestCase):
     @classmethod
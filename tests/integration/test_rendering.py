@@ -114,6 +114,35 @@ class TestRenderingVisualization(unittest.TestCase):
         except:
             self.fail()
 
+    def tests_if_zbufs_rasterized_in_one_pass_match_separate_ones(self):
+        views = SixInteriorViews(center=self.scene.object.nodes.position.mean(dim=0), device=self.device)
+        zbufs = [ZBuffer(mesh=mesh, views=views, device=self.device) for mesh in self.scene.all_meshes()]
+        expected = torch.stack([zbuf.zbuf for zbuf in zbufs])
+        actual = ZBuffer.get_zbufs(zbufs)
+        self.assertTrue(torch.allclose(expected, actual))
+
+    def tests_if_interior_gap_rendering_with_roi_keeps_every_gap(self):
+        views = SixInteriorViews(center=self.scene.object.nodes.position.mean(dim=0), device=self.device)
+        robot_zbuf = ZBuffer(mesh=self.scene.robot, views=views, device=self.device)
+        other_zbuf = ZBuffer(mesh=self.scene.object, views=views, device=self.device)
+        expected = InteriorGapRendering(robot_zbuf=robot_zbuf, other_zbuf=other_zbuf).get_images()
+        actual = InteriorGapRendering(robot_zbuf=robot_zbuf, other_zbuf=other_zbuf, use_roi=True).get_images()
+        self.assertLessEqual(actual.shape[-1], expected.shape[-1])
+        self.assertTrue(torch.allclose(expected.sum(dim=(1, 2)), actual.sum(dim=(1, 2)), rtol=1e-4))
+
+    def tests_if_static_zbuf_is_reused_until_its_mesh_moves(self):
+        views = SixInteriorViews(center=self.scene.object.nodes.position.mean(dim=0), device=self.device)
+        expected = ZBuffer(mesh=self.scene.object, views=views, device=self.device)
+        actual = ZBuffer(mesh=self.scene.object, views=views, device=self.device, static=True)
+        self.assertTrue(torch.equal(expected.zbuf, actual.zbuf))
+        static_zbuf = actual._static_zbuf
+        actual.zbuf
+        self.assertIs(actual._static_zbuf, static_zbuf)
+        self.scene.object.nodes.position += 0.001
+        self.assertTrue(torch.equal(expected.zbuf, actual.zbuf))
+        self.assertIsNot(actual._static_zbuf, static_zbuf)
+        self.scene.object.nodes.position -= 0.001
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+import torch
+
+sys.path.append("src")
+
+from cable.barycentric_factory import BarycentricListFactory
+from cable.cable_factory import CableListFactory
+from cable.holes import Holes
+from cable.pull_ratio import TimeInvariablePullRatio
+from mesh.mesh_factory import MeshFactoryFromMsh
+from mesh.mesh_properties import MeshProperties
+from simulation.adjoint_segment import AdjointSegmentPositionAndVelocity
+from simulation.simulation_properties import SimulationProperties
+from simulation.update_holes import HolesForce, HolesPositionAndVelocity
+from simulation.update_nodes import NodesForce, NodesPositionAndVelocity
+from warp_wrapper.model_factory import ModelFactory
+
+
+class TestAdjointSegmentPositionAndVelocity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        msh_file = Path("tests/data/caterpillar.msh")
+        mesh = MeshFactoryFromMsh(msh_file, device="cpu").create()
+        mesh.properties = MeshProperties(
+            name="caterpillar",
+            density=1080.0,
+            youngs_modulus=149_000,
+            poissons_ratio=0.45,
+            damping_factor=0.4,
+            frozen_bounding_box=[-np.inf, -np.inf, -np.inf, np.inf, np.inf, 5],
+        )
+        centroids = mesh.nodes.position[mesh.elements.tetrahedra.long()].mean(dim=1)
+        holes = [Holes(centroids[i::500][:5].contiguous()) for i in range(2)]
+        sim_properties = SimulationProperties(duration=1e-3, segment_duration=1e-3, dt=5e-5, device="cpu")
+        pull_ratio = [
+            TimeInvariablePullRatio(sim_properties, pull_ratio=torch.tensor(0.5), device="cpu") for _ in range(2)
+        ]
+        cables = CableListFactory(holes, pull_ratio, 100.0, 0.01).create()
+        barycentrics = BarycentricListFactory(mesh, holes, device="cpu").create()
+        cls.holes_position_and_velocity = HolesPositionAndVelocity(barycentrics)
+        cls.holes_force = HolesForce(cables, device="cpu")
+        cls.nodes_force = NodesForce(barycentrics)
+        model = ModelFactory(soft_mesh=mesh, device="cpu").create()
+        cls.nodes_position_and_velocity = NodesPositionAndVelocity(model, sim_properties.dt)
+        cls.nodes = mesh.nodes
+        cls.dt, cls.num_steps = sim_properties.dt, sim_properties.num_steps_per_segment
+
+    def _step(self, position, velocity, pull_ratio):
+        holes_position, holes_velocity = self.holes_position_and_velocity(position, velocity)
+        force = self.nodes_force(self.holes_force(holes_position, holes_velocity, pull_ratio))
+        return self.nodes_position_and_velocity(force, position, velocity)
+
+    def _step_through_segment(self, position, velocity, pull_ratio):
+        for step_pull_ratio in pull_ratio.unbind(dim=-1):
+            position, velocity = self._step(position, velocity, step_pull_ratio)
+        return position, velocity
+
+    def tests_if_adjoint_matches_backward_through_every_step(self):
+        segment = AdjointSegmentPositionAndVelocity(self._step, self.dt)
+        expected_pull_ratio = torch.rand(2, self.num_steps, requires_grad=True)
+        actual_pull_ratio = expected_pull_ratio.detach().clone().requires_grad_()
+        expected_position = self.nodes.position.clone().requires_grad_()
+        actual_position = self.nodes.position.clone().requires_grad_()
+        expected = self._step_through_segment(expected_position, self.nodes.velocity, expected_pull_ratio)
+        actual = segment(actual_position, self.nodes.velocity, actual_pull_ratio)
+        for e, a in zip(expected, actual):
+            self.assertTrue(torch.equal(e, a))
+        sum(e.sum() for e in expected).backward()
+        sum(a.sum() for a in actual).backward()
+        self.assertTrue(torch.allclose(expected_pull_ratio.grad, actual_pull_ratio.grad, rtol=1e-4, atol=1e-9))
+        self.assertTrue(torch.allclose(expected_position.grad, actual_position.grad, rtol=1e-4, atol=1e-6))
+
+    def tests_if_adjoint_matches_finite_differences(self):
+        segment = AdjointSegmentPositionAndVelocity(self._step, self.dt)
+        weights = torch.rand(self.nodes.position.shape, generator=torch.Generator().manual_seed(0))
+
+        def loss(pull_ratio):
+            return (segment(self.nodes.position, self.nodes.velocity, pull_ratio)[1] * weights).sum()
+
+        pull_ratio = torch.full((2, self.num_steps), 0.5, requires_grad=True)
+        loss(pull_ratio).backward()
+        eps = 0.1
+        with torch.no_grad():
+            expected = ((loss(pull_ratio + eps) - loss(pull_ratio - eps)) / (2 * eps)).item()
+        self.assertAlmostEqual(pull_ratio.grad.sum().item(), expected, delta=1e-2 * abs(expected))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,20 +8,44 @@ from cable.barycentric import Barycentric
 
 
 class TestBarycentric(unittest.TestCase):
-    def tests_if_value_error_is_raised_when_HxN_does_not_sum_to_one(self):
-        HxN = torch.tensor([[0.1, 0.5, 0.2, 0.2], [0.8, 0.1, 0.1, 0.1]])
-        NxH = torch.zeros([4, 2])
+    def tests_if_value_error_is_raised_when_weights_do_not_sum_to_one(self):
+        indices = torch.tensor([[0, 1, 2, 3], [2, 3, 4, 5]])
+        weights = torch.tensor([[0.1, 0.5, 0.2, 0.2], [0.8, 0.1, 0.1, 0.1]])
         with self.assertRaises(ValueError):
-            Barycentric(HxN, NxH)
+            Barycentric(indices, weights, num_nodes=6)
 
-    def tests_if_value_error_is_not_raised_when_HxN_does_sum_to_one(self):
-        HxN = torch.tensor([[0.1, 0.5, 0.2, 0.2], [0.8, 0.0, 0.1, 0.1]])
-        NxH = torch.zeros([4, 2])
+    def tests_if_value_error_is_not_raised_when_weights_do_sum_to_one(self):
+        indices = torch.tensor([[0, 1, 2, 3], [2, 3, 4, 5]])
+        weights = torch.tensor([[0.1, 0.5, 0.2, 0.2], [0.8, 0.0, 0.1, 0.1]])
         try:
-            Barycentric(HxN, NxH)
+            Barycentric(indices, weights, num_nodes=6)
         except ValueError:
             self.fail()
 
+    def tests_if_interpolate_and_spread_match_the_dense_barycentric_matrix_and_its_pseudo_inverse(self):
+        indices = torch.tensor([[0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7]])
+        weights = torch.tensor([[0.1, 0.5, 0.2, 0.2], [0.7, 0.1, 0.1, 0.1], [0.25, 0.25, 0.3, 0.2]])
+        barycentric = Barycentric(indices, weights, num_nodes=8)
+        HxN = torch.zeros(3, 8).scatter_(1, indices, weights)
+        nodes_value = torch.rand(8, 3)
+        holes_value = torch.rand(3, 3)
+        self.assertTrue(torch.allclose(barycentric.interpolate(nodes_value), HxN @ nodes_value, atol=1e-6))
+        self.assertTrue(torch.allclose(barycentric.spread(holes_value), torch.pinverse(HxN) @ holes_value, atol=1e-5))
+
+    def tests_if_interpolate_and_spread_apply_to_each_environment_of_a_batch(self):
+        indices = torch.tensor([[0, 1, 2, 3], [2, 3, 4, 5]])
+        weights = torch.tensor([[0.1, 0.5, 0.2, 0.2], [0.7, 0.1, 0.1, 0.1]])
+        barycentric = Barycentric(indices, weights, num_nodes=6)
+        nodes_value = torch.rand(4, 6, 3)
+        holes_value = torch.rand(4, 2, 3)
+        interpolated = barycentric.interpolate(nodes_value)
+        spread = barycentric.spread(holes_value)
+        self.assertEqual(interpolated.shape, (4, 2, 3))
+        self.assertEqual(spread.shape, (4, 6, 3))
+        for env in range(4):
+            self.assertTrue(torch.allclose(interpolated[env], barycentric.interpolate(nodes_value[env])))
+            self.assertTrue(torch.allclose(spread[env], barycentric.spread(holes_value[env])))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -29,15 +29,16 @@ class TestListBarycentricFactory(unittest.TestCase):
         except:
             self.fail()
 
-    def tests_if_HxN_has_the_correct_shape(self):
+    def tests_if_indices_and_weights_have_the_correct_shape(self):
         barycentrics = BarycentricListFactory(mesh=self.mesh, holes=self.holes).create()
         for barycentric, holes in zip(barycentrics, self.holes):
-            self.assertEqual(list(barycentric.HxN.shape), [len(holes), len(self.mesh.nodes)])
+            self.assertEqual(list(barycentric.indices.shape), [len(holes), 4])
+            self.assertEqual(list(barycentric.weights.shape), [len(holes), 4])
 
-    def tests_if_NxH_has_the_correct_shape(self):
+    def tests_if_spread_returns_one_value_per_node(self):
         barycentrics = BarycentricListFactory(mesh=self.mesh, holes=self.holes).create()
         for barycentric, holes in zip(barycentrics, self.holes):
-            self.assertEqual(list(barycentric.NxH.shape), [len(self.mesh.nodes), len(holes)])
+            self.assertEqual(list(barycentric.spread(holes.force).shape), [len(self.mesh.nodes), 3])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+import unittest
+import sys
+
+sys.path.append("src")
+
+from simulation.checkpoint_plan import CheckpointPlanFactory
+from simulation.simulation_properties import SimulationProperties
+
+
+class TestCheckpointPlanFactory(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # 2 segments of 20 steps
+        cls.properties = SimulationProperties(duration=0.002, segment_duration=0.001, dt=5e-5, device="cpu")
+
+    def tests_if_large_budget_disables_checkpointing(self):
+        plan = CheckpointPlanFactory(self.properties, memory_budget=40).create()
+        self.assertEqual(plan.chunk_sizes, [])
+        self.assertEqual(plan.recompute_factor, 1)
+
+    def tests_if_smaller_budgets_add_levels(self):
+        plan = CheckpointPlanFactory(self.properties, memory_budget=15).create()
+        self.assertEqual(plan.chunk_sizes, [5])
+        self.assertEqual(plan.peak_memory, 13)
+        self.assertEqual(plan.recompute_factor, 2)
+        plan = CheckpointPlanFactory(self.properties, memory_budget=12).create()
+        self.assertEqual(plan.chunk_sizes, [10, 2])
+        self.assertEqual(plan.recompute_factor, 3)
+
+    def tests_if_plans_fit_in_budget_with_dividing_chunk_sizes(self):
+        for memory_budget in range(11, 41):
+            plan = CheckpointPlanFactory(self.properties, memory_budget=memory_budget).create()
+            self.assertLessEqual(plan.peak_memory, memory_budget)
+            for outer, inner in zip([self.properties.num_steps_per_segment] + plan.chunk_sizes, plan.chunk_sizes):
+                self.assertEqual(outer % inner, 0)
+
+    def tests_if_too_small_budget_raises(self):
+        with self.assertRaises(ValueError):
+            CheckpointPlanFactory(self.properties, memory_budget=5).create()
+
+    def tests_if_chunk_sizes_are_followed(self):
+        plan = CheckpointPlanFactory(self.properties, chunk_sizes=[20]).create()
+        self.assertEqual(plan.chunk_sizes, [20])
+        self.assertEqual(plan.peak_memory, 22)
+        self.assertEqual(plan.recompute_factor, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import sys
 
 sys.path.append("src")
 
-from utils.interpolate import linear_interpolate_between_two_points, linear_interpolate
+from utils.interpolate import linear_interpolate_between_two_points, linear_interpolate, interpolate
 
 
 class TestLinearInterpolate(unittest.TestCase):
@@ -28,5 +28,44 @@ class TestLinearInterpolate(unittest.TestCase):
             self.assertTrue(torch.allclose(a, e))
 
 
+class TestInterpolate(unittest.TestCase):
+    def tests_if_batched_ys_are_interpolated_row_by_row(self):
+        inp = torch.arange(0, 1.1, 0.1)
+        xs = torch.tensor([0.0, 0.5, 1.0])
+        ys = torch.tensor([[0.0, 0.2, 0.0], [1.0, 0.0, 1.0]])
+        actual = interpolate(xs, ys, inp)
+        self.assertEqual(actual.shape, (2, len(inp)))
+        for row, y in zip(actual, ys):
+            self.assertTrue(torch.allclose(row, linear_interpolate(xs, y, inp)))
+
+    def tests_if_splines_pass_through_the_knots(self):
+        xs = torch.tensor([0.0, 0.5, 1.0, 2.0])
+        ys = torch.tensor([0.0, 0.2, 0.1, 0.4])
+        for mode in ["cubic", "monotone"]:
+            self.assertTrue(torch.allclose(interpolate(xs, ys, xs, mode=mode), ys))
+
+    def tests_if_monotone_spline_does_not_overshoot_the_knots(self):
+        inp = torch.linspace(0, 1.5, 151)
+        xs = torch.tensor([0.0, 0.5, 1.0, 1.5])
+        ys = torch.tensor([0.0, 0.0, 1.0, 1.0])
+        actual = interpolate(xs, ys, inp, mode="monotone")
+        self.assertTrue(torch.all(actual >= -1e-6) and torch.all(actual <= 1.0 + 1e-6))
+        self.assertTrue(torch.all(actual[1:] - actual[:-1] >= -1e-6))
+        self.assertTrue(torch.any(interpolate(xs, ys, inp, mode="cubic") < 0.0))
+
+    def tests_if_gradient_flows_to_ys_in_every_mode(self):
+        inp = torch.arange(0, 1.1, 0.1)
+        xs = torch.tensor([0.0, 0.5, 1.0])
+        for mode in ["linear", "cubic", "monotone"]:
+            ys = torch.tensor([0.0, 0.2, 0.1], requires_grad=True)
+            interpolate(xs, ys, inp, mode=mode).sum().backward()
+            self.assertTrue(torch.all(torch.isfinite(ys.grad)))
+            self.assertTrue(torch.any(ys.grad != 0))
+
+    def tests_if_value_error_is_raised_given_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            interpolate(torch.tensor([0.0, 1.0]), torch.tensor([0.0, 1.0]), torch.tensor([0.5]), mode="quadratic")
+
+
 if __name__ == "__main__":
     unittest.main()
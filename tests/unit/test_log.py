@@ -0,0 +1,60 @@
+import unittest
+import sys
+import tempfile
+import torch
+
+sys.path.append("src")
+
+from objective.log import Log
+from objective.loss import Loss
+from objective.variables import Variables
+
+
+class _SumLoss(Loss):
+    def __init__(self, variables: Variables):
+        self._variables = variables
+        self.num_calls = 0
+
+    def get_loss(self):
+        self.num_calls += 1
+        return sum(parameter**2 for parameter in self._variables.parameters).reshape(1)
+
+
+class TestLog(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.variables = Variables()
+        for value in [0.1, 0.2]:
+            self.variables.add_parameter(torch.tensor(value, requires_grad=True))
+        self.loss = _SumLoss(self.variables)
+
+    def _train(self, log: Log, num_iterations: int):
+        for _ in range(num_iterations):
+            self.loss.backward()
+            self.variables.set_gradients()
+            log.save()
+            with torch.no_grad():
+                for parameter in self.variables.parameters:
+                    parameter -= 0.1 * parameter.grad
+                    parameter.grad = None
+
+    def tests_if_every_iteration_is_appended(self):
+        self._train(Log(self.loss, self.variables, self.path), num_iterations=3)
+        self.assertEqual(Log.load(self.path, "loss").shape, (3, 1))
+        self.assertEqual(Log.load(self.path, "gradient").shape, (3, 2))
+        parameter = Log.load(self.path, "parameter")
+        self.assertTrue(torch.allclose(parameter[0], torch.tensor([0.1, 0.2])))
+        self.assertTrue(torch.allclose(parameter[1], torch.tensor([0.08, 0.16])))
+
+    def tests_if_loss_is_computed_once_per_iteration(self):
+        self._train(Log(self.loss, self.variables, self.path), num_iterations=3)
+        self.assertEqual(self.loss.num_calls, 3)
+
+    def tests_if_new_log_overwrites_old_one(self):
+        self._train(Log(self.loss, self.variables, self.path), num_iterations=3)
+        self._train(Log(self.loss, self.variables, self.path), num_iterations=2)
+        self.assertEqual(Log.load(self.path, "loss").shape, (2, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,12 +26,23 @@ class TestModelFactory(unittest.TestCase):
             frozen_bounding_box=[-np.inf, -np.inf, 0, np.inf, np.inf, 2],
         )
         contact_properties = ContactProperties(distance=0.01, ke=2.0, kd=0.1, kf=0.1, ground=False)
+        cls.mesh = mesh
+        cls.contact_properties = contact_properties
         cls.model_factory = ModelFactory(soft_mesh=mesh, contact_properties=contact_properties, device="cuda")
 
     def tests_if_model_factory_creates_a_model_with_a_soft_mesh(self):
         model = self.model_factory.create()
         self.assertTrue(isinstance(model, Model))
 
+    def tests_if_model_holds_one_copy_of_the_soft_mesh_per_environment(self):
+        model = ModelFactory(
+            soft_mesh=self.mesh, contact_properties=self.contact_properties, device="cpu", num_envs=3
+        ).create()
+        num_nodes = len(self.mesh.nodes)
+        self.assertEqual(model.particle_count, 3 * num_nodes)
+        self.assertEqual(model.tet_count % 3, 0)
+        self.assertLess(self.mesh.elements.triangles.amax().item(), num_nodes)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import sys
+import torch
+
+sys.path.append("src")
+from point.points import Points
+from point.point_iterable import PointIterable
+
+
+class TestPointIterable(unittest.TestCase):
+    def setUp(self):
+        self.point = Points(position=torch.rand(4, 3))
+
+    def tests_if_every_slot_starts_with_the_values_of_the_point(self):
+        iterable = PointIterable(self.point, capacity=3)
+        for _ in range(3):
+            points = next(iterable)
+            self.assertTrue(torch.equal(points.position, self.point.position))
+            self.assertTrue(torch.equal(points.velocity, self.point.velocity))
+
+    def tests_if_slots_are_reused_after_capacity(self):
+        iterable = PointIterable(self.point, capacity=2)
+        first = next(iterable)
+        first.position += 1
+        next(iterable)
+        self.assertTrue(torch.equal(next(iterable).position, self.point.position + 1))
+
+    def tests_if_slots_are_detached_from_the_point(self):
+        point = Points(position=torch.rand(4, 3, requires_grad=True))
+        iterable = PointIterable(point, capacity=2)
+        self.assertFalse(next(iterable).position.requires_grad)
+        self.assertFalse(next(iterable).position.requires_grad)
+
+    def tests_if_iteration_stops_given_no_capacity(self):
+        with self.assertRaises(StopIteration):
+            next(PointIterable(self.point, capacity=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
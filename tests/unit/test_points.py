@@ -4,6 +4,7 @@ import sys
 
 sys.path.append("src")
 from point.points import Points
+from utils.validation import validation_level
 
 
 class TestPoints(unittest.TestCase):
@@ -98,6 +99,23 @@ class TestPoints(unittest.TestCase):
         points = Points(position=p)
         self.assertEqual(len(points), 7)
 
+    def tests_if_nan_is_accepted_given_shape_validation(self):
+        with validation_level("shape"):
+            points = Points(position=torch.tensor([[float("nan"), 1.0, 2.0]]))
+            with self.assertRaises(ValueError):
+                points.position = torch.zeros(4, 2)
+
+    def tests_if_nothing_is_checked_given_no_validation(self):
+        with validation_level("off"):
+            points = Points(position=torch.zeros(4, 2))
+        self.assertEqual(len(points), 4)
+
+    def tests_if_validation_is_restored_after_trusted_construction(self):
+        points = Points.from_trusted(position=torch.zeros(4, 2), velocity=torch.zeros(4, 2), force=torch.zeros(4, 2))
+        self.assertEqual(len(points), 4)
+        with self.assertRaises(ValueError):
+            points.position = torch.zeros(4, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
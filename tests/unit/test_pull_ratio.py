@@ -3,7 +3,7 @@ import torch
 import sys
 
 sys.path.append("src")
-from cable.pull_ratio import TimeVariablePullRatio
+from cable.pull_ratio import TimeVariablePullRatio, TimeInvariablePullRatio
 from simulation.simulation_properties import SimulationProperties
 
 
@@ -34,6 +34,82 @@ class TestTimeVariantPullRatio(unittest.TestCase):
         for i in range(len(expected)):
             self.assertTrue(torch.allclose(expected[i], actual[i]))
 
+    def tests_if_pull_ratio_is_a_tensor_with_one_value_per_step(self):
+        DEVICE = "cpu"
+        pull_ratio = [torch.tensor(0.0), torch.tensor(0.2), torch.tensor(0.0)]
+        sim_properties = SimulationProperties(
+            duration=1.0, dt=0.01, segment_duration=0.1, key_timepoints_interval=0.5, device=DEVICE
+        )
+        pull_ratio = TimeVariablePullRatio(pull_ratio=pull_ratio, simulation_properties=sim_properties, device=DEVICE)
+        self.assertEqual(pull_ratio.pull_ratio.shape, (sim_properties.num_steps,))
+
+    def tests_if_gradients_flow_back_to_the_key_timepoints(self):
+        DEVICE = "cpu"
+        pull_ratio = [torch.tensor(0.0, requires_grad=True), torch.tensor(0.2, requires_grad=True)]
+        sim_properties = SimulationProperties(
+            duration=0.5, dt=0.1, segment_duration=0.1, key_timepoints_interval=0.5, device=DEVICE
+        )
+        pull_ratio = TimeVariablePullRatio(pull_ratio=pull_ratio, simulation_properties=sim_properties, device=DEVICE)
+        pull_ratio.pull_ratio.sum().backward()
+        self.assertTrue(torch.allclose(pull_ratio.optimizable[0].grad, torch.tensor(3.0)))
+        self.assertTrue(torch.allclose(pull_ratio.optimizable[1].grad, torch.tensor(2.0)))
+
+    def tests_if_monotone_interpolation_stays_within_the_key_pull_ratios(self):
+        DEVICE = "cpu"
+        pull_ratio = [torch.tensor(0.0), torch.tensor(0.2), torch.tensor(0.0)]
+        sim_properties = SimulationProperties(
+            duration=1.0, dt=0.01, segment_duration=0.1, key_timepoints_interval=0.5, device=DEVICE
+        )
+        pull_ratio = TimeVariablePullRatio(
+            pull_ratio=pull_ratio, simulation_properties=sim_properties, device=DEVICE, interpolation="monotone"
+        )
+        self.assertTrue(torch.allclose(pull_ratio.pull_ratio[50], torch.tensor(0.2)))
+        self.assertTrue(torch.all(pull_ratio.pull_ratio <= 0.2 + 1e-6))
+
+    def tests_if_pull_ratio_has_one_schedule_per_environment(self):
+        DEVICE = "cpu"
+        pull_ratio = [torch.tensor([0.0, 0.1]), torch.tensor([0.2, 0.3]), torch.tensor([0.0, 0.1])]
+        sim_properties = SimulationProperties(
+            duration=1.0, dt=0.1, segment_duration=0.1, key_timepoints_interval=0.5, device=DEVICE
+        )
+        pull_ratio = TimeVariablePullRatio(pull_ratio=pull_ratio, simulation_properties=sim_properties, device=DEVICE)
+        self.assertEqual(pull_ratio.pull_ratio.shape, (2, 10))
+        self.assertTrue(torch.allclose(pull_ratio.pull_ratio[1] - pull_ratio.pull_ratio[0], torch.tensor(0.1)))
+
+
+class TestTimeInvariantPullRatio(unittest.TestCase):
+    def tests_if_pull_ratio_is_repeated_for_every_step(self):
+        DEVICE = "cpu"
+        sim_properties = SimulationProperties(duration=0.5, dt=0.1, segment_duration=0.1, device=DEVICE)
+        pull_ratio = TimeInvariablePullRatio(
+            pull_ratio=torch.tensor(0.3, requires_grad=True), simulation_properties=sim_properties, device=DEVICE
+        )
+        self.assertTrue(torch.allclose(pull_ratio.pull_ratio, torch.full((5,), 0.3)))
+        pull_ratio.pull_ratio.sum().backward()
+        self.assertTrue(torch.allclose(pull_ratio.optimizable[0].grad, torch.tensor(5.0)))
+
+    def tests_if_pull_ratio_is_repeated_for_every_step_of_every_environment(self):
+        DEVICE = "cpu"
+        sim_properties = SimulationProperties(duration=0.5, dt=0.1, segment_duration=0.1, device=DEVICE)
+        pull_ratio = TimeInvariablePullRatio(
+            pull_ratio=torch.tensor([0.3, 0.4]), simulation_properties=sim_properties, device=DEVICE
+        )
+        self.assertTrue(torch.allclose(pull_ratio.pull_ratio, torch.tensor([[0.3] * 5, [0.4] * 5])))
+
+    def tests_if_constant_pull_ratio_is_only_updated_after_it_changes(self):
+        DEVICE = "cpu"
+        sim_properties = SimulationProperties(duration=0.5, dt=0.1, segment_duration=0.1, device=DEVICE)
+        pull_ratio = TimeInvariablePullRatio(
+            pull_ratio=torch.tensor(0.3), simulation_properties=sim_properties, device=DEVICE
+        )
+        schedule = pull_ratio.pull_ratio
+        pull_ratio.update_pull_ratio_if_changed()
+        self.assertIs(pull_ratio.pull_ratio, schedule)
+        pull_ratio.optimizable[0].fill_(0.5)
+        pull_ratio.update_pull_ratio_if_changed()
+        self.assertIsNot(pull_ratio.pull_ratio, schedule)
+        self.assertTrue(torch.allclose(pull_ratio.pull_ratio, torch.full((5,), 0.5)))
+
 
 if __name__ == "__main__":
     unittest.main()
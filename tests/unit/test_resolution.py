@@ -0,0 +1,21 @@
+import unittest
+import sys
+
+sys.path.append("src")
+
+from rendering.resolution import CoarseToFineResolution
+
+
+class TestCoarseToFineResolution(unittest.TestCase):
+    def tests_if_image_size_refines_over_iterations(self):
+        resolution = CoarseToFineResolution(image_sizes=[250, 500, 1000], num_iterations=[2, 1, 3])
+        image_sizes = [resolution.get_image_size(iteration) for iteration in range(8)]
+        self.assertEqual(image_sizes, [250, 250, 500, 1000, 1000, 1000, 1000, 1000])
+
+    def tests_if_raises_error_when_lengths_differ(self):
+        with self.assertRaises(ValueError):
+            CoarseToFineResolution(image_sizes=[250, 500], num_iterations=[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import sys
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+sys.path.append("src")
+from mesh.scad import Scad
+from mesh.scad_cache import ScadCache
+
+
+class TestScadCache(unittest.TestCase):
+    def setUp(self):
+        self.path = Path(tempfile.mkdtemp())
+        shutil.copy("tests/data/caterpillar.scad", self.path)
+        shutil.copy("tests/data/caterpillar_scad_params.json", self.path)
+        self.scad = Scad(self.path / "caterpillar.scad", self.path / "caterpillar_scad_params.json")
+        self.cache = ScadCache(self.path / "cache")
+        self.num_created = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _create(self, file: Path):
+        self.num_created += 1
+        file.write_text(f"{self.num_created}")
+
+    def tests_if_file_is_created_once(self):
+        first = self.cache.get_file(self.scad, "mesh.stl", self._create, 0.02)
+        second = self.cache.get_file(self.scad, "mesh.stl", self._create, 0.02)
+        self.assertEqual(first, second)
+        self.assertEqual(self.num_created, 1)
+        self.assertEqual(first.suffix, ".stl")
+
+    def tests_if_file_is_created_again_given_other_settings(self):
+        first = self.cache.get_file(self.scad, "mesh.msh", self._create, 0.02)
+        second = self.cache.get_file(self.scad, "mesh.msh", self._create, 0.01)
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.num_created, 2)
+
+    def tests_if_file_is_created_again_after_parameters_change(self):
+        first = self.cache.get_file(self.scad, "mesh.stl", self._create)
+        with open(self.scad.parameters, "a") as f:
+            f.write("\n")
+        second = self.cache.get_file(self.scad, "mesh.stl", self._create)
+        self.assertNotEqual(first.parent, second.parent)
+        self.assertEqual(second.read_text(), "2")
+
+    def tests_if_error_is_raised_when_file_is_not_created(self):
+        with self.assertRaises(FileNotFoundError):
+            self.cache.get_file(self.scad, "mesh.stl", lambda file: None)
+
+    def tests_if_nothing_is_cached_when_creation_fails(self):
+        def create_partially(file: Path):
+            file.write_text("partial")
+            file.with_suffix(".log").write_text("side file")
+            raise subprocess.CalledProcessError(1, "openscad")
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.cache.get_file(self.scad, "mesh.stl", create_partially)
+        directory = self.path / "cache" / self.cache.get_key(self.scad)
+        self.assertEqual(list(directory.iterdir()), [])
+        self.assertEqual(self.cache.get_file(self.scad, "mesh.stl", self._create).read_text(), "1")
+
+    def tests_if_only_the_file_is_moved_into_the_cache(self):
+        def create_with_side_file(file: Path):
+            self._create(file)
+            file.with_suffix(".log").write_text("side file")
+
+        file = self.cache.get_file(self.scad, "mesh.msh", create_with_side_file)
+        self.assertEqual(list(file.parent.iterdir()), [file])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+sys.path.append("src")
+from mesh.scad_sweep import ScadSweepFactory
+
+
+class TestScadSweepFactory(unittest.TestCase):
+    def setUp(self):
+        self.path = Path(tempfile.mkdtemp())
+        sweep = {"h_cone": ["5", "10"], "Num_holes": ["[3, 3, 3, 3, 3, 3, 3, 3, 3]", "[2, 2, 2, 2, 2, 2, 2, 2, 2]"]}
+        self.scads = ScadSweepFactory(
+            scad_file="tests/data/caterpillar.scad",
+            parameters=["tests/data/caterpillar_scad_params.json"] * 2,
+            sweep=sweep,
+            path=self.path,
+        ).create()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _get_first_set(self, i: int) -> dict:
+        with open(self.scads[i].parameters, "r") as f:
+            return json.load(f)["parameterSets"]["firstSet"]
+
+    def tests_if_one_scad_is_created_per_combination(self):
+        self.assertEqual(len(self.scads), 8)
+        self.assertEqual(len({scad.parameters.parent for scad in self.scads}), 8)
+
+    def tests_if_swept_parameters_are_replaced_and_others_kept(self):
+        first_set = self._get_first_set(1)
+        self.assertEqual(first_set["h_cone"], "5")
+        self.assertEqual(first_set["Num_holes"], "[2, 2, 2, 2, 2, 2, 2, 2, 2]")
+        self.assertEqual(first_set["H_cylinder"], "[20, 20, 20, 20, 20, 20, 15, 15, 15]")
+
+    def tests_if_value_error_is_raised_given_an_unknown_swept_parameter(self):
+        with self.assertRaises(ValueError):
+            ScadSweepFactory(
+                scad_file="tests/data/caterpillar.scad",
+                parameters=["tests/data/caterpillar_scad_params.json"],
+                sweep={"h_cones": ["5", "10"]},
+                path=self.path,
+            ).create()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+import torch
+from attrs import evolve
+
+sys.path.append("src")
+
+from cable.cable_factory import CableListFactory
+from cable.holes import Holes
+from cable.pull_ratio import TimeInvariablePullRatio
+from mesh.mesh_factory import MeshFactoryFromMsh
+from mesh.mesh_properties import MeshProperties
+from scene.scene import Scene
+from simulation.simulation import Simulation
+from simulation.simulation_properties import SimulationProperties
+from simulation.update_scene import UpdateScene
+
+
+class TestSceneWithSeveralEnvironments(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mesh = MeshFactoryFromMsh(Path("tests/data/caterpillar.msh"), device="cpu").create()
+        cls.mesh.properties = MeshProperties(
+            name="caterpillar",
+            density=1080.0,
+            youngs_modulus=149_000,
+            poissons_ratio=0.45,
+            damping_factor=0.4,
+            frozen_bounding_box=[-np.inf, -np.inf, -np.inf, np.inf, np.inf, 5],
+        )
+        cls.mesh.cables = []
+        envs_robot_properties = [cls.mesh.properties, evolve(cls.mesh.properties, youngs_modulus=50_000)]
+        cls.scene = Scene(robot=cls.mesh, device="cpu", num_envs=2, envs_robot_properties=envs_robot_properties)
+
+    def tests_if_every_environment_has_its_own_material(self):
+        materials = self.scene.model.tet_materials.numpy().reshape(2, -1, 3)
+        self.assertFalse(np.allclose(materials[0], materials[1]))
+        self.assertTrue(np.allclose(materials[1, :, 0], materials[1, 0, 0]))
+
+    def tests_if_environments_start_from_copies_of_the_robot_by_default(self):
+        position = self.scene.envs_nodes_position
+        self.assertEqual(position.shape, (2, len(self.mesh.nodes), 3))
+        self.assertTrue(torch.equal(position[1], self.mesh.nodes.position))
+
+    def tests_if_environments_start_from_the_given_states(self):
+        position = self.mesh.nodes.position.repeat(2, 1, 1)
+        position[1] += 1.0
+        self.scene.set_envs_initial_state(position)
+        actual_position, actual_velocity = self.scene.get_envs_initial_state()
+        self.assertTrue(torch.equal(actual_position, position))
+        self.assertTrue(torch.equal(actual_velocity, torch.zeros_like(position)))
+        self.scene.set_envs_initial_state(self.mesh.nodes.position.repeat(2, 1, 1))
+
+    def tests_if_value_error_is_raised_given_initial_states_of_another_number_of_environments(self):
+        with self.assertRaises(ValueError):
+            self.scene.set_envs_initial_state(self.mesh.nodes.position.repeat(3, 1, 1))
+
+    def tests_if_robot_follows_the_first_environment(self):
+        position = self.mesh.nodes.position.repeat(2, 1, 1) + torch.tensor([[[0.0]], [[1.0]]])
+        self.scene.set_envs_nodes(position, torch.zeros_like(position))
+        self.assertTrue(torch.equal(self.scene.robot.nodes.position, position[0]))
+        self.assertTrue(torch.equal(self.scene.envs_nodes_position, position))
+        self.scene.reset()
+
+
+class TestSceneReset(unittest.TestCase):
+    def setUp(self):
+        mesh = MeshFactoryFromMsh(Path("tests/data/caterpillar.msh"), device="cpu").create()
+        mesh.properties = MeshProperties(
+            name="caterpillar",
+            density=1080.0,
+            youngs_modulus=149_000,
+            poissons_ratio=0.45,
+            damping_factor=0.4,
+            frozen_bounding_box=[-np.inf, -np.inf, -np.inf, np.inf, np.inf, 5],
+        )
+        centroids = mesh.nodes.position[mesh.elements.tetrahedra.long()].mean(dim=1)
+        holes = [Holes(centroids[i::500][:5].contiguous()) for i in range(2)]
+        sim_properties = SimulationProperties(duration=2e-4, segment_duration=1e-4, dt=5e-5, device="cpu")
+        self.pull_ratio = [
+            TimeInvariablePullRatio(sim_properties, pull_ratio=torch.tensor(0.5, requires_grad=True), device="cpu")
+            for _ in range(2)
+        ]
+        mesh.cables = CableListFactory(holes, self.pull_ratio, 100.0, 0.01).create()
+        self.scene = Scene(robot=mesh, device="cpu")
+        self.update_scene = UpdateScene(self.scene, Simulation(self.scene, sim_properties))
+        self.initial_position = mesh.nodes.position.clone()
+
+    def _run_iteration(self) -> torch.Tensor:
+        self.update_scene.update_scene()
+        self.scene.robot.nodes.position.sum().backward()
+        gradients = torch.stack([pull_ratio.optimizable[0].grad for pull_ratio in self.pull_ratio])
+        for pull_ratio in self.pull_ratio:
+            pull_ratio.optimizable[0].grad = None
+        self.scene.reset()
+        return gradients
+
+    def tests_if_reset_restores_the_snapshot_after_every_iteration(self):
+        expected = self._run_iteration()
+        for _ in range(2):
+            self.assertTrue(torch.equal(self.scene.robot.nodes.position, self.initial_position))
+            self.assertTrue(torch.equal(self._run_iteration(), expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
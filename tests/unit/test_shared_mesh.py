@@ -0,0 +1,32 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.append("src")
+
+from mesh.mesh_factory import MeshFactoryFromObj
+from mesh.mesh_properties import MeshProperties
+from warp_wrapper.model_factory import ModelFactory
+from warp_wrapper.shared_mesh import get_warp_points, get_warp_triangles
+
+
+class TestSharedMesh(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mesh = MeshFactoryFromObj(Path("tests/data/sphere.obj"), device="cpu").create()
+        cls.mesh.properties = MeshProperties(name="sphere", density=1080.0)
+
+    def tests_if_warp_arrays_share_memory_with_the_mesh(self):
+        self.assertEqual(get_warp_points(self.mesh, "cpu").ptr, self.mesh.nodes.position.data_ptr())
+        self.assertEqual(get_warp_triangles(self.mesh, "cpu").ptr, self.mesh.elements.triangles.data_ptr())
+
+    def tests_if_shape_mesh_of_model_shares_memory_with_the_mesh(self):
+        model = ModelFactory(shape_meshes=[self.mesh], device="cpu").create()
+        points = model.shape_geo_src[0].mesh.points
+        self.assertEqual(points.ptr, self.mesh.nodes.position.data_ptr())
+        self.assertTrue(np.array_equal(points.numpy(), self.mesh.nodes.position.numpy()))
+
+
+if __name__ == "__main__":
+    unittest.main()
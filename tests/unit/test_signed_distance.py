@@ -0,0 +1,41 @@
+import unittest
+import sys
+from pathlib import Path
+import torch
+
+sys.path.append("src")
+
+from mesh.mesh_factory import MeshFactoryFromObj
+from warp_wrapper.signed_distance import SignedDistanceGridFactory
+
+
+class TestSignedDistanceGrid(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mesh = MeshFactoryFromObj(Path("tests/data/sphere.obj"), device="cpu").create()
+        cls.center = cls.mesh.nodes.position.mean(dim=0)
+        cls.radius = (cls.mesh.nodes.position - cls.center).norm(dim=1).max()
+        cls.signed_distance = SignedDistanceGridFactory(cls.mesh, resolution=48, device="cpu").create()
+
+    def tests_if_distance_is_negative_inside_and_positive_outside(self):
+        points = torch.stack([self.center, self.center + torch.tensor([1.1, 0.0, 0.0]) * self.radius])
+        distance = self.signed_distance(points)
+        self.assertLess(distance[0], 0)
+        self.assertGreater(distance[1], 0)
+
+    def tests_if_distance_is_close_to_the_distance_to_the_sphere(self):
+        directions = torch.nn.functional.normalize(torch.randn(100, 3, generator=torch.Generator().manual_seed(0)))
+        scales = torch.linspace(0.2, 1.1, 100)[:, None]
+        points = self.center + directions * scales * self.radius
+        expected = (scales[:, 0] - 1) * self.radius
+        self.assertTrue(torch.allclose(self.signed_distance(points), expected, atol=0.05 * self.radius))
+
+    def tests_if_gradient_points_away_from_the_surface(self):
+        direction = torch.tensor([0.0, 0.0, 1.0])
+        points = (self.center + 0.9 * self.radius * direction)[None].requires_grad_()
+        self.signed_distance(points).sum().backward()
+        self.assertGreater(torch.dot(points.grad[0], direction), 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
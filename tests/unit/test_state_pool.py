@@ -0,0 +1,48 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.append("src")
+
+from warp_wrapper.model_factory import ModelFactory
+from warp_wrapper.state_pool import StatePool
+from mesh.mesh_factory import MeshFactoryFromMsh
+from mesh.mesh_properties import MeshProperties
+
+
+class TestStatePool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        msh_file = Path("tests/data/caterpillar.msh")
+        mesh = MeshFactoryFromMsh(msh_file, device="cpu").create()
+        mesh.properties = MeshProperties(
+            name="caterpillar",
+            density=1080.0,
+            youngs_modulus=149_000,
+            poissons_ratio=0.45,
+            damping_factor=0.4,
+            frozen_bounding_box=[-np.inf, -np.inf, 0, np.inf, np.inf, 2],
+        )
+        cls.model = ModelFactory(soft_mesh=mesh, device="cpu").create()
+
+    def tests_if_pool_allocates_buffers_upfront(self):
+        pool = StatePool(self.model, size=3)
+        self.assertEqual(len(pool), 3)
+
+    def tests_if_released_buffers_are_reused(self):
+        pool = StatePool(self.model)
+        buffers = pool.acquire()
+        pool.release(buffers)
+        self.assertIs(pool.acquire(), buffers)
+        self.assertEqual(len(pool), 0)
+
+    def tests_if_torch_views_alias_the_warp_arrays(self):
+        buffers = StatePool(self.model).acquire()
+        buffers.position_now.fill_(1.0)
+        self.assertTrue(np.all(buffers.state_now.particle_q.numpy() == 1.0))
+        self.assertEqual(buffers.grad_force.shape, (self.model.particle_count, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import torch
+from pathlib import Path
+import sys
+
+sys.path.append("src")
+
+from mesh.mesh_factory import MeshFactoryFromMsh
+from mesh.tetrahedron_grid import TetrahedronGridFactory
+
+
+class TestTetrahedronGridFactory(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        file = Path("tests/data/caterpillar.msh")
+        cls.mesh = MeshFactoryFromMsh(file, device="cpu").create()
+        cls.grid = TetrahedronGridFactory(cls.mesh).create()
+
+    def tests_if_cell_start_covers_all_cell_tetrahedra(self):
+        self.assertEqual(len(self.grid.cell_start), self.grid.num_cells + 1)
+        self.assertEqual(self.grid.cell_start[-1].item(), len(self.grid.cell_tetrahedra))
+        self.assertTrue(torch.all(self.grid.cell_start[1:] >= self.grid.cell_start[:-1]))
+
+    def tests_if_each_tetrahedron_is_listed_in_the_cell_of_its_centroid(self):
+        tetrahedra = self.mesh.elements.tetrahedra.long()
+        centroids = self.mesh.nodes.position[tetrahedra].mean(dim=1)
+        cells = ((centroids - torch.tensor(self.grid.origin)) / self.grid.cell_size).floor().long()
+        x, y, z = cells.unbind(dim=1)
+        resolution = self.grid.resolution
+        cells = (x * resolution[1] + y) * resolution[2] + z
+        for tetrahedron, cell in list(enumerate(cells.tolist()))[::100]:
+            candidates = self.grid.cell_tetrahedra[self.grid.cell_start[cell] : self.grid.cell_start[cell + 1]]
+            self.assertIn(tetrahedron, candidates.tolist())
+
+    def tests_if_tetrahedra_within_a_cell_are_sorted_ascending(self):
+        for cell in range(0, self.grid.num_cells, 7):
+            candidates = self.grid.cell_tetrahedra[self.grid.cell_start[cell] : self.grid.cell_start[cell + 1]]
+            self.assertTrue(torch.all(candidates[1:] > candidates[:-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
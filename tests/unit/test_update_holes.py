@@ -37,16 +37,31 @@ class TestHolesForce(unittest.TestCase):
             ),
         ]
         cls.cables = CableListFactory(stiffness=100, damping=0.01, pull_ratio=pull_ratio, holes=holes).create()
+        cls.pull_ratio = torch.stack([cable.pull_ratio.pull_ratio[0] for cable in cls.cables])
 
     def test_if_holes_force_is_changed(self):
         old_holes_force = [cable.holes.force for cable in self.cables]
-        holes_positions = [cable.holes.position for cable in self.cables]
-        holes_velocities = [cable.holes.velocity for cable in self.cables]
+        holes_position = torch.cat([cable.holes.position for cable in self.cables])
+        holes_velocity = torch.cat([cable.holes.velocity for cable in self.cables])
         fn = HolesForce(cables=self.cables, device="cuda")
-        new_holes_force = fn(holes_positions, holes_velocities)
+        new_holes_force = fn(holes_position, holes_velocity, self.pull_ratio)
+        new_holes_force = new_holes_force.split([len(cable.holes) for cable in self.cables])
         for old_force, new_force in zip(old_holes_force, new_holes_force):
             self.assertFalse(torch.equal(old_force, new_force))
 
+    def test_if_holes_force_of_each_cable_pulls_its_end_holes_towards_each_other(self):
+        holes_position = torch.cat([cable.holes.position for cable in self.cables])
+        holes_velocity = torch.cat([cable.holes.velocity for cable in self.cables])
+        fn = HolesForce(cables=self.cables, device="cuda")
+        holes_force = fn(holes_position, holes_velocity, self.pull_ratio)
+        holes_force = holes_force.split([len(cable.holes) for cable in self.cables])
+        for cable, force in zip(self.cables, holes_force):
+            tangent = cable.holes.position[1:] - cable.holes.position[:-1]
+            f = -0.5 * cable.stiffness * tangent
+            self.assertTrue(torch.allclose(force[0], -f[0]))
+            self.assertTrue(torch.allclose(force[1:-1], f[:-1] - f[1:]))
+            self.assertTrue(torch.allclose(force[-1], f[-1]))
+
 
 class TestHolesPositionAndVelocity(unittest.TestCase):
     @classmethod
@@ -60,15 +75,13 @@ class TestHolesPositionAndVelocity(unittest.TestCase):
         cls.holes = HolesListFactory(holes_positions).create()
 
     def tests_if_the_first_update_of_holes_position_and_velocity_does_nothing(self):
-        old_holes_positions = [holes.position for holes in self.holes]
-        old_holes_velocities = [holes.velocity for holes in self.holes]
+        old_holes_position = torch.cat([holes.position for holes in self.holes])
+        old_holes_velocity = torch.cat([holes.velocity for holes in self.holes])
         barycentrics = BarycentricListFactory(mesh=self.mesh, holes=self.holes).create()
         fn = HolesPositionAndVelocity(barycentrics=barycentrics)
-        new_holes_positions, new_holes_velocities = fn(self.mesh.nodes.position, self.mesh.nodes.velocity)
-        for old_positions, new_positions in zip(old_holes_positions, new_holes_positions):
-            self.assertTrue(torch.allclose(old_positions, new_positions, atol=1e-5))
-        for old_velocities, new_velocities in zip(old_holes_velocities, new_holes_velocities):
-            self.assertTrue(torch.allclose(old_velocities, new_velocities, atol=1e-5))
+        new_holes_position, new_holes_velocity = fn(self.mesh.nodes.position, self.mesh.nodes.velocity)
+        self.assertTrue(torch.allclose(old_holes_position, new_holes_position, atol=1e-5))
+        self.assertTrue(torch.allclose(old_holes_velocity, new_holes_velocity, atol=1e-5))
 
 
 if __name__ == "__main__":
@@ -30,8 +30,8 @@ class TestNodesPositionAndVelocity(unittest.TestCase):
 
         holes_position = CaterpillarHolesInitialPosition(scad).get()
         holes = HolesListFactory(holes_position, device="cuda").create()
-        holes_positions = [holes.position for holes in holes]
-        holes_velocities = [holes.velocity for holes in holes]
+        holes_position = torch.cat([holes.position for holes in holes])
+        holes_velocity = torch.cat([holes.velocity for holes in holes])
         sim_properties = SimulationProperties(dt=0.1, duration=1.0, segment_duration=0.1)
         pull_ratio = [
             TimeInvariablePullRatio(
@@ -47,7 +47,8 @@ class TestNodesPositionAndVelocity(unittest.TestCase):
         cables = CableListFactory(stiffness=100, damping=0.01, pull_ratio=pull_ratio, holes=holes).create()
 
         fn = HolesForce(cables=cables, device="cuda")
-        holes_forces = fn(holes_positions, holes_velocities)
+        pull_ratio = torch.stack([cable.pull_ratio.pull_ratio[0] for cable in cables])
+        holes_force = fn(holes_position, holes_velocity, pull_ratio)
         cls.mesh = MeshFactoryFromMsh(msh_file).create()
         cls.mesh.properties = MeshProperties(
             name="caterpillar",
@@ -60,7 +61,7 @@ class TestNodesPositionAndVelocity(unittest.TestCase):
         cls.mesh.cables = cables
         barycentrics = BarycentricListFactory(mesh=cls.mesh, holes=holes, device="cuda").create()
         fn = NodesForce(barycentrics=barycentrics)
-        cls.mesh.nodes.force = fn(holes_forces)
+        cls.mesh.nodes.force = fn(holes_force)
         contact_properties = ContactProperties(distance=0.01, ke=2.0, kd=0.1, kf=0.1, ground=False)
         cls.model = ModelFactory(soft_mesh=cls.mesh, contact_properties=contact_properties, device="cuda").create()
 
@@ -82,8 +83,8 @@ class TestNodesForce(unittest.TestCase):
         scad = Scad(file, parameters)
         holes_position = CaterpillarHolesInitialPosition(scad).get()
         cls.holes = HolesListFactory(holes_position, device="cuda").create()
-        holes_positions = [holes.position for holes in cls.holes]
-        holes_velocities = [holes.velocity for holes in cls.holes]
+        holes_position = torch.cat([holes.position for holes in cls.holes])
+        holes_velocity = torch.cat([holes.velocity for holes in cls.holes])
         sim_properties = SimulationProperties(dt=0.1, duration=1.0, segment_duration=0.1)
         pull_ratio = [
             TimeInvariablePullRatio(
@@ -98,14 +99,15 @@ class TestNodesForce(unittest.TestCase):
         ]
         cables = CableListFactory(stiffness=100, damping=0.01, pull_ratio=pull_ratio, holes=cls.holes).create()
         fn = HolesForce(cables=cables, device="cuda")
-        cls.holes_forces = fn(holes_positions, holes_velocities)
+        pull_ratio = torch.stack([cable.pull_ratio.pull_ratio[0] for cable in cables])
+        cls.holes_force = fn(holes_position, holes_velocity, pull_ratio)
         cls.mesh = MeshFactoryFromMsh(msh_file).create()
         cls.barycentrics = BarycentricListFactory(mesh=cls.mesh, holes=cls.holes, device="cuda").create()
 
     def tests_if_nodes_force_is_changed(self):
         old_nodes_force = self.mesh.nodes.force
         fn = NodesForce(barycentrics=self.barycentrics)
-        new_nodes_force = fn(self.holes_forces)
+        new_nodes_force = fn(self.holes_force)
         self.assertFalse(torch.equal(old_nodes_force, new_nodes_force))
 
 
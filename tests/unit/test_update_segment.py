@@ -0,0 +1,132 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+import torch
+
+sys.path.append("src")
+
+from cable.barycentric_factory import BarycentricListFactory
+from cable.cable_factory import CableListFactory
+from cable.holes import Holes
+from cable.pull_ratio import TimeInvariablePullRatio
+from mesh.mesh_factory import MeshFactoryFromMsh
+from mesh.mesh_properties import MeshProperties
+from simulation.simulation_properties import SimulationProperties
+from simulation.update_holes import HolesForce, HolesPositionAndVelocity
+from simulation.update_nodes import NodesForce, NodesPositionAndVelocity
+from simulation.update_segment import SegmentPositionAndVelocity
+from warp_wrapper.model_factory import ModelFactory
+
+
+class TestSegmentPositionAndVelocity(unittest.TestCase):
+    DEVICE = "cpu"
+
+    @classmethod
+    def setUpClass(cls):
+        msh_file = Path("tests/data/caterpillar.msh")
+        mesh = MeshFactoryFromMsh(msh_file, device=cls.DEVICE).create()
+        mesh.properties = MeshProperties(
+            name="caterpillar",
+            density=1080.0,
+            youngs_modulus=149_000,
+            poissons_ratio=0.45,
+            damping_factor=0.4,
+            frozen_bounding_box=[-np.inf, -np.inf, -np.inf, np.inf, np.inf, 5],
+        )
+        centroids = mesh.nodes.position[mesh.elements.tetrahedra.long()].mean(dim=1)
+        holes = [Holes(centroids[i::500][:5].contiguous()) for i in range(2)]
+        sim_properties = SimulationProperties(duration=5e-4, segment_duration=5e-4, dt=5e-5, device=cls.DEVICE)
+        pull_ratio = [
+            TimeInvariablePullRatio(sim_properties, pull_ratio=torch.tensor(0.5, device=cls.DEVICE), device=cls.DEVICE)
+            for _ in range(2)
+        ]
+        cls.cables = CableListFactory(holes, pull_ratio, 100.0, 0.01).create()
+        cls.barycentrics = BarycentricListFactory(mesh, holes, device=cls.DEVICE).create()
+        cls.model = ModelFactory(soft_mesh=mesh, device=cls.DEVICE).create()
+        cls.nodes = mesh.nodes
+        cls.dt, cls.num_steps = sim_properties.dt, sim_properties.num_steps_per_segment
+
+    def _step_through_segment(self, position, velocity, pull_ratio):
+        holes_position_and_velocity = HolesPositionAndVelocity(self.barycentrics)
+        holes_force = HolesForce(self.cables, device="cpu")
+        nodes_force = NodesForce(self.barycentrics)
+        nodes_position_and_velocity = NodesPositionAndVelocity(self.model, self.dt)
+        for step_pull_ratio in pull_ratio.unbind(dim=-1):
+            holes_position, holes_velocity = holes_position_and_velocity(position, velocity)
+            force = nodes_force(holes_force(holes_position, holes_velocity, step_pull_ratio))
+            position, velocity = nodes_position_and_velocity(force, position, velocity)
+        return position, velocity
+
+    def tests_if_segment_matches_stepping_through_it_with_torch(self):
+        segment = SegmentPositionAndVelocity(self.model, self.cables, self.barycentrics, self.dt, self.num_steps)
+        expected_pull_ratio = torch.rand(2, self.num_steps, requires_grad=True)
+        actual_pull_ratio = expected_pull_ratio.detach().clone().requires_grad_()
+        expected = self._step_through_segment(self.nodes.position, self.nodes.velocity, expected_pull_ratio)
+        actual = segment(self.nodes.position, self.nodes.velocity, actual_pull_ratio)
+        for e, a in zip(expected, actual):
+            self.assertTrue(torch.allclose(e, a, atol=1e-6))
+        sum(e.sum() for e in expected).backward()
+        sum(a.sum() for a in actual).backward()
+        self.assertTrue(torch.allclose(expected_pull_ratio.grad, actual_pull_ratio.grad, rtol=1e-4, atol=1e-9))
+
+    def tests_if_graph_mode_runs_eagerly_on_cpu(self):
+        if self.DEVICE != "cpu":
+            self.skipTest("runs eagerly on CPU only")
+        pull_ratio = torch.rand(2, self.num_steps)
+        eager = SegmentPositionAndVelocity(self.model, self.cables, self.barycentrics, self.dt, self.num_steps)
+        graph = SegmentPositionAndVelocity(
+            self.model, self.cables, self.barycentrics, self.dt, self.num_steps, use_graph=True
+        )
+        for _ in range(2):
+            expected = eager(self.nodes.position, self.nodes.velocity, pull_ratio)
+            actual = graph(self.nodes.position, self.nodes.velocity, pull_ratio)
+            for e, a in zip(expected, actual):
+                self.assertTrue(torch.equal(e, a))
+
+
+@unittest.skipUnless(torch.cuda.is_available(), "requires CUDA")
+class TestSegmentPositionAndVelocityWithGraph(TestSegmentPositionAndVelocity):
+    DEVICE = "cuda"
+
+    @staticmethod
+    def _get_pointers(buffers) -> list:
+        arrays = [buffers.holes_position, buffers.holes_velocity, buffers.holes_force, buffers.holes_spread]
+        arrays.append(buffers.pull_ratio)
+        for state in buffers.states:
+            arrays += [state.particle_q, state.particle_qd, state.particle_f]
+        return [array.ptr for array in arrays] + [array.grad.ptr for array in arrays if array.grad is not None]
+
+    def tests_if_replayed_graphs_match_eager_launches_over_several_segments(self):
+        eager = SegmentPositionAndVelocity(self.model, self.cables, self.barycentrics, self.dt, self.num_steps)
+        graph = SegmentPositionAndVelocity(
+            self.model, self.cables, self.barycentrics, self.dt, self.num_steps, use_graph=True
+        )
+        expected_position, expected_velocity = self.nodes.position, self.nodes.velocity
+        actual_position, actual_velocity = self.nodes.position, self.nodes.velocity
+        pointers = None
+        for _ in range(3):
+            expected_pull_ratio = torch.rand(2, self.num_steps, device=self.DEVICE, requires_grad=True)
+            actual_pull_ratio = expected_pull_ratio.detach().clone().requires_grad_()
+            expected = eager(expected_position.detach(), expected_velocity.detach(), expected_pull_ratio)
+            actual = graph(actual_position.detach(), actual_velocity.detach(), actual_pull_ratio)
+            for e, a in zip(expected, actual):
+                self.assertTrue(torch.allclose(e, a, rtol=1e-5, atol=1e-7))
+            sum(e.sum() for e in expected).backward()
+            sum(a.sum() for a in actual).backward()
+            self.assertTrue(torch.allclose(expected_pull_ratio.grad, actual_pull_ratio.grad, rtol=1e-4, atol=1e-9))
+            # the graphs replay launches on the addresses they were captured with
+            buffers = graph._pool._free
+            self.assertEqual(len(buffers), 1)
+            if pointers is None:
+                pointers = (buffers[0], self._get_pointers(buffers[0]))
+            self.assertIs(buffers[0], pointers[0])
+            self.assertIsNotNone(buffers[0]._forward_graph)
+            self.assertIsNotNone(buffers[0]._backward_graph)
+            self.assertEqual(self._get_pointers(buffers[0]), pointers[1])
+            expected_position, expected_velocity = expected
+            actual_position, actual_velocity = actual
+
+
+if __name__ == "__main__":
+    unittest.main()